@@ -2,11 +2,21 @@
 Agent-related modules for the fact extraction system.
 """
 
-from src.agents.prompts import FACT_EXTRACTOR_PROMPT, FACT_VERIFICATION_PROMPT
-from src.agents.verification import FactVerificationAgent
-
 __all__ = [
     'FACT_EXTRACTOR_PROMPT',
     'FACT_VERIFICATION_PROMPT',
+    'FACT_VERIFICATION_BATCH_PROMPT',
     'FactVerificationAgent'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve exports lazily so importing the package (e.g. for src.agents.prompts)
+    does not load the verification agent or build the prompt templates."""
+    if name in ('FACT_EXTRACTOR_PROMPT', 'FACT_VERIFICATION_PROMPT', 'FACT_VERIFICATION_BATCH_PROMPT'):
+        from src.agents import prompts
+        return getattr(prompts, name)
+    if name == 'FactVerificationAgent':
+        from src.agents.verification import FactVerificationAgent
+        return FactVerificationAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,186 @@
+"""
+Gzip-compressed system prompts used by src/agents/prompts.py.
+
+GENERATED FILE - do not edit by hand. Edit src/agents/prompt_sources/
+and re-run: python src/scripts/compile_prompts.py
+"""
+
+_EXTRACTOR_GZ: bytes = (
+    b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\x03\xcd[\xdbr\xdbH\x92}\xd7WT(\xa6\xd7v\x04ES\x94\xe4[wt\x84Z\x92m\xed\xe8\xb6\x92\xfa\xe2}\x99(\x02E\x12#\x00\xc5\xae\x02$\xb3\xbfjc>a\xbelN'
+    b'f\x16\x80\x02I\xbb\xa5\xde\xde\x89}\x98\x8b)\xa0*+\xf3\xe4\xc9K%>\xd9Zig\xd4\xb1\x1b\xaas\xed\x92\xda\xab\xa3\xb9)\x07\xeaj><\x1e\x0e\x94Vi\xe6\xab\xac\x9c\xd5\x99\x9f\x9bT\x99\xcf\x0b\xe3*\x95'
+    b'\x95\xaa2\xc9\xbc\xcc\x12\x9d\xabTW\x1a\x7f\xa8\x9cN\xaa\xcc\x96J\x97\xa9\xf2If\xca*\x9bf\x89*\x8c\xf6\xb53\x05\xfe\xad\x1e\xb2j\xae\xec\xbdqj|\xa0\x96F;\xaf\xecT\x16\xc5\xf3\x89\xa1\x85\x7f\xad5\xde'
+    b'\xact\x95\xdd\x1b\xac\xa5\xf3\xa5\xcf\xfcP}\xb2\xb5S\x893)\xad\xabs\x8fG\x93\xbcN\xcd\xbb\xad\x1d\x11\x96\xde=\x8f\xf6\xbaId\xc9\xa9\xb3\x85:\xd29\t\x8cg\xdf[W`\xff\xe3\xcc\x99\xa4\xb2\x8e\xf6\xbf8'
+    b'\xbd\xb9}\xe6\xd5\x7f\xd1\xc6u\xd1[\xe48\xbb\xcf<\x0e\x85\x17\xcf\x8cN\x95\xae\xab\xb9\xbc\xb4};7\xbdG\xcfu\x99M\x8d\xaf\xec;u\xa8>\xd4YjTeE\nQ\xc4u6\xb3n\x9b\xc4\xc5\x82\x062@'
+    b'\xe0\xd4\xdc\x9b\xdc.\xa0`\xe5+(N\xbb\xd4\xab)v\xf8\xa2z\xb7\xb6X\x13\xce,j\xd2\x11\xf4\x9dy5\xa9\xb3\xbcR\xf8\xffK\xfa[]&\xb6X\xe0\xd8\x10\x1d\x0b\xe3\x1fEV\xb1\x8c\x10h\x81s\xf3\x91\xd8'
+    b'N\xfc\xbc\x9edyV-\xe9\xaf\x19\xabw\xba\xc4Z9~\xc0\x11\x0b\xeb+,QB\xf5\x95\x19\x04k\xeaI\x0e\xc5B /\xea\x8d\xa4\xb5IM[\x89\xc5\x18[w\xa5}(\x192X.\x02\x06\xc9U\x97\xb4\xb1'
+    b'\xf6\xa2\xcec:\xeaU\xed\x00\xb9m\xd6\x02\x8b\xe7+\x97%\x95\xd2\xe9\xdc8\xb6(\xe4\xec\xc4\x18(\xc0\t\xebu"\r\x83\x8a*\xed\xefH9x<\xa8O]^\x9c}RI\x0e\xe0\xad\xbf\x06\xf14\x9f\xb4\xd2\x90'
+    b'\xd5/\xa0&H\xd9;1\x9bba\xb3\xb2=7\x84\x9e\x01\xa7\xe4\x0e\x9f\xabp\xe4\x05T\xaf\x939\xfeH\x9b\x93\x10\x0c{>\xbd.\x8cr\x84\x03:\x9az\xb0u\x9e\xd2\x0b\xf92\x92\x92l&.A\x8a\x84N#'
+    b'\x0f\x12ph5\xcff\xf3\x1d \xe6\xce\xf8X\xa5\x8bz\x92\xc3\x0c\x04\x0bh\xe1\xe4\x97\xdb\xeb\xc3\xa3\xdb\xd3\xcb\x0bu\xf5\xf1\xf4\xec\xf2\xe6\xf2\xea\xe3\xa7w[\xdb\x87|`U\xd4\xb0\xec\x84|,\x01\xa6\xe1\xdc\xd1\xb1'
+    b'\xfb{b\xcb\xc2\x90\x15`\xd5\xd3)\xb6\xc7\xce\x95\xa0>\xd7\xc9\x9do\xf1\xa1\xca\xba\x98\x18\xe7\x07\x01f\xa6\xb7\xce\x80\x16r\xe6\xd7\x1a\xbe\xe7\xb1\xed\x12;N\x83MwTV\x91\xb1J\x0bK\xb3|C\xf534n'
+    b'p~\xc6"\x84\x8b,Q98\xe2p{k\xeb\xe6\xf6\xfa\xf4\xe8VEG=\xba>\xbd=\xb9>=|\xb7\xb5;\x14\x837\xd6o\xa5\xf6\xaa\xd0p\xcf\xe3\xd3\xeb\x93\xa3[<\x10\xb0I6\xec\xa3\xe0\xf0\xec\x8c|'
+    b'\x9d\xfe8\xb5yn\x1f`\x9bw[JA\xdcC\x9c\x1d\xf2\x10\xa6Nz\xe7\x87\xddZ\xb7e\xac\xa8\xe7f8\x1b\x0eVT\x91\xd8\x9a\xff\x17vN\xc8\xcc3\xe3_\x0c\x04)\xe4\x14bh\xda\xbf[\xf2^\xe7\xb5\xf1'
+    b'\xb2\xfd\x05\x90\x04:&\xa6\xcc\xa0\xcc\x06a\x99S\xef\x7f<;#\xfd[\xac\xacJ<\xe6\xd5\xf3\xd6\xacD\x0c\xe0)\xc3\x16\xb2i\x9d\x90\x08\xb9\x15\xc8\xf8\x17\xb2\xf6\x11\x1e\xca\xe94\x9d[\x93BH;\xc4\x19\x95\x11'
+    b'FH3~I4V\x00\x8a\xea\xe4\xa7\x93\xebO=\xc2\xcf\xca\xd4,LI\xac\x02\x1bv.\xb7\xb55\x1e\xaa\x93`\x17C\xde\xc2\x9048\x06\xa4\xc6s\x13HT\xa8\xcbk\xe2\x06\xad\x12\xf0\xc8\xb4\xce\xd5B;\xbd'
+    b'\x98;\r`\xd1\xae\xc1\x14\x7f5f\xe1\x1b]\t\xfc\xfa\xbaf\x85\x0e(\xb2\xe4\xd8\x1f\x0fl<\xc7\xc9/\x87\x8c\x06\xec\xf8\xe0\xb2\xaa2\xa5,\x7f\x05\xb4\x1awo\xc2\x16=\xc5G\xca\x1b\x84E\xa12\x9b\xdb\xd9\x06'
+    b'\xab\x885\x82\xfd\x0cE\xc1\x99)\x8d\x83P\xbf\x19v2_\x17\x85v\xfc\xaf\xcdV?\xb6F\\\x04\xb0b\xf3\x19uxA\xf8\x05X\n\x89\x06\xf2W\x86\xac\x05\xd3d\x08\xa0\x02l\n[\x88\x03\xfcB\x82\xf3\xf1\xe2'
+    b"\xa2\x92%QN\xb4\xc8\xcaf5\xd4\xad'\x13g\xee39j\x83h\xfa\xc3v\x91\xe59~\xdc\xe6G\xb7\xcf\xb7\x07\xe1'oH\xb7>\xfc^\xf8\xed\x17+\xcb\xea\x14yB=\xf9;\xe20\x85\xfa\xca\xb8\xa2]y"
+    b'\xdbg\xb3\x92\x10\xab\t8\xb4\xa6\x99N\xe5A\xf9\xe7\xcc\xda\x14+n\xed\r\xd5\x05\xc1\xaeu\xf2\xe789\xc4z\x80\x08Dn\xce\xd0\xfa&}\x11\xb0\xf2A4\x1eq\xc1\x00d\x02\x84\n;\x99{\x9b\xd7t\xc6\x97'
+    b'\xc9\\\x97\xb3`C[W132\x13\x06W\xd1\x0b\x89\x9e\x99XpjtU\xbb\xe858!\xab\x958\x8e(A^\xbb\x16\x12l\xd9\x15\xe9@\xda\xbd#\x19P\x88M\xddK\x97H\x13\x04h \xd74K\xaa\xe6'
+    b"\x1f\x96U\xc8\xff \x11j\x92\x00\xd4\xe3}\xd6\x8a\xd6,\xdd\x12U\xec \xb2\xfcM\xc7\x8e5\xe7\r\xf7zV\x07\xb3\xc8\x13\xa7\x11\xcc@$\x93\xac\x84'p\x1cL\xb3)\x13yE\x1eZ\xf9\x863\tw\xed\xab\xc6"
+    b'Q\x8cq&\x17\x0c\xcd\xb3\x05\x1f\x9d$\xcak\xdf\x8a\x8f\xb0\x80\xc0\x89\xed%Pp\x02\xa3\xf3\xa4\xce#dF\xa2vO\xa5\xb6 \xca\xa6l#7\xe9\xcc\xc4\x9e\xd0\tr\x05\xf9\x90>\x86\x90\xff\xdcP\xec\xce\xa6\x9c'
+    b'\xe5\x80\xa0\x92\xc0|/X\x91\xfc\x08\xfbpV&_\xe4\xc4\xad\xad}\x8e\x8a\xe4W!\xb8\xa5\xbc\x10\x92\xbc\x92c\x1a\xf20R\xe8@\x1d_\xaa\x8b\xcb[\x05C y\x13\xde\x94H\x87\xd7K+\x14\xd8\x90\x14iC'
+    b'\x9e3\x9f\xf1{\xbe|\xa7\xbe\xe3\x07v\xbf\xbf\xc0\xca\xdf\xbd\x0c\xff\xe8\x87\xf9\xeb\xcb\xa3\x93\x9b\x1b\x0e}\xd7\x94\xaf\xb6a-0h\xbe\x1c\xb49\x1e)\x8d\x18ms\x82C\x04\xfd\x13\xf1\xf5R\x04e\x92^\xd8J\xd2'
+    b'o\x91u\xae\x85\x13\xd7\x8f\xed\xc91QI$w\xf2\xb6<\x15\x9b\x9e2\xc3\x93_\xae\xceN\x8fN\x89t\xd9\x1fS\xa6\xd0\x8b\xcb\x1e\xa1e\xfe\xeb`#\xf5\xbf\xe7\xa7EF\xf0e\x96\x8a|l\xbb\x10\t\x7f9?'
+    b"C26\xf3M\xfelq\\I\x0e'\x86\xd5\xf4\xfe\xf4\xfa\xe6\x16\xff}\x86\xec\x81p\xc3+H\xc4\n\x19U\x1b\xb08\xabxLr\xccgg*Zh\xef%\xf3\xb3\xa8\xb1\xfa\xcb\xfe<7\x9c\x1f\xa7\xb6\x9eT\x83"
+    b'@Y\x92/6@G6\xf7\x11gf\xad\x01\x0f\x84E\xf6\xb2\x0f\x97\x97\xc71P\x917\xe6\xa8\x99X\xcd\xef\xb6\xbe\x8b\x1f%\xc6\xfc\xd2\xa3\xdf\x13`\x18^\xdf\xdf\xde\x9c\x1f\xa1\x18\xda\xdd)ui\xc1uP\x1d4'
+    b"\x98\x18O\xa4\x8d\xa4\t*\xce\x0c\x05C\r\xde\xd4%j3\xaa\xa2\x00)O\x99<\xf6\xd9\x1f\x8dT\x88\t\xd1\x13\x9e\x98Py\xa0\x1b'\xe0?\xcb\xda,\xcah8V\x0f\xba\xaa\xe4\xa1\x8d/\xdb\x07\xfc\x051 \xe3"
+    b'\xaan)\xf0\xff\xbe\xcb\x85\xbc\x84\xe4\xa5zN\x07x\xf1-\x92\x18N\xe1|\x94\x892o\xab\xe7\xbbe1 )\xcf\xe3\x1d^\x16\xc5?\xff1 I~~\xd9\xfb\x03/\xf5%\xdf\xff6\xd4\x91\x9d\xa18\xb1\t\x9a'
+    b'\x84\x01O\xf1\x98\x13%\xe3\xad\x9b\x85F\x18\xb8\tu\x1byOC+\xa9\xda\x1d\x8d\x06#\xa8\xce\xbaI&AI#\xd6\x91\x8f\x8e\x87\xaf\xd4$\xe8\x04\xba1~\xed\xf0i{\xf8\xd3\x9b\x1b\x08|\xb5v\xe4\x95\xc5\xd7'
+    b'\x96\x8cO\xb9z\xb6`q9\xdd^s\xba\x0f\xd6\xcer\x03\xa4\x1c!\x91M\xb2\\\xfd\x90\xd7\xd3\xa9\x17\n\xa1\x8c\x16\xf6"\xc7\x83^\x80\x15J\xea\xaf\xd8\x86?z\xa4\xba\xea\xa4\x89\xe6%\x01\x0b\xa8\xd9\x1d\x8e^\t'
+    b'\x18\x80+[\xb1\x8a\x0b\xb0\x1f\xc4A\x88M\x02\xb6v\x0f\x80\x90J\xbf?\xbb\xbc\xba\xf9\xb2\x16\x88D\x9a\xb4L=\x17A\x07+r\xe2\xc0\xe7u^e8\xf2:B\xae~<a\x81\x06\xbd\r\x1f\x87\x84^`%n'
+    b"\x12u]\x1c\xde\x1cBYWH>)\xf3\xe3|\xc0q'D`\x90\xe7\x9c\xa6\xa8\xf1\x1e~\x06k&\xa8\xc8\xa8\\d\xef\x15\xbd\xa0b\xa77\xa1\xbdB\x07\xa5\x8d\x87\xfbj\xe6t\x11\xbc\x8b\x1f\xef\xe9\xa5=c?"
+    b'mU\xcfI\x9eAO\x9cM\xb8\x814A\x86A\xb4Y\x1f,,\xb9\xa4\x04_\xd3\xc4A\xeb\x16\xc6\xe7\x1a\xaa8\x07\x9b\xe4\xeaSS\x87\xd0\n\x80;\xb7\x80n\xc1[>\x84?\xaf\x0e\x18\xba\xf7f\x9e%\xa4\x0c:'
+    b'\xe9\x831w\rZRCPR\x044\xd2\xc9h\xf8\xe6\x9b\xc7B\x83E\x19\xc8v_\x05D_\x84\x97\xb4\xfd\x80w\x8aw\x8f\xd5\x12\x1djU-\xab\x19\xe1w/\x1f\xcf\xd2\x9b\x83@T\xd7r\xc0\xf1s\xee+P'
+    b'\xaa11MbL\xc1\xd5\xcb\xca+\x81\xe1\xa9\xafs\xb0\xd8\xfeo\xe3\xac\xbau\xd4C8t`\x08x\x04\xe7\x9d\x04g\xac\xe6f\xf2\x86F8\xf3\xc8\t<\xb7m8\xa9\xe6dm\t@\x92ja\xeddI5\x9b'
+    b'Ij\x14%\xcbm1\xda\xcfs\xe4;\x17q\x9f\xa71\xc6\xb7\xf4s\x9b\x8cgt\nn\x93\xb0\xaeS\xf8j\x96\xe3\x99&\xcd\xe7\xd4~\x85\x9d\xb7\x0fO\x19\x07H\x08L9g;Ts\x87\xc4\x9d^o\xb0\x1c\xe5'
+    b'\xf5+"\xad\x16\x02,\x90\xb8W_\x9aN\x8av\xb5e,\n\xa8t\xfb(\xb75\xf4\x94\xdaE\x8b\x95\xacD\xb9G\xca\x9a9\xfb\x00\xf2uH\xe4\xa9\x8e\xae\xa9\x0f\xf6ei\xe8i\xe0\x85\x80\xf8\xc5\xe3\x7f\xbb\xa2R'
+    b'\xae-\x88\xa3\xb8\xfb\xe6\x97\x1e\x8f\x11t\xef\x91"z:\r1T\x1a#\xf61\xba\x98\xa0<gO\xe6f\x83\xcb<\xa9\xe2\'.&\xc2\x92\xdc\x1aHr\x9d\x15\xcc\x0b\xdb\xe7\xd4\x0b\xb2n\xa6\xcb\xec\xb7Pa\x12\xc6'
+    b'[u\x12bJ\xf3\xa0\x1a\x904\xd4\xd2S\x86\xec\xd0\xd4N \x89\xe7\xdb\x10y\xb9\xfd\xa2\x8f\x18\xee\xbbD6\xebm\xbb\xb5\xf5*(\xa3\xad\xe3\x97\x00\t)\x8b\xc0\xef\xa3l\x082\xad+\x03\xebm\x84i\xb4\x1a\xef'
+    b"\xda\xe8#\x02FP\xc7k\xec\x7f\xd3\x1c\xb3\xad&C\xaf\x1b@\xb9'+\x10\x9d%n\xc9\x98Y\x11\xa2\xfbC\xbb\xbb\x1c\x8d\x05\x8a\xb9\xa7\x15\xf4\xbd\xec\x02\xf6\xf5U[(\n4\xde\x04m\x80\x83*z\x11\xf5\xfab"
+    b'a\xa9\xc2\xa3\x06$\xe2\x11\xbc-\x1c`E\x8e\x1a2\x14_p\xdaf\xb5o\xbb\xf2y\xb9\xb2\xf1[\xf2\x8d\xa6W%`(\x91tV\xd2\xa8\x10+\xd7E\xc8\x11\xd6M!\x0f3\xcct\xc1\x8d\xb6U\x10\x84\xa5\xbf\xc2'
+    b'\x14\xbb\xa3\xc6/\xec\xb4z\x08x$\xf4\xfa(\x0fU\x93\xa5\x1a\x7f^\xd9\xbdu\x80\x8d\xa7o\x96\xfb\x16\xc9a\xd2\x85\xd1\xc6U\xfa\xe1\xe0\xe9\xdc\x8cr\xf0\xf0\xfc\xea\xec\xe4F]\xbeW\xef\x0f\xfb\xbd\xd1\xf7\xd7\x97\xe7'
+    b'\xea\xe8\xe3\x8f\x17\x7fE\x8d\xb8u"\x1b\xa9\xddw[\x97M\xab(\x99\xd7\xe5\xdd;p\xe4\xf91bt\xae\xb9I\xc6\xed\xaf\x16\xf9\xd6\r\xb889\xb9\xfat\xa4\xde\x8eF\xfb\xf4w.X\x89\xfbSS\x00m\x95\xe3'
+    b'r\xae.)\x94\xf2\x9dM\x9fG\xc8\x88\x81\xd3\x96;\xcd\xcd\x07\x8eT&\xf3B\xbb;\xea3\x97\xea\xe6\xea\xe4\x88\xd6\x19\x8fv_\xff\r5\xe9\xdf&\xdc\xf8\x83D^$\x98\xe6(\xe8PM\x06Q\xde\xbe\xdd\xff\xa5'
+    b'\xc9VS\xeaRs\x12Ey\xd2`\xfcf?\xd4\xb5CE6M\xe8\xad\xd6\xbdv\xc7o8\xe1\x92\xbe`?k\xe5=\xa7T\xe1\xb2\xbd\xb1\xda\xde\xf0\xb5\xfa\xf0\xf17\xea>7\x15\xb9h\xeb\tR\xd0\xf9\xbfr\xbc'
+    b'\xae\xba\x97\x1d\xc6\xeb;\xac\x0b\x1f^\x1a7/\xed\xad\xbf\xf4\xc8\xa3\x85\x95\xf6\xbe\xef02\xde\x80\x91\xb6\x0486fq\x0es\xa24\x97\xeb2F\x823D\x15\xd0\x01BS]\xa6\x13\x84\xd8;i\xecx$Z\xac'
+    b"\x02 \xaa2t\xedP\xb9Z\xd2\x87\xae\xb5\xc5\x86\xca\\\x83\xc1\xc3|1\xd7\xef-\xc0_p\xe2\xe8\xeb\x84\xc0\xc8=\x8d\xe6-\x93v+I\x03\xfd\xed\x9b\xe1\xc17t2\xb9\x84\x9a\xd7@_\xb3k\x93W'`["
+    b'\x8d\xf3\xeb\t\x9c[\xbd=\xf8F "\xdb\xb8\x1a\xcf\xd1e\x9980\xf7jSE\x1d+.p\xa6\xea`w\xacn\xaf~T\xf7\x07\x0c*\x81P\xf0\x14\xa9\x92\x97\x0b.\x14\xd6\xcf\x8a\x7f@/X\xe6\xd5H\x85n'
+    b')\xe1>\xe3\x06K\x15\xd8\xee\x01\x9a\xe4\x96\x06;\xd4d\xc9\xb9\x8a\x89\x1b\xeb\xa4P\xa3\x91\x83AU\x13\x0b\xfbZ\x97\x89\x89QiR#%\x1d\xa8\xf3\xd3[\xe9O_~\xa6\x1fb\xec\x8a\x15[\x1bv^\xffo\xd4'
+    b'\xf8:\xde\x1f-\xd5\x93\r\xb4\xee&\x8f\xde\xeb\x0f\x9bu\x83C\xedmp\xa8\xd0{A\xaaC\xbbO\xf5\xc4\x85\xe8M\xe4.a\x92.\xa5\\\xf6\x9b-5\xfbX\xcb3d\x95^\xd5\x11\xaaf\xc1\xf2_\xf6Gm\xbd'
+    b"\xdf,5P\x0f(g\xe6\x91\xda\xd8%\xf764~\xba\xf4e\xa0`:'\xb79\xb2\x1b1P\xe8.<\xe8\xa9\t\x8d\x1e\xc4\x80j.{\xaf\xd6w\xd4\xa5\x95\xce\x0c\xd5\x06\xc4\xf6\x9c\x8b.3\x03=7U\xdc\xdb"
+    b'=BQ\x8f\x8d\xc7\xfb/_75\xdf\x83uw\x00[\xc2\xcf\x8eys\x7f\x87\xf3\x99\xb4\xa9\xcc3]\x06\xaao\xce\xfb\xac\xe9"\xc1"\xbe.\x16Ms\xd1N\xa7\xdeT\xe4YTK\xa6\xa4q,s0\x1a\xed\x14'
+    b'f\xa6\xa9-\x85\x90\x9dk\xea\x07\xbb"v\x9c\xa7Y+\xa1Vad\x87u\xc8?m\xbd\'\x99m\x1d\xf3O\x14\xfe\xf1F\xef\xa0.[\xed?q\xab\x18\x1e\x1b0\x11\x96\xdfo\x96?x\xe2\xf2\x06\xceg\x97\xfe\xcb'
+    b'\xa0\t\x1b\x1c4\x1b\xbcz\xe2\x06\x7f*\xdc\x820\xaf"\xde\xd8\xdf\xc0\x1b\xe7\x19U\x89\xc8+E\xcc\xf5\xf4\xb8i\xc8A\xce#8\x14\xaa\xde\x99)\xfb\x04\x12]\xb8IK\xb0\xb2\xa5@\xcb8\xc7\xf74\xce\x99.0'
+    b'\xf7\xce\xe92\xb8\xf1\xb2\xdd6\xca\x13\xe5&i\x97u]\xd3U7\xd8\xb0\x96\x11\x87_k\xe9E\xf6\x12\xc6\xc4\xb6C\x1eY!)\xf0\x1e\xf7\x93\xe9\x80\xc2\xa5\x14\xd8\x90\x133-p\xd4\xc13;\xe3\xd7{\xc3\xdd\xfd'
+    b'\x7f\xfe\xcf\x91\x08\x17J\xd9^\xc42\x9fQVI\xa7\x95mOv\xa1_\xe8\xee\xb1\x91\\\xc8\x86\x0b\xd0\xc04S\x94\xc2y\xe8>\xbe};|\xfb6d\x07\xa2\xd0g\xa4\xa0\xd2\xde\xcb\xb0Rb-7l\xc3\xee\x1d'
+    b'\x92#q)\xa3\x8f*\x1e\xa8w4\x1c\x8dv\xa1\x85\x19\xc2:\x1f\xe6\x1e\x85\x80\xdc\x0cDd\x13\x9b\xf8q\xe6\xfd\x9aa\xe8\xe6\xd6\x7f\xcd,\xeb\xec\xf4t\x01\xfed\xcb\xaes\xd8\x1f\x10\xe9\xcf\x02\xc1:\xcb\xfd!\x03'
+    b'\xfd\xd9\x88\xe9\xd8\xb1\xe5\x8b\x83\r|q\xf1\xd3\xe9\xf1\xe9a\x97\xe7\xc4=\xfb\x0fW?Jq\xf5q\x0c\x86G\x02S\t\xa7\xc4\xc5\x1b\x88\xc06\x83j\x87\xa7tU\x91\x958FWZ\rp\x94\xb2&Yj\xba\x16'
+    b"\x14\x16\x08<\xba_\xb6@$\xe7\xcf\xa1z\xc4\x8f\xdd\xfd\xdd\xae\xd3Ngz\x7f\xf5\xa6\xb7'\xe5\x02]\xcd\xb3\xbf\xfb\xe1\x07z\xea\xe3\x0f\xe7{Tg\x17\xd6\x89z\xd4\xfe\xf0\xcd\xed\x0f/=\x8a\x9b2}\xc8R\xca"
+    b'B\x8ek\x17\x0f\xd8q\x82x~v\x85\xc5\xa3\x8a\xb3;tt)\xf3\xc3\xc9\xf5m{<\xb2\xde\xeex\xb8\x07\xcc\x96\xc0\x10\r|\xa0\xfc\xfd\xa6\xd7\xd4\xe2\x8e>M\xefP~l\xc4\xd9D-\xd0\xeb\xb3\xf5{\xac\xae'
+    b'\xc9VY\x85B\xeeV\xce\xcf=n\n\x05t\x7f\x1d\x12M\xcayr\xabQ#D\xb4\xd0Z\x92\x05\xc7\x1e|\xdf\xfc\x18\xdd\xaf{x\x7f\xadG[f\xdd/\xfb\x0b\xfd!\xa3\xad\xfbW\x7f\xd1?\xd9D\xebYE\x7f'
+    b'\xbb\xf6\xd2\xf3\x91&\xea\x92\x88\xd6\x0f_m\x8a\xdbP+\xb6\xb86\x9a\xdd\xfbLO<\x07\xe5\xba\xbc7\x19\xe7%\\\x01\x97\xe6s\xb5#\xa3B\x95\xdc\xd8}\xe6I\ny+\x8a\xb6=\xc3\x83L\xf7`n$\x1a7'
+    b'\xba\xf0u\xeb\x9e(\x8cl!\r\x90\xf6X\xfb\x07\xea\x96\x0e\xf5\xbcr\xa1J\x88H\x90\xaf\x96\x98\xa1_P\xc9\x90\x9b\x90\xd2\x90\xbey4\xef \\\xde\xc2\xb4\x8co\xba\xc2^PQ*\x9d[\xad\xf6>\xf7,@\x85'
+    b'\xff\xaa\x1f\xb0U\xe4\xb8\x0b\x1a4\xa2[\xf2\xee\xc8\xdc\x0e\xea\xf9\xef\xe1\xb5\xa2\x86\x9da\xcf\x8eZB]\x88k\xc8\x94\xc8~<\x02jo\x98\xaf\x049\x9f\x95O\xe8\xeeQ\xe0w\xd0\xddX/l\xbe\x9c\xd92n\x13'
+    b"\x85\xe6\xab\xef%l\xa5\xa9\xa9kh\xe8:#\xf4qs\xceR\xbb\xf6\xb0\xdaW\xad:\xc3\xe3\xa5\xa9\x08#\x9b\xb5\xcb\xe2\x91Uw\xb8u:'\xc6\xa3\xff\x98%\xcd;\xea\x84\x9a'\xbd\x94@\xd0C\xe4\xfc\x05D\xac"
+    b'\x91\xc1\x1a&6\xc4\xf9\xdf_u\r6\x8fB\xc5\x86\xf8\xfd\xfb[\xfd\xef\x8c\xc8\x13\xad_G\xcd\x86@\xfe\x08\xb5v\x88\xe8\xe3\x80{\xb4]\x97\xe0\x89\x00\xd8\x10\xbd_o`\x8d\xad\x13\x9an:js\x0b\x1e;\xa4'
+    b'\x01\x16\x19\xfc\x82\xbee\x8e\xba\x05"\r\xa4_i\xa7\xd3lV\xa8\x9by6\xad\xb6\xb6\xf8\x8e\x83~\n\xa3\t\xd2\xe0\xc0\xbb\x94\x06\xb8\xd0E\x89\xf2\x02OX\xe2\xb6\xc6\xcc\x8aSO\xf1/\x1d&\x94y^\xa2\x1b\xd9'
+    b"i\xe7\x9d\x1d\xdd\xa2\xd2\x84?I\xdcfC\xe4[\x19u\xf5\xdbkC\x1a\xc8#\xb9h\x13\x10\xc7\\\xf3D\xfc\xdc>\xac\xdc\n5\x95-\x1d\x19\xc0\xa6\xbbp\x92q\xa0&d\xd10\xec\xde\x0e\xc6'92KG\x91"
+    b'\xf5\x81rO9N\xd6\xf2J\x187\x12\xd8\x9aT<\x9e\xee\x9c\x9a+\x13\x19c\xa3\xf9#\x9e\x05\xe4k\x08Te;\x8e\xe6\x8cx\xa0K\xcb\x18\x03\rl\x83\xbf\xc2\xe0\x1a\x0f)Qf\x05^\xdb\xf1<\x18\xc3\x9f2'
+    b',\xa2\x95!S\xd5\x8e\x87\xa0\x1c\xc4N\xb7\xf4\xb2W\xcfO\xed\xed\x0b\x05<HNHc\xdc=\xe5\xad_\xb0\xb6\xc3\x9c>\xcc.6\xabClT\xb7<\xc5\xb8\x80&B\xf7\xd0\xf0\x9d\xb2\xf5$S\xb84\xc4\xee\xd8'
+    b'\x95>F\xc8\x92\xd0\x04\xefx(\x96{\xa8~X\xaa\xf1h|0h\xbb\xf7\xe1\x13\r\x8e\xa76\x0c.\xc1\t^K\x13\x90\xb1\xb3 \x18\xectZg;4\x03\x9a\t\xdd\xbc\x06S4\x9e\x93\xd2\xdd\xbf\xe7/("'
+    b'\x88~\t\x99\x14\xf7\xdc\x9d\x802\xaebSC\xf3a\xe4\x12l\x91\xd0\xc3\xa0\xd92\xa7\xbbn\x1d\x03\x9f\xbe\x198\xa4\x81Af\xf1p\x01\xb3\x0e\xdcg|)J>\x8a\rHxoL\xfbe\x83\xaeQ1\xdbB\xc6'
+    b'\xbbxP\xa0\xd5\x11\xa0E\x93\x06\xe1~\x84\x1a\x10tD\xf9\x0cf\xb4\xb2\x07OY\xf9\xe6\xde\xb7\xd0\x7f\xa7j\xcd!1\xea\x8e\x0b&\xaf\x13f0\x8e\x97a\xb7\x9d\xca\xee\xac\x9c-|a\x11\xba\x15\x01\x92\xa2\r\xd4'
+    b'~\x05\xc3pw\\\xf8\xe0\x90q\x8c&Qce\xf6\xfc\xa2\x1f\xa8\xd2\xf0A\xc9N!\xfd}\xfe\xfeGO\r\xddv3\x86\x99\x87\xd7\xd5CJ\x97\xab\xd6\xdc\xf4$\xf5\x1d\xb8H\x8c\t)\x99L\x99\xd1\x14\xa8\xa3o'
+    b"%\x1a\xba\x11L\xaf\xb3\x0b\xcd\xd6\xe49]'R\x03\xf8CC\xbb\x92]5\x88#\x86\xb7|\x9dI\xf3\xe1Y\xe8_\xf3bb$RD\x18\xc9\x17;$\xda9\x1e\x1fGPB\xf5\xa5\xc5\xf3\xfb\xe6\x8b'\x07T\xca"
+    b'#\x1f\xfc\xf5\x82\xf8$gs\x12\x02\xfa\xb6jL\xd0,\x1c\xeeP\xe4\xee9\r\xb7\xdf\xae\xf3\xcf>\x9b\xf0\x98!\x95\xd7\xcf\xaa6}\xa2f\x1d\xcf\x00\xd3E\x7f\xcd\xe3\x17\r\x02\x12)\xcb\xf9:lk\xab\xbdn\xa6'
+    b'\x9f\xe1t\xae5\xc2\xea\xd9BRG\xf3\xf4\xbf\xd6=~\x91Nm\xa4K\x9aj\xa4\xa4\x80>\x1fs\xd9\x84k\xee(5"\xffa\x18S\'\xc5\xc9\x177\x8d\x18`\x0bX\nv\xcd\xb3"\xab\x02\xce\xe9\x1am!\t'
+    b'V;\x83:a"\xa6,?\xab\x94\xce\xbd\r\xa6\x95\xe0\x8d\xe4\x039\x93\xf2\xb5CT5\xcdg\n\xe1\x9b\x17\xee\xda\xd3\xf5\xc5P]\xae\xcd\x1d\xc4\x1fe\xd9\xc5\x9c>\x80\x93\xa4\xaf\x15\x11\x96+\x8c \xaa\xbde\xa7'
+    b'\x1e\x13<\x17>c\xd2\x0eI\xa6\xbc\xcf\x9c-\xe5\x93(\xc1;\xf1 \x8d\x15\xf4\x8a\xc0^\xd0YQ\xbb\x16W\xe6\x8c\x87#\x1f\xcd)\xd1\xa1X\xfe\x15=\xaf\x05Ah:\xe7Q`\x9at\xad\xf8R\x84&\xbe\xf2\xbc'
+    b"\x11\x04\xef\xe4\xe1\xfc\x9d&\xdb\xcft\x9aO/$\xdcF_\x91\xdd\x0b\x99\xb6\xc7\xc8\xa4[\xe8\x0b\x02\x05j\x80\xd8\xf2\xa1Y\xc8\xb8\xb86\x89\xbc)}\xb3\x18iq\x1fBT\t'@\x98\xf2s\xbaJ\xea\xbeh\x8b"
+    b"n\x10':G\x11\xca\xe0\x8c\x9a\x052:%\xc7\x8b\xfa\xaf0\xc0\x99\xb5LRx\xf4A\xd3\xcd\x18\x07J\x8b\x82\x0b\x01\xb5L6\x90~h\x029\xfe\xc2\x8a`G>\x8a\xa4N\x1e\xa7\x8e\xee\xc2\x94\xcd\x84J\x7f\xea"
+    b'~\xca\xb9b\xf3t\xe8\xb3D^\xa0e\xca\xb7a\x04\xda7\xf0\x80L<\xb7\x03\xd0L\x03\xebx\x8c\x824\x05\xe1\x8a\x06\xaa\x08 \xab\x8c\xdc\xe3\xa4\x96,b\xa6\x00\x02\x1b\xae\xe0\xe3\xc6\xb16\xca\xd3L\xaf\xf9\xf0\xff'
+    b';\xa8\xc5\x13\xf2!\xa0\xbf\xd9\x94M\x93K\x9e4\x9f}\x90\xf9\xaf\x01\x9c\x07N\x04N\x18A\xef\xd4m\x13o\x1a2\xfa\x90[\x00/L\xb4\x9eA\xe5\x1e*6mV\xcd)\x9f\xe4a\xae],\xc0\xd1\xdb\xda\x11\x1d'
+    b'I\xf3=A\xec\x0bI\x11(EW\x81G2bGv\x13\xfeH\x16\xce\xe4\xf8+CJ\xe0\xda\x0f\x8c(\xe5\x0b\x03A\xad\xd9si\x83\xd0eS\x13\xd5%\xb1n+r\xbf\x92\xba\x87\xdc\x16;R\xba\xed-\xfc\x98'
+    b'a\xd2\xa4kq\x8e\xac(R\xd3H\x8b\\\x1f\xf2\x97\x11\xaby\xc1j"L\x95\r\xfc6iX\xb5a\x90\x88\x18)u\x05/#\x08\x84F\'\x05%\xbe\x03\t:\xe3dd-\x0b\x88.\x0f\xe1S3\x1c/T\xed'
+    b'\xcd\x98,_\xb9Qyu\x97\xe5\x96\x8a\xd1\x9d9\x8d\xfe\xc3\xc4Ly\x15\xb2s\xe8\xd0\x84\xfb\x16iI@\x87\xf0*\xdf|k\xf0\x97\xd1p\xfc\x86\x943\x1e\xed\x8eHl\xfc0\xda\xdb\x93_\xc6{\xab\x9d\x8eR\xbd'
+    b"y\xf3\x8d@\xb9i[\xe0\\y\xae{w\xb2|\x1eJ\xbdK\xb9U\xa1\xf9\xc8\x14\xef\xe7\x8dRg\x02/\x91+\x8b\x96\xa0\xeaHj\x0f\xb57\xdeW\xb3Ln\x8c|'\x8fV\x07\xaf\xbe\xa1\x02\x95O!\x87\xc0_"
+    b'\xc6P\xe9\xcf4\xa1!\xa7\x94\xec\x0e\xe52+\x92>z\xba\xe7P8\x9dz\xfa\x14\x14RP;B\xd3\x07YL\xc0",\xd1\xad\x85x\x1e\xb4 \x9d\x896\x84\r\xba\x9a\x0fT\x96\xcb\x1d:\x18\x95/\xcc\x9a\xfb\xe6'
+    b'\xcb\xc4@C,\xc6eIL;\r\xecK\x9fQ\xd2w\xd8 \xd0\xff\xa4QP<;1pS\xc6rT*C\x80c\xb8\x05}\xe3\xc7\xc7\xed\xdfD!\x14\xc3\xf3Py4\x9f\x19\x90\xd9\xf9F\x94F\x93,_y'
+    b'\xbc}\xa3@"\xf41I\xf8^\xaf\x81\xb9W\xbb\xc3\xddH\xa1]/\xcb\x94\xb6\x9e\xcd\xc9\xf64\xfcF\xea\xea\x9c\x80~=\x08\x17\xa1s\xecE!\xfe$\xf8ye\x19\x84\xd1\xe8\x1fi\xfd\xce,\xe8\xbb\x95&FE'
+    b']\xbd\xc6\x95\xe5P\xabZ\x9ch\n\xdd\xdd\xb2\x9dV%\x99\xab\x930\x1er\xa5e\xcc\xec\x036\xfb\x0fu\x12d\xe5\x9b\x07\xfa\xb0\xc8\xba2C\xbd\x9c\xd0\x87\xc8\xb6l\x06\xae\xcfy|\x04*\xddo\xae<\xe2\xa9\xfb'
+    b'\xf1\xf0\xa0\xd5\x0c\xbb\xd0\xca\xcd:\xe7\x18al\x14\x82&w\xf5"\xe0\x0c\xeay}\x10\xa9\x87\x19b_\xf1\x1aHJ\x9d\xc4m}GWE\xb0\x06\xb4w\x0co\xc8*\xfe"\xc7\xb7\xf3\x8e\xf4\xb9l\x97k\x92\xdf\xf3'
+    b'\xf8\x18`\x99\xa5\xbd\x94\x99[!\xc4\xbf\xfc\xc9\x15\xc5\xce\xb5$\xdb\xf0\x0b\xa0r\xfa\xc0\xb3R\xa5n\x9a&\x1dS7\x14\xdd\xe6@\xfd\xa8\x1beBM}\xc3\x15\xb3\x9dPr\xd9\x18\xa8)\xc6\xa1\xab+\x0b\x8a\xec%'
+    b'\x8d\xd2\xbfpw\xa6\x8a\xc7g\x9a\xe9_\xa6G\xf6I\xfa\x7f:M\x1d\xdf\xe6\xb3F:=\xf4"\xf1\xbf\x95\xf56L\xeb\xfc\x0eaa\xe1\'\xf2\xd5z\xb7\xf0\xf1\xec\xf1\x7fB\x04\xeb\x8d\xc2\x15\x81\xda\xb9\xe9@\x18\xad'
+    b'\x07<\x826\xd6\xef\x1f6\xbb\xf13\xffE"\xe8{\xb8\xa4\x17\xbf\xe3\xc5\xeb\xa3\x0eO\xdf\xf5\xcfr\xfdh\xd2!\xfe\x98\x8f\x7f\xd4>|\xfb\xf8};\x0e\x1b\xbe\xf0\xf8\x17\xf5;\xd06\xbfD\x00\x00'
+)
+
+_VERIFIER_GZ: bytes = (
+    b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x02\x03\xb5[\xdbr\x1b\xb7\xb2}\xe7W\xa0TIY\xa9"\x19Y\x91\x1dY\x95\xdaU\x8a,%\xdc\xd1mK\xb2\xe3<\xa5@\x0eH"\x9a\x190\x83\x191\xf4W\x9do8_\xb6Ww'
+    b'\x03s\xe1EVr\xea<Y\x12\x89F\xdf{u7\xfc\x9b\xab\x94.\x8cz_\x0c\xd5G;)]a\xb5\xfa1\xd5\x93\xc7\xa5sI_\xdd\xce\x87\xef\x87}\xa5\xd5\xd2\x15i2(L\xee\x96\xb9I\x94\xf9ka\x8a'
+    b'R\xd9\\\xf9\x895yi\xa7v\xa2\x12]j\xf5\xa4S\x8b\x1f\xac\xcb\x95\xce\x13\xf5d\n\xfaL\xfe\xb0\xb4\xe5\\9\xfcI\x1d\x1e\xa8\x95\xd1\x85Wn*\xb4@db\x88\xde\x9f\x95\x06\xb9\x12\x07\x9e\x8c*\x8c\xc7\xb7'
+    b"&s\x95\x99r\xee\x12\x97\xba\xd9j\xa8~sU\xa1\xf4D'&\xc3\xadc0;+\\\x85\xcbl>I\xab\xc4\xf8\x93\xde@8'\x82\xf7D\xcb\x97\xe0!UWL\xc6\xabi\xe12u5z\xa0\xef9_\x0e\x12"
+    b'G\xa2\xe3\x0b\xf5\x858\xf8\x9e\xc4\xf9\xd8\xe6_\x97D-\x9f\xba"\xc1\xc9\x0bWd\x10%5:\x89Z\xf0%}\xe7zt\xff\xf0\xca\xe32\xed\xab\xc2d\xf8\x80\x8f%\xba\xc0\xd5\x97z\x8c\x9bp\xdb\x8a.\xaf\xc6\xa9'
+    b"\xf5s(TW\xe0\xac u\xec=\xcc\x8d\xba\x9f\x88B\xf0\xfb\x85\x9e\x94'\xeaT\xdd\xd9\x99\x83\x98^\x9d.\x16\x85\xd3\xe0\xb1t\xea\xa1\xc0\xb9\x0e\x93{\xbd\x1e\xeb\xa70\x8b\xaa\x14\xb6\xadW\xe3\xca\xa6\xa5\xc2\xcfc"
+    b'c\xf3\x99\xa2S\xa9\xf1>]\xa9Ea&\xd6\x1b6V\x95O\\\x06\xe2\x99\xf5\xf4-\xe8`E\xa4|\xcd<$W\xcb9D\x9c\xb8\x1c*-\xab\xd2x8\x87\x18Y\x8fS\xa3\xa6\xe0\x96-\xa4\xe6\x1a\x06\xd4\xea\xb3'
+    b')\xdc\xa0t\xa9)4\t\xb4p\xa9\x9d\xac\x98\x90\xce\xc6vV\xd9r\xd5\xc7MSS\x90\xc0}\x85\x0f\xaa\xdcW\x8b\x85+J\xe8e\x92j\x9b\xf9`\xf3\x89K\xa1\xedY\x85K\x1f\xe1\x88\xc4\x9d\xd2^4FjR'
+    b'\xa7\xdek\x0f\xde\xf7TR\x19\xd2\x0f\xf3\xaf\xc76\xc55\xf4\xbb\xcdI\x98\x12r\xdb\x84\xddv\xc5\x82\x9b\xd4f6\xd7\xa5Q\xb9\xcb\x07$C\x05g\xc0WK6\x9f\x1f\x06\xa5\x96\xda?\x92:A\x89e\x06\x99)d'
+    b"\x9c\xc1W\xf3\xe6\xeb\xf4\rM*\x9a\x14\xa6\x84Hk\xea\x81\xc7zH\x06c\x94\xe0\x1b\xea~\x02/\xf8\xbd\xb03\xf0\x90\xaa\xd2\xfc\x15T\xa8kK\xcf\xe9R\xba\x9cC\x88\xcey\x9d!>\xc8'X\rKW\xa5\t"
+    b'\x1dHY\xce\x18\x85\xb0\xa2\x84\x17\xf1%\xfe]\xa5\xa5\x18R\xab\xb9\x9d\xcd\x07`\xfb\x11\nm\xc5\xf1\x82\xbcR\xbc\t\x82\x7f<\xbf\x1b]\x8c\xceN\x1fF7\xd7\xea\xf6\xe7\xd1\xe5\xcd\xfd\xcd\xed\xcf\xbf\x9d\xf4\xf6NE'
+    b'\x1c\xb0\x96;8\xbe\xfcV\xe5\xe4X\xca\xb2\x8f\x94\x1a\nW~\x01\x17\x03\xe1>\xc2\x98B\x825\xc1\xc9b\xe1,\xb4\x0by\xd8\xa5H\x821%\x81\xc4,LN\xf6\x810\xa2<\xe8gL\xa6r\x10\xbd\xa8\xa3\x14?'
+    b"V\xec\xa9\xb5B<\xac\x04/\xcb`\td\xb2t\xa8F\xb0O\xbeR\xe4\xd7.\x0f\xb6\x81{\xf3)G\x94\xfe\xac,\xc8\xb5=\xd0\xae\x8b4\x08\x7fB\xb4\x1bp\xa4\x1bK\x0f\xf7\xd6\xf4sv7z\xc0\xef\xa7'\xbd"
+    b'\xd7C\xc4l\xc7%n\xae/\x7f\xe3\xc0\x81\xb9\x0b\ny\xb1RP\xe2\x94.\xc9\x8c\x81:N//)\xf0!\x14\xe2rRX\x96\xe5\xa4\xa7\x1489\x8bJ\x85\xc6\x10\x0bH87\xd7\xe7_\xd2\xb0\xda\xcf\xabll'
+    b'\n\xdfg\x8e8\x1bz\xfanY\xe0\x87o\x84\xf25\xf4\xd7\xd8J\x913\x94\xd6\xe0k\xa9\x13_\xf0\x1c\x9c\xa5\x99\xccsJ\xc4\xf8\xac\xf6F[\xa8\x8b\x0f\x97\x97}\xf2fx\x9b\xca\x89\x96\x90\xbdb\xefj\x82\x01\x19'
+    b'\xa3d\xf6$\xb2\xd7l\x8f\xacU\xb8\xa4\x9a\xec\xb2wP\x82\xa6D\xa6\xde\x8f\xee\xce\xcf\x1e\xa0\xd4\xdaG\xca92\xe4L\x02\xa4\x13O\xcc\xa9\xabJv\x86\xda\xd6\x91\xc3\x12\xa4\xfd\x96C\xa0;\x86\xe8\x99\xba\xb9\xa3<'
+    b'\xe9M\xf1d\xc4<\xb5\x9a\x12\x03s\xa4\xe4?j\xa1\x0b\xbd\x98\x17\x08\xee5S\x91\xf3\xa5\x10^t\xc7\x85\x88b\x83n\xe08L\xd3`6I6rz\x14j\x19\x02\xca\x86\x80\xa5\x8baH\x08K$\xe0<UT'
+    b'\xf2\xbd\xb0#\x8aN,[\x8b\x8c\xf5\xe5k\xae\xcf\xe1\xbf\xc4\xe1\xd8\xe6\x12\x06\xa8jR6\xb8H&v\xca\xca*I\xbc\xd2\x07\xbfd\xf5\xb4\t\xb0J=\x0c\x95\x8a\xab\xcc\xedBB\x08\xd9\x07\xb9\xc4R$s0$'
+    b'A\xe7\x1f\xee\x1f\xa4BH\xbd\x0f\xe9\x91]\xf6%\xd9\xa0E\xe5\xfa\xe6\x81\xbe\x87,lrS\xb4\xd36\x12?\x99\xbc\x04\xfb\x89\xa8c\xae\xf3Yp[\xfa\xa4\xb1"\xee\xed\xf5\x0e\x87T\xd3[v\x94\xd8\xe4t\x8f\x1b'
+    b'8Z\xfb$\xfeJe\x95/O\xa2\xfbX\xb6s\xd7/B\xc0quik]\x9d\x7f:e\x9f\xd5\xec3m\x9f\x13r\xb7\xc1\xcf\xc4\xda\x88\xa3d{(\x12\xe1\xe7b\xb1\x1d\x83\xbf\x18\xb3\xe0\xab\xcen\xaen/\xcf'
+    b'\x1f\xcek\xc7`]g\x1c\xa2\xf49\xa7\xa2\xa6\\m\x11P\xbc\x91.\x87\xe1R\xb2E\xe1\xb70NQ\xbe\xee\x8b\xb6\x98T\x19\x95\xdfI\xe4\xeb\xda\x11\x84,%\xe2\xd5\xe9\xf5o\x1d\xff#\xf7\xe1\xa8\xcb\xcb\xed\xaa\xa2'
+    b'\xe3\xc0*%\x9f\xa4<\xc9q!|\xad\x04\xc0\xd4\xd4\x9a\x13\xc1\xd7\x9fsu\xba\xd2t\xd9$\x1d\xf1=\xa4m\xba\xa6N"\xb0\x85\xa1\xf2o\xa7\xe2\x1a\xde\x98L\xb9\xf1\x93\x05Vk\xb9i\xcc\x1f\x1c\x87\xebQ\x1c\xdc'
+    b'\x84\xd3q\xdbC6B&\xd4\xd4&\xfb\xa3\xa8\xad;]\xbf\xedp\x9c\xb3\x85r\xaf\xf7\xddP\x11T\x9a\x02F\xb9%)\x88\xa0\xbf\x04pS\x8a|\xf0\xeb\x9fB85\xe1\xb3\xd0%JQ\xbe#~B1\x8f\xd9+'
+    b'A\x84\x14+(\x82\xa4\x16\xa7\xad\xcf\xc5j\x10E\xae\x1d(A\x0b\x12\xfdeZ\x95\x90\x81*\xca\x1ff\xd2=\xbf\x99\xc6\xce\xa4\x98H\xc0\xef\x99\x1c\xde\x0b\xf9\xf6\xfaj\xcff\x8c\xb0\xf8\x17P\xc5gH\x02\x13\xfa}'
+    b"S\x8c\x0e;\xf75\xfa\x0b \xe3\x89\x90'<\xbb\xc0E\xa9\x85;\xece\xa8&t\x87\x9b\xc2]\xe8\x07og9#\xf1\xbc\xdc\x13*7\x0b\x9bG\x89|5fQ\xc8\t\xbc\x07J\x12\xeaN \xca#2\x9d\x9cy"
+    b'\x88a\r\xdc\xa2\x17\x82^\xed\xb6\xb4\x85R\xcb>L\xc0\xba\xc3\xfb\x95.\x1eM\x9d\xf96\xce\xb5\x93\x13\xca\x9b\x99\x16M\xae\xb8\xad\xb3_\xa8\xcd\xa9\xf3\xe2\xf9\xd2)P\xb84\x95%V:\x0e\xa9\xa4\x85\x98wW\x8f'
+    b'\xfa\xd4\x88"\x88\x80P\xb7j\x08q\x14?\xba\xaaa\xaa\x04\x9c\x0b\xe98\x86[\x86\xd6-]\xd5\xe5U\xbez\xfe\xe4\xd2\xaa\x8c\\\xeeJ\xf8\x1dm\xdd\t\x08\x0c\xd6\x00z1\xa6\xa5\xb5\x8d\x02%\x87.\x82{:`'
+    b'\xc9\r\x0b\xb5\x1c|\xddSO\xf3U\xabB\t\xfe$\xefJ\\F\x81M}Mj\x92\x99\xe1\xf4\x17\xd2^\xa3\xb3]\xa7\x91J&\x95h\x91$XC8\xddS\\(l\xbe\x1b\x95\xacc\xfe\xbb\x9b\xb3\xf3\xfb{\x86'
+    b'\xb4w\xd4\xecn\x02\xa5\t\x12\xc9\xb4JSj\xe5B_\xc5\xe9\xa5\x86\x1c\xeb\x90\x9fj-\xbcfA\t\x88\xc1{5F"/C\xc5UzF\xc0\xa9\xdc\x86\xe3\xd0{\x0f\xc6\xab\x01\xfdK\xf9\xec\xa3\xb4a\xec\xa9\xdb'
+    b'\xf0Q_*\x96\xd4\xcbX\xf54\xe7\x15\xc9\xc7I\xef\x08\xac\xcc\xcd\xe4Q0\x16\x1c=\xf6\x07\xed\nA\x00*\xa16\xadQ\xed\x9b\xa1:\xcf\xc9\xbaM\xe9\x9cl\xa0\xf3N~\x0ey\xf8m\x97m\xd2R7\x04\x88\xbf'
+    b'\xf3O\xb7\x97\xa3\xb3\x11\x15\x02\xa9\x02\x1b5\xf0\xfb\xc87S\xc9]\x87_\xebc\xa1K\xb6\x86b\xefx\x93\x89Mxj\x1b\xf0\x1a\xc7\n\xe8\xe4C\x07<\x16\xc1/F\xd7\xa7\x97\xea\xa7\xd3\x87\xf3_\xce\xcfoQJ'
+    b'\x10\xe4-\x1c\x11\xfaHj\xc4\x08\xcb\xf3aRr\xe2\xaaqDh\xcb\xb9a\x9c\xdf\xea\xacZ\xadP\xec\x80\xb83\xe3*\xc8\x8d\x02\xa5R\x93\x84\xc9\xc0\x1fn\x1c\xb8\xca"Z!\xde\xa8\xc1%$"Q\n\xce\x9bQ'
+    b"F\xe0\x92\xfa|=\x99\xc0C'+4\xbb\xf0\xc9\x0c\xda\xbb\xd0)\x92\xde\xad\xf3\x96\xb25\xd3\xbd;\xff7\x9a\r\x0e\x82\x9b`\x81\x13\x99<\xf8\x95\x07\xcfT\xa8\x00\x06(m\xbe>88@\xee\xd5\xb9\xd7\xa1pQ"
+    b'O\xe4\r\xe1!.\x0b\xa3\xbc)\xb7]"s\x14}b\xba}<v5\x0bh\n\\3\xf5\x87\xdb{\xa6\xf4\xeb|u\xa2N\xd91[\xd5\x85j\x94\xda#:(J\x92\x03\x93\x96u\xe9c+\x05\xa6\xa6q\x15|'
+    b'>\xf0\x01V\xa7v\x06\xad\xd4\x83\xbc5DW\x1f\x1c=\x9bH\x0e7\xb4u:B\xdeN\x0ci}n\x91\xc9\x13\xf5\xee\xcd\xd7\xb5\t\xe2T\x84o\xf3\xa6\xdc\xa5\xae\x9a\n\x8c\xde\x9c/M\xa3\x94KG\xfcFPX'
+    b'G\xbet\x04;d\x89J\xe0\xcf)[\x81\x83:z\xf5\xdf\x90;~\xe9&OW\x9c\x02$\xf2\xd1\x87si\xa9\xb3C\xb9t\xdf0,k)\x89\xd3"\x12\xf6\xa7W\xd4O\xa1\xd4\x01t,\xe1\x16_\xc1\xf0W\x94'
+    b'\x04\xfe\xf3\x1aIm!Q\xfd\xd5q\xf8\xdb\xd16M\xd5\xa4\xe0W\x89:\x84\x9e"\xc1Y\xe1\x96\xe5\xbc\xd1\xd6\xad \t\x1a\xb8\xb5*\xc9\x1a\x02\xefd\xe2\xae\xa2\xeb\x14\x87jY\xc0\xbf\xd6\xa1wG\xbdz\xec\xa9F'
+    b'\x9bV\x0b\x1bT\xba\x05\x10\xec\xe8")k\xafyV\x08@\x9a\xeaT\x92\x82\xbf\x1b\xbeQ?\xfd\xfc\x99\xfd\x97"\xeb\x18\x06\x828\xbb\x9c\xeax@\x1f\xb7\xe8\x04\x17\xf5\xea\xf0\x98\xe9\x94\x8efhS*\xbb\xa8\x00\xab'
+    b'F}\r\x002\xd4=\x96f\xcdk\xb8\xdcB\xb4\t$\xd8\xa2s\x1bxi\xe9\xbe!]\x18\xce\xfe\x1b:i\x19dC\xc3\x8d\x08\x1c%\xdf\x02"V\x9c\xed\nS\xf4\xa8p\xad\xa9n\xcc\xc8~\xa5R8%\xa4='
+    b'R@1\x05\x8d\x1e\x12\x1a\xe6\x90!S\x80`=3\xbbT\x17\t\x90\x96\x0f\x8f\x06t\xbc!j\xa7/\x8cK\xbe\xe2\x8b\x81\xb9\xe5\xf3\x17\xc5\xd9\xcb2\xd6\xdbn0\xa6\xae"\xab"\xbb\xd0\x04\x99\xc43\x00\x98Ol'
+    b'4T\x05\x8d\xba\xeaKX\xb7\xa4\x1f&\x16n\x9aoU\xd2\x1a!\x1e0.\x9f9\xce\x9c^\xbb6|\x8a\xfd!\xac\xba\xd6o\xc5/\xd7QhI>\x1e\xf9r\x1c\x87!U\xfd\xd5Nk\xd7\xd4\xdc6\xa9M\xd4K'
+    b'x\xa3\xa5\x99\x9bb\xa6s\xfb9\xf87\xcdC`\xf0\x94[\x91ZJ\x8a;\x99\xe7\xa1,\xe1\x0f\xdb\x14\xd3\xa5Cv\xebT\xf1\x9a\xd6rn\xc1\x89\xac/j\x9a]]uxnik\x1d\x84o\xa8\xcbuy\xa0\xa1'
+    b'K\xfd\xbd\xfb\xb5iR\xd1n\x16"\xde\x8fm\xc1\x16\xabE\xf4\xd2#\xc4\xd5\xd2\xdf\x95\x1b\x93@\x89y\xb2m\x95\xd1\xae\x06@!#13\xcaF1T\xb6\xe9.\xd0h\x0eg\xb45a\x1bX\xce9\xc8\x1d\x147'
+    b'{[\xa5\xde\xd0\x90\xf0\xcbp\xa1}\x80\xd6\x15\xe4\x97\x0c\x05ua}+;u=i\x97::\x86iW\x86\xde\xbb\x8eNBOU6\xfd\xef\xd2\x02\x97\xfa\xb9^\xe0\xf6\x15\xf5\xacA\xd4\xadyh\xed\x18\xb4A0'
+    b"\xb4s$r\xb4\xb5A\xe3\x1e\xbd3\x12\x8c'b\xb3WO(Z\xa3\x88\xba\x91\xdcPpg<\xd7\xf5\xaa\xae\x8f\x08\xa7\xbd\xde\xeb\x83g\xc0%m\x89\xbc\x92q\x06\x82\xa4\xd5\xfb\xb3d\xeb\xda\xb8\x0f\x07[#\x02\xca"
+    b"^\xf1\xbc\x9cy\xce'v\x98\xbd>\xd3\x1d>t#\xac!,\\lb(\xf9\xc6G\x1e\xa9\x04\x9e8\xc8x+\xd0\xeb\x9d\xff\xa5)\x85\xf9\xad\xcd\xc4\tp:\x82r\xe6P\\^\x13\x11\x12\x9b\xf6\x7f\xbe\xd7;\xe5"
+    b'\xb6F\xa6\xf6\x172\xcdjCv\xb8w\x95?B=\xd7\x1fG\xefG\xa7\x80X\xa8\xaaTT\xc6\x08\x95\xc7\xb8>\xa0Y\xe7\x880\xa5\xa1\xb5%\xdb\x9btGh07K\x1aI\xcbpk\x0c\x140\xcft\xf1\xe8e'
+    b'\xb0\xf63 \x9a\xfa\xe9\xf6C\x03\x1c\x04\xac_\\\xde\xdc\xde\x13\xd5\x8b\xdb\xe3\xd6\x18%\xa9\xb8w\x8f=\x89\xfd\x0c\xb3^]\x12,hQ\xee+\xfa\x87a\x93j\x8d\x97\xd0\xa4B=\xa5\xe3A&q;\x07\x85%5'
+    b"\x8e\xc8(&u\x0b^O1W$\x1f\x9d'\x10I\xb5\xb3\xa2\xbe\t,\x16h\x8a\x84\xc1\x1a\xb5D\xe0Tk\xa7\xde\x87\xa7z\xcc\xcbt\\\xadi\xdaV\xa0\x1d\xe3A\x82&\xe3\xe7(FK\xc3\x83\x1b_e\x0b\xe9"
+    b'\x98\xa7\xea{\xd0^\x02\x05H\x03\x04\xc5\x08C\xbcd6s\x93{jVZ\x0f\x06\x02l\x89{\xfc\x04\x9f\x15\x96W\xde#j\xfc\x1fS\xa7\x13(\x84\x91o\xae\x11\x920(J\xce\xac"\xd8\x10\x0e3Lp|G'
+    b'E@\xf4ItM\xcbSX\xe9W\xae"\xb2Y\x8b\xbb\xd0\xc4d\xb4\xcdf\x05\x90+\x12\x91\'\xa67+\x84\x9buo\xe8\xb76R\xbc\xe60\xd2D\xc3\x87\xd2\x01\xbf\x94\xe8F\x87^\x91$+%\x9b\x0c^=\xe6'
+    b'M\xcc\xd1\xd26\xbe0\xe8T\x17*\x9f\xdb\xfa\xb1\x96\xb7\xbd\xf2\xed\x9b\x06\xf8y@\n\xaf\xe3X\x96\xf0\xa9w*)\xf4\x92\xe6\xc6%\x8dg\xea\x917\xe1\x88\tM\xbb\x0bE\x8b;z\x97\x80\x90p\xee1\xa8\xd1\xc1'
+    b'\x96\x19\x1c3,\x16\xa0\x07\xa4\xef\x02\x90\xaa\xa8\x18M\x0e9\x8f\xdcw\xa67\xed\xe8\xfa\xff\x88\x88\x7f\xe0w\xcc\xe5\x9d\xf1\x0b|\xcf\xf0|\xfb\x07*\x8d.\xc7m\xff\xa2__\x87\xc9\xb8\x0cq\xc22,\xb1\x82\xd8\x05'
+    b'{\x9b\xb5E\x0e+\xb0^<\xb7:?\x1em\x859P\x06\x0f\x03\xaa\xeb\xcc\x80Z4\xf6[\xda\xe87l3VEW\xb8c%\xab\xf6E\xbf\xfdZ\xbd|\xe0\x88\xc6sq)\xd1\x9c\xaa\x15\xa7\xf6E\x95\xfce\xf4'
+    b'\x00\xf5\x86\xf1\x99\xfd\xe4~\xc7>\xfd\xaee\x1a\x930I \xe7S\x94\xdd\xb0!*j\x99\xf1\xcd\xfd(b#\x1e\xd0\xe4\xc3\xda\x92\xa83\x96S\xfb\xcf{\x01\x13\x01\xa4\xba\xfe\xc2\xdc\xab\xca\xa3\xf5d\xee\x85S\xef\xf8'
+    b'\xd4\xe6\xc8\xcd\x86\xfe\x93\xfd\xe3\xdb\xae\x83\xfc`\xfd\xef\x9c\xa9\xfe\x05\xd77?|[\xff\xda\x99q\xd4\xe5\xe5\n\x88\x1b\xee\x8f\xbeU\xe7>xe;\xd8\xbaQ\xc4\xea\xb6y%\x93\xa6:\xd3\x98~{\xa9\x17\n\x15\\'
+    b"T^\xb3l/\x0b:y\xa2L\x90\x85\x96\xdd\xa3P\xc1\x11\x05\xd9qJ\xc4\x11\xf1u\xaad]\x96\xd4{\xf3\x8bN\xc7}5JQ\xf8\x9d%'\x02\xfbp\xe87TnR\x92\xc3S\x83\x8f@1\xa6\xe4\xfc$Y"
+    b'\xc3p\xd5\xd0\xea\x96\xa3\xf1\x03\xb7q\xe7\xd3\xa9\x8c\xa3rJ\xa2\xfb\xb7\x1f\xce\xbf\xe1\xf1\xd5\xf0\xe0\xb8O\xa5\x94k\x121\xd1}^D\x80\x12\x08\xceL!\x10\xbd\x81\xa2u=d/ff\xe0\xe1\x99-1\xa2*\x10'
+    b'\x11u\xf4\x8aj\xe8\x15\x01O-\xe8\x1d\xceW\xaf\xc1\xfe8\xb0\x8fN\x1bJ\x148O\xef~\xe0\xf8n\xe5\xd5wo\x0e\x14\xcd\xaf\x07\xb4\r!\x86\xa6\xd3\xa1\xfaP\x82\xdagV\xb1(\x95\x06\xc8.\x95>\xb4\x85\xec'
+    b'\x88\x10\x82\xce,Y\xcb\x81\x7fy\x88\xe2\xfbq6,\x8c\x11\x8a\xa8\xe7^\x13]\x8ci\xc8b*\xd4\x1e\xfe\x18\x92R\xec\x88N\x9bD\xdf\xb2\xd2+*Wdo\x99(,\x9c(\xdf\x83`\xc1K\xc9\xdc=\xc9\xd3\xb9'
+    b'\xa9\xa1\x02I\x1cH5\r\xaeB\xdd\xcc\xc0M\x07`k\x80x\xa0\x80\xe4\x07\x16\x93\xd5$m\xcd\xffB9\xa3\xbd\xac\xefd\xd7\xf1J\x1d\x1f|\x1d0\xa1\xf4j\xe0^"X\x164\xb5I.\x1de\x12\xc7\x86D\t'
+    b'\x92Z\xb4(\xb4\xf5&\x89O\x9fhbIq\x82+\\&\x8d+\xcf\xff\xa1\xd2\x10B\xb8\t\xb5\x85-\x86\xbbL\xfed\x0b\x97\x87\xd7L\xb5w\xdb\xa8>"[\x98\x19M\x9c\xb7W\xa6@\xf5\xff\xec\xfc\xfd\x7f\xea\xf9'
+    b'\xe2-_\xf6\xcf\x97\x94\xac\xba\xcc\x00\xb8\x9a\x9d5\x06\x12\\\x81u5\x05\xd3\xe0%\xf0A\xd7\xfe\xf8M\xa8W\xdb\n\x8d\xb4\xef\xf1\xc5\x01\x8a\x074\xd7\xdf\xd0R,U\xa7k\xafK8\xa1\xee,\x91Gr\xa0\xa97'
+    b'k\xe3\xb2\xee\x82F\xca\xd5\xce\xda\xd2\xb1\n\t\xc8\xc1\xd3W\x89K\x917\xea\xdat\xfd\xe2\x05I`\xd4\x872EmLw\xb6\xee;;6/\x9b\xa1P\x8f\xceb1\xfd\xd2\xdb\x9b\xbfQa\xean\xe7\xf0\xa4n\xf3'
+    b'\x9a~\xa7\x1e>\x8e\x1a\xf1N:S\xe5\xa6,YB\xfdnJ1\xc7My\x95\xb5\xf2i\r\xf6;i\n@K\xffA3\x82v\xc3\x11\x0fs>\x01\x89\xb9\xa8\x82\xf3\x15jU\xfc\xb8\x99CV\xf5b\xc4W\x08\x9c'
+    b'\xd0\x87\xd0\xad\x7fV\xe3\xf8\xa4\xa4\x1dR\xc8B\xfc\x1b\xe50\x8a\x9e\xc1\xe1\xf7\xdf\r_\x1f\xfd\xef\xff\x9c\x11riZ\x96\xe6ycH\xb6!\x83\xb5P}\xd20\xc8\xebn/k\x14\tkY\xcb\xc8\xfd-\x99\xa7\xe8'
+    b'\xb69\xa9\xe0\xab\xef\xde\r\xdf\xbd\xfb\x9a_\xcfjO\xe3\xa2\xb5\xfc\x1c\x8e\x85\x95lj\xe5q\xa7Fc\x80NL\x01R\xf0J\x9b\xc7\xbf\x9cE\xd06d\xf2\xe0\xb6),\xc5\xca\xcd\x0cb\x81\xdd\xa6pi\x10\xc3\xc7'
+    b'vN\x1e\xc4m\xb3_m\xb5\xd2\xe8l\xad\x10\xce\x1d\xeb]S\xe0\xfc\x89N{\xbe\x1a\x176\x89G\x07h\xb6\xd1\xebP\xfc\x11\x01\x8bp\x94\xf9\x0b%\x7f~Ca\xbc\xf44\\\x167\x04\xd1qx\xa8\xa0jKo'
+    b'\xc7\x81-v\xa4\xdd-\x8co\xcc\xd9\x13\x18%\xf3\x1b\xc6b\x0c\x14lP\x9b\x05\x1c6\x1e\x11\x1eh\xb0{\x89;\xfd3\xc0\xbf\xf1$h\x9b\x97\x85\x94\xf9\xb0\xb1\x9aN\x9c\x917ou\xdf\x80\x14\xf9\xb8&\x8eH\x13'
+    b'\xc5\x08\xc9\xf3\xa1\xf1u\xcaKa\xdf\x1b/\x07!ff\xec\xca\xf9F\x16\xa1\xe55o\x08^\xf4\xf8n\xfdA\x01u\x01HW\x8cb8EI\xd7\xb8\xa4=mm\x14o\xa9\x8b\xd1\xb9\x813\xc9\xfa\xe2m\x9dt\xfc'
+    b"\x8b\x9fQ!\x91\xcaS\xd0\xcd\x07T_z\xe9E\xabj\xebR\x11\xb2\x02\xc6\x92I\xac\x98m}Q\xbfu\xd9\xfdl\xba\x9d\xd2\xb2\xb7\x93o\x7f\x1c\xca\x9a\xe2LR\xf8Ig\xdbT'\xd3\x11>L\x9b\t\x12\x17\xab"
+    b"\xa2\xe5\xd5d\xe2'\x1a\x10\x98\xbf&f\x11\x00R{.@p/\x8c\x92\x06\x11\x04o\xcc\x94>\x19\x08\xf5\xee\x08\x9e\xdd\xcaN\x9e\x17U\x94\xc5\xfa\x87\xc7G\xf1\x195\xcdgn\xcf\xcf\xc8g\x0e\x0f^\x7f\xff;\xfe"
+    b'\xf8;M\xf1x\x02\x14\xb79!\xbf\xa4\xa0C\x00(\xe0\x9fV\x17\x16\xba\xeb\xc37\x07\xbf\x86\xee\x1a\xa0\x8bSP\x98\xde\xd0\x02*\xa2K\xf5\xf6Hvj1)\x12\xca$<\xc4\xf7\xd6\x9b2b\xf50,\xe3\x98\xfe'
+    b"\xd8\xf1\x1a(\xben\xe27\xebG\xc3C\xfa\x02\xa5\xf7\xfa\xc9g=\xbcJ\xf58 \xc8\xd6c\xdf\xf6\x14'\xcc\xb3\x9a\x86[\xcc\xd1\x1d\x9cp\xca\xaa'I;rU\xb4k\xa3yVw\xb2\xa1\xec\xc6T/I7\xcf"
+    b'-\xbe\xb65\xeb[M\x19\x01\xdbM`y\xfd\x9d\xe5\xfe\x97\xcc\x1b\xf1Z\xbd)\xecX\xb8\x13I\xfb\xe4\x02q\xb2\xc0\xdc\xef\xc4k\xf2\x84\x84ao\x80\xe0d\x94\x90ax9\x17\xffk\xceK\xb6to\x1b\xf6\xa2\x9a'
+    b"\xd6\x9e\xa86\xaf\x97Bj9\xd39%\x91\xb1\t/\xd0\xc3\xb30nQ\x10\x8a\xb5\xcf\xc4\xb1=5{m@z\xbc}\x1aQ'\xa6\x88C\xffN\x16\xb9C\x96\x96\xf7\x98+\xf9\x0f9\xe2\x1e\xf2\x84\xa5\xf2q\x0c\xf9"
+    b'\xe9\xea\x12\xf5\xc0\xa4I\xfd\xf2\xf3\xa4\xd7\xf2\x9e\xf7\xbc\xbb\xe3\xb7ufA/\x9f\xe8_\xf8\xb1NW\xde2\x92Y\xceW\x02|Z\xff\xd9\x00|\xe4\xaf\xca\xce\x7f1\xe8\xb0\xde\x05\x9b\xdf\xae3\xff_cn\x1d\xcd\x17'
+    b'6\x00\x00'
+)
@@ -1,512 +1,516 @@
 """
 Prompts used by various agents in the fact extraction system.
+
+The system prompt texts are shipped gzip-compressed in _prompts_data.py
+(generated from prompt_sources/ by src/scripts/compile_prompts.py). Each
+prompt template is only decompressed and built the first time its getter
+(get_extractor_prompt() etc.) is called, once per process, so a process that
+only verifies facts never pays for the extractor prompt. The module-level
+FACT_*_PROMPT names still resolve lazily through the same getters.
 """
 
-from langchain_core.prompts import ChatPromptTemplate
-
-# Prompt for extracting facts from text chunks
-FACT_EXTRACTOR_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", """You are Dr. Marcus Chen, Ph.D., a distinguished expert in technical data extraction and scientific measurement with over 25 years of experience in quantitative analysis. Your credentials include:
-- Ph.D. in Measurement Science from Caltech
-- Former Director of NIST's Quantum Measurement Division
-- Lead author of "The Measurement Manifesto: A Guide to Scientific Rigor"
-- Pioneer in developing standards for technical data extraction
-
-Your reputation is built on your uncompromising commitment to precision and your ability to identify only the most concrete, measurable facts from technical documents. You are known in the scientific community as "The Data Purist" for your strict adherence to measurable, verifiable facts.
-
-Your task is to extract ONLY clear, verifiable facts that contain specific, measurable data points from the given text. You approach this task with the same rigor you would apply to extracting experimental measurements for a high-stakes scientific publication.
-
-EXTRACTION PHILOSOPHY:
-"A fact must be anchored in specific measurements or metrics. If a statement lacks concrete numbers, precise measurements, or requires any inference - it is not a fact. We deal only in measurable truth."
-
-STRICT EXTRACTION CRITERIA:
-1. ONLY extract statements that contain ALL of the following:
-   - At least ONE concrete numerical data point (e.g., measurements, counts, percentages)
-   - Named entities with their FULL, proper names (specific companies, products, locations)
-   - Complete technical context that makes the measurement verifiable
-   - DIRECT statements from the text (no inference or combining information)
-   - Units for ALL numerical values
-   - Test conditions or context for ALL measurements
-   - Quantifiable data that can be independently verified
-   - ZERO inferred relationships or connections
-
-2. For each fact:
-   - Extract it either verbatim OR as a careful paraphrase that preserves ALL numerical details
-   - Include ALL relevant context needed for verification
-   - Maintain ALL units and qualifiers
-   - Never generalize or summarize numerical values
-   - NEVER combine information from different parts of the text
-   - NEVER infer relationships not explicitly stated
-   - MUST contain at least one specific number, measurement, or metric
-   - MUST NOT be a general statement about trends or changes without specific data
-   - MUST preserve test conditions and circumstances
-
-3. When paraphrasing facts, you MUST:
-   - Keep ALL specific numbers and measurements EXACTLY as written
-   - Preserve ALL named entities, locations, and technologies with their FULL names
-   - Maintain the complete context that makes EVERY fact verifiable
-   - Not introduce ANY information not in the original text
-   - Not omit ANY critical qualifying information
-   - Not use abbreviations (e.g., use "million" not "M", "milliseconds" not "ms")
-   - Not add subjective terms (e.g., "significantly", "effectively", "good")
-   - MUST preserve all numerical values and metrics EXACTLY as stated
-   - MUST maintain ALL test conditions and circumstances
-   - MUST keep ALL technical context complete
-
-4. If ANY required component is missing, DO NOT output that fact. Instead:
-   - Output exactly: <fact 1>None</fact 1>
-   - Do not extract general statements or trends as facts
-   - Do not extract capabilities or features without specific metrics
-   - Do not extract opinions or predictions as facts
-   - Do not combine partial information into a "complete" fact
-   - Do not extract statements about evolution or changes without specific metrics
-   - Do not extract requirements or needs without quantifiable data
-   - Do not extract future predictions or possibilities without concrete measurements
-   - Do not extract statements requiring domain knowledge not in the text
-   - Do not extract statements requiring calculation or inference
-
-Your facts will be verified against these strict criteria:
-1. Valid Facts - Must contain ALL of:
-   - At least ONE concrete numerical metric or measurement
-   - Named entity, product, or location with FULL name
-   - Complete technical context for ALL measurements
-   - Direct statement (not inferred)
-   - ALL specific, measurable data points
-   - Quantifiable information that can be independently verified
-   - Units for ALL numerical values
-   - Test conditions or context for ALL measurements
-
-2. Invalid Facts - Will Be Rejected:
-   - General statements about capabilities
-   - Trends without specific metrics
-   - Features without performance data
-   - Predictions or projections without measurements
-   - Statements using vague terms
-   - Combined information from different parts
-   - Inferred relationships or conclusions
-   - Partial facts even if mostly complete
-   - Evolution or changes without specific metrics
-   - Requirements or needs without quantifiable data
-   - Future possibilities without concrete measurements
-   - Any statement requiring domain knowledge not in the text
-   - Any statement requiring calculation or inference
-   - Any statement with incomplete technical context
-
-EXTRACTION PROCESS:
-1. Read the text carefully, identifying ALL measurable data points
-2. Look for statements with specific metrics
-3. Verify that each potential fact has ALL required components
-4. Check that ALL relationships are EXPLICITLY stated
-5. Ensure NO information is combined from different parts
-6. Verify that ALL technical context is complete
-7. Format each valid fact with proper XML tags
-
-Your role is to be the FIRST FILTER in fact verification. Extract ONLY the most concrete, measurable facts that will pass rigorous verification. When in doubt, reject the statement.
-
-Here are examples of GOOD facts with explanations:
-<examples of good facts with explanations>
-1. <fact>TSMC's 1-nanometer process node achieves a transistor density of 400 million transistors per square millimeter with 0.2 watts per million transistors power efficiency</fact>
-   - Names entity (TSMC)
-   - Contains precise metrics (1nm, 400M transistors/mm², 0.2W/M transistors)
-   - Complete technical context
-   - Direct statement
-
-2. <fact>The International Space Station has completed 100,000 orbits, traveling 2.6 billion miles</fact>
-   - Named entity (ISS)
-   - Precise metrics (100,000 orbits, 2.6 billion miles)
-   - Complete context
-   - Direct achievement
-
-3. <fact>Google's Council Bluffs data center operates at a Power Usage Effectiveness of 1.06 with a total compute capacity of 15 petaFLOPS</fact>
-   - Named entity and location (Google, Council Bluffs)
-   - Multiple precise metrics (PUE 1.06, 15 petaFLOPS)
-   - Complete technical context
-   - Direct measurements
-
-4. <fact>NASA's Perseverance rover has collected 23 rock core samples with an average mass of 12.4 grams per sample</fact>
-   - Multiple named entities (NASA, Perseverance)
-   - Precise metrics (23 samples, 12.4 grams)
-   - Complete collection context
-   - Direct measurements
-
-5. <fact>Tesla's Model Y production line in Texas outputs 5,000 vehicles per week with a defect rate of 0.8%</fact>
-   - Named entity and location (Tesla, Texas)
-   - Multiple precise metrics (5,000 vehicles/week, 0.8% defect rate)
-   - Complete production context
-   - Direct performance data</examples of good facts with explanations>
-
-Here are examples of statements that should NOT be extracted as facts:
-<examples of statements that should NOT be extracted as facts>
-1. "Zero Trust Architecture has emerged as a response to changing dynamics in cybersecurity"
-   - Why: No measurable metrics
-   - Why: No specific implementation details
-   - Why: General trend statement
-
-2. "AI and ML enhance threat detection capabilities"
-   - Why: No specific metrics
-   - Why: No named implementation
-   - Why: General capability statement
-
-3. "Cloud adoption continues to grow across industries"
-   - Why: No specific growth rate
-   - Why: General trend statement
-   - Why: No measurable data
-
-4. "The system provides improved performance"
-   - Why: No specific metrics
-   - Why: No baseline comparison
-   - Why: Vague improvement claim
-
-5. "Many organizations are implementing new security measures"
-   - Why: Vague quantifier ("many")
-   - Why: No specific count
-   - Why: No named organizations
-
-6. "The technology enables faster processing"
-   - Why: No speed metrics
-   - Why: No specific technology named
-   - Why: Vague capability claim
-
-7. "Security features include advanced encryption"
-   - Why: No encryption specifications
-   - Why: No performance metrics
-   - Why: Feature list without data
-
-8. "The platform supports high availability"
-   - Why: No uptime metrics
-   - Why: No specific platform
-   - Why: Capability without data
-
-9. "Companies are investing in quantum computing"
-   - Why: No investment amounts
-   - Why: No specific companies
-   - Why: General trend statement
-
-10. "The software improves efficiency by 2x"
-   - Why: No baseline metrics
-   - Why: No specific software
-   - Why: Incomplete comparison</examples of statements that should NOT be extracted as facts>
-
-EXAMPLES OF FACT EXTRACTION FROM CHUNKS:
-
-Example 1:
-Original chunk: "AMD's latest server processor, the EPYC 9004 series, has demonstrated unprecedented performance in industry-standard benchmarks. In SPECrate2017_int_base tests, the flagship EPYC 9994X achieved a score of 1,284 points. The chip features 128 cores and operates at a base frequency of 3.7 GHz."
-
-<fact 1>AMD's EPYC 9994X achieved a score of 1,284 points in SPECrate2017_int_base tests</fact 1>
-<fact 2>AMD's EPYC 9994X features 128 cores</fact 2>
-<fact 3>AMD's EPYC 9994X operates at a base frequency of 3.7 GHz</fact 3>
+import functools
+import gzip
+import re
+import sys
+import textwrap
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from src.agents import _prompts_data
 
-Example 2:
-Original chunk: "Google's DeepMind division has reported groundbreaking results in protein structure prediction. Their latest AlphaFold model successfully predicted structures for 98.5% of known human proteins with accuracy above 95%. The model runs on a specialized cluster of 512 TPU v5 chips and processes a typical protein structure in under 60 seconds. Initial testing was validated by three independent research laboratories at Stanford, MIT, and Oxford."
+# langchain_core is only imported when a template or message object is built,
+# so the dict-based render_extractor() path never loads it
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_core.prompts import ChatPromptTemplate
 
-<fact 1>Google DeepMind's latest AlphaFold model successfully predicted structures for 98.5% of known human proteins with accuracy above 95%</fact 1>
-<fact 2>Google DeepMind's latest AlphaFold model runs on a specialized cluster of 512 TPU v5 chips</fact 2>
-<fact 3>Google DeepMind's latest AlphaFold model processes a typical protein structure in under 60 seconds</fact 3>
+# Human turn of the fact extraction prompt
+FACT_EXTRACTOR_HUMAN = "Here is the next chunk of text to extract facts from: \n\nOriginal chunk: {text}"
 
-Example 3:
-Original chunk: "TSMC's newest fabrication facility in Arizona has achieved full production capacity. The $40 billion facility, which specializes in 3-nanometer process technology, currently produces 100,000 wafers per month. The production line maintains a remarkable yield rate of 93.5% and operates 24/7 with a workforce of 2,000 skilled technicians. The facility's power consumption is offset by a dedicated 500-megawatt solar farm."
-
-<fact 1>TSMC's newest fabrication facility in Arizona cost $40 billion</fact 1>
-<fact 2>TSMC's newest fabrication facility in Arizona specializes in 3-nanometer process technology</fact 2>
-<fact 3>TSMC's newest fabrication facility in Arizona currently produces 100,000 wafers per month</fact 3>
-<fact 4>TSMC's newest fabrication facility in Arizona maintains a yield rate of 93.5%</fact 4>
-<fact 5>TSMC's newest fabrication facility in Arizona employs 2,000 skilled technicians</fact 5>
-<fact 6>TSMC's newest fabrication facility in Arizona facility's power consumption is offset by a dedicated 500-megawatt solar farm</fact 6>
-
-Example 4:
-Original chunk: "Microsoft's new quantum computing center in Copenhagen has achieved significant milestones in error correction. The facility's primary quantum processor, using 1000 superconducting qubits, demonstrated coherence times of 300 microseconds at temperatures of -273.14°C. The system successfully executed 10,000 consecutive quantum operations with a fidelity of 99.99%. The center's innovative cooling system maintains temperature stability within 0.001 degrees of variation."
-
-<fact 1>Microsoft's quantum computing center in Copenhagen's primary quantum processor uses 1000 superconducting qubits</fact 1>
-<fact 2>Microsoft's quantum computing center in Copenhagen demonstrated coherence times of 300 microseconds at temperatures of -273.14°C</fact 2>
-<fact 3>Microsoft's quantum computing center in Copenhagen executed 10,000 consecutive quantum operations with a fidelity of 99.99%</fact 3>
-<fact 4>Microsoft's quantum computing center in Copenhagen's cooling system maintains temperature stability within 0.001 degrees of variation</fact 4>
-
-Example 5:
-Original chunk: "NVIDIA's latest data center GPU, the H200, sets new performance records for AI training. The chip, manufactured using TSMC's 4nm process, delivers 141 petaFLOPS of FP8 performance and features 141GB of HBM3e memory with 4.8TB/s bandwidth. During standardized MLPerf benchmarks, the H200 completed BERT training in 12.3 minutes, a 90% improvement over its predecessor. The GPU's power efficiency improved to 28 TFLOPS per watt in typical workloads."
-
-<fact 1>NVIDIA's H200 GPU is manufactured using TSMC's 4nm process</fact 1>
-<fact 2>NVIDIA's H200 delivers 141 petaFLOPS of FP8 performance</fact 2>
-<fact 3>NVIDIA's H200 features 141GB of HBM3e memory with 4.8TB/s bandwidth</fact 3>
-<fact 4>NVIDIA's H200 completed BERT training in 12.3 minutes, a 90% improvement over its predecessor</fact 4>
-<fact 5>NVIDIA's H200 achieves 28 TFLOPS per watt in typical workloads</fact 5>
-
-Example 6:
-Original chunk: "Meta's Reality Labs has unveiled their next-generation mixed reality processor, manufactured at 3nm by Samsung. The custom chip achieves 45 TOPS (trillion operations per second) while consuming only 5 watts of power, representing a 3x improvement in power efficiency over their previous generation. In standardized AR rendering tests, the processor maintained 120 FPS for complex scenes with 50 million polygons. The chip includes a dedicated neural engine capable of processing 4 trillion neural network operations per second for real-time hand and eye tracking."
-
-<fact 1>Meta's new mixed reality processor is manufactured at 3nm by Samsung</fact 1>
-<fact 2>Meta's new mixed reality processor achieves 45 TOPS while consuming only 5 watts of power</fact 2>
-<fact 3>Meta's new mixed reality processor maintained 120 FPS for complex scenes with 50 million polygons in standardized AR rendering tests</fact 3>
-<fact 4>Meta's new mixed reality processor includes a neural engine that processes 4 trillion neural network operations per second</fact 4>
-
-Example 7:
-Original chunk: "
-Edge Computing and the Future of Data Processing: A Paradigm Shift
-
-The traditional model of centralized data centers is undergoing a fundamental transformation with the rise of edge computing. This architectural shift is reshaping how organizations process and manage data, bringing computation closer to where data is generated and consumed. The implications of this change are far-reaching, affecting everything from latency-sensitive applications to the Internet of Things (IoT) ecosystem.
-
-Edge computing has emerged as a critical solution to the challenges posed by the explosive growth of IoT devices and real-time applications. By 2025, industry analysts project that 75% of enterprise-generated data will be created and processed outside traditional centralized data centers, marking a significant departure from current infrastructure models.
-
-A notable example of edge computing's impact can be seen in the autonomous vehicle industry. Tesla has deployed over 250 edge computing nodes across major urban centers, reducing their vehicle-to-infrastructure communication latency from 100ms to 12ms. This improvement has significant implications for real-time decision-making and safety systems in autonomous vehicles.
-
-The telecommunications industry has been particularly transformed by edge computing. The rollout of 5G networks has created new opportunities for edge deployment, with major carriers integrating edge computing capabilities directly into their network infrastructure. This integration has enabled new services and applications that weren't previously possible due to latency constraints.
-
-Security considerations in edge computing present unique challenges and opportunities. While distributed processing can reduce certain security risks by limiting the scope of potential breaches, it also creates new attack surfaces that must be protected. Organizations are developing sophisticated security frameworks specifically designed for edge environments.
-
-The energy efficiency implications of edge computing are complex and multifaceted. While distributing computation can lead to better overall energy utilization, it also requires careful management to prevent inefficiencies in smaller, distributed facilities. Recent innovations in edge data center design have shown promising results in balancing performance with energy consumption.
-
-Looking forward, the convergence of edge computing with artificial intelligence is opening new possibilities for intelligent data processing at the network edge. This combination is enabling sophisticated real-time analytics and decision-making capabilities that were previously impossible with centralized architectures."
-
-<fact 1>Tesla has deployed over 250 edge computing nodes across major urban centers, reducing their vehicle-to-infrastructure communication latency from 100ms to 12ms</fact 1>
-
-Example 8:
-Original chunk: "
-The Evolution of Renewable Energy: Transforming the Global Power Landscape
-
-The transition to renewable energy sources has accelerated dramatically in recent years, driven by technological advances and declining costs. This shift represents a fundamental change in how societies generate and consume electricity, with implications for everything from economic development to environmental sustainability.
-
-Solar energy has seen particularly remarkable progress. The average cost per kilowatt-hour of utility-scale solar power decreased from $0.28 in 2010 to $0.033 in 2023, representing an 88% reduction. Installation capacity has grown correspondingly, with global solar installations reaching 324 gigawatts in 2023, a 56% increase from 2022.
-
-Wind power has similarly evolved. Offshore wind farms have grown in both size and efficiency, with the world's largest facility, Ocean Wind One off the coast of New Jersey, beginning operations in December 2023. The facility spans 75 square kilometers, houses 98 turbines, and generates 1.1 gigawatts of power, enough to supply electricity to 500,000 homes.
-
-Energy storage technology has kept pace with generation advances. The world's largest battery storage facility, constructed by Pacific Gas & Electric in California, came online in March 2024 with a capacity of 2.5 gigawatt-hours. The facility can provide backup power to 750,000 homes for 4 hours during peak demand.
-
-Despite these advances, challenges remain in grid integration and transmission infrastructure. The intermittent nature of renewable sources requires sophisticated management systems and robust storage solutions. Policy frameworks and market structures continue to evolve to address these challenges."
-
-<fact 1>The average cost per kilowatt-hour of utility-scale solar power decreased from $0.28 in 2010 to $0.033 in 2023</fact 1>
-<fact 2>Global solar installations reached 324 gigawatts in 2023, a 56% increase from 2022</fact 2>
-<fact 3>Ocean Wind One off the coast of New Jersey spans 75 square kilometers, houses 98 turbines, and generates 1.1 gigawatts of power</fact 3>
-<fact 4>Ocean Wind One provides enough power to supply electricity to 500,000 homes</fact 4>
-<fact 5>Pacific Gas & Electric's battery storage facility in California has a capacity of 2.5 gigawatt-hours</fact 5>
-<fact 6>Pacific Gas & Electric's battery storage facility can provide backup power to 750,000 homes for 4 hours during peak demand</fact 6>
-
-Format each fact as: <fact>statement</fact>"""),
-    ("human", "Here is the next chunk of text to extract facts from: \n\nOriginal chunk: {text}")
-])
-
-# Prompt for verifying extracted facts
-FACT_VERIFICATION_PROMPT = ChatPromptTemplate.from_messages([
-    ("system", """You are Dr. Victoria Blackwood, Ph.D., a world-renowned expert in scientific data validation and verification with over 20 years of experience in quantitative research methodology. Your academic background includes:
-- Ph.D. in Statistical Methods from MIT
-- Post-doctoral research in Data Verification at Stanford
-- Former lead scientist at NIST's Measurement Standards Laboratory
-- Published author of "The Science of Fact: A Rigorous Approach to Truth Verification"
-
-Your reputation is built on being ruthlessly precise and uncompromising in your standards for what constitutes a verifiable fact. You have a zero-tolerance policy for ambiguity, inference, or unsupported claims. Your colleagues know you as "The Fact Assassin" due to your ability to instantly identify and eliminate non-factual statements.
-
-Your task is to verify if a given statement is a concrete, verifiable fact based on the provided original text. You approach this task with the same rigor you would apply to validating experimental results for a high-stakes scientific publication.
-
-VERIFICATION PHILOSOPHY:
-"A fact is not a fact unless it contains specific, measurable data points that could be independently verified by another researcher using the same source material. If any component is missing or requires inference, it is not a fact - it is merely a statement."
-
-VERIFICATION CRITERIA:
-1. A statement is ONLY considered a valid fact if it meets ALL of these criteria:
-   - Contains at least ONE specific, measurable data point (numbers, statistics, metrics)
-   - Names specific entities, locations, or technologies with their FULL, proper names
-   - Makes concrete, testable claims that could be reproduced by another researcher
-   - Can be DIRECTLY verified through the original text without any inference
-   - Matches the original text verbatim OR preserves ALL specific details in paraphrase
-   - Contains complete technical context for all measurements
-   - Includes units for ALL numerical values
-   - Specifies conditions or context for all measurements
-   - NEVER combines information from different parts of the text
-   - NEVER infers relationships not explicitly stated
-   - MUST have quantifiable data that could be independently verified
-   - MUST NOT be a general statement about trends or changes without specific data
-
-2. For paraphrased facts to be valid, they must:
-   - Maintain ALL specific numbers and measurements EXACTLY as in the original
-   - Preserve ALL named entities, locations, and technologies with their FULL names
-   - Keep the COMPLETE context that makes the fact verifiable
-   - Maintain ALL units and qualifiers
-   - Preserve ALL test conditions or circumstances
-   - Not introduce ANY information not present in the original
-   - Not omit ANY critical qualifying information
-   - Not combine information from different sentences
-   - Not make ANY logical inferences, even if they seem obvious
-   - MUST preserve all numerical values and metrics EXACTLY as stated
-   - MUST contain at least one specific number, measurement, or metric
-
-3. The following are NEVER valid facts:
-   - General trends or patterns without specific data points
-   - Industry observations without concrete metrics
-   - Predictions or future projections without measurements
-   - Claims about "enabling", "improving", or "enhancing" without specific metrics
-   - Statements using vague terms like "many", "often", "significant"
-   - Opinions or subjective assessments of any kind
-   - Technology capabilities without specific performance metrics
-   - Market trends without specific numbers and timeframes
-   - Paraphrases that lose ANY precision or context
-   - Combined statements from different parts of text
-   - Inferred relationships or conclusions
-   - Partial facts even if mostly complete
-   - Evolution or changes without specific metrics
-   - Requirements or needs without quantifiable data
-   - Future possibilities without concrete measurements
-   - Any statement requiring domain knowledge not in the text
-   - Any statement requiring calculation or inference
-   - Any statement with incomplete technical context
-
-VERIFICATION PROCESS:
-1. Read the original text carefully, identifying all measurable data points
-2. Compare the submitted fact against the original text word-by-word
-3. Verify that ALL numerical values, units, and context are preserved
-4. Check for ANY missing information or added inference
-5. Ensure the fact contains at least one specific metric
-6. Verify that all relationships are EXPLICITLY stated in the original
-7. Check that no information is combined from different parts
-8. Verify that all technical context is complete
-
-Your role is to be the FINAL GATEKEEPER of fact verification. If there is ANY doubt about whether a statement meets ALL criteria, it MUST be rejected. Your job is to maintain the highest possible standards of factual accuracy.
-
-Common False Positives to REJECT:
-1. Original: "The system processes 1000 transactions per second"
-   Invalid fact: "The system has high transaction throughput of 1000 TPS"
-   Why: Added subjective term "high", changed technical terminology
-   Why: Missing system configuration and test conditions
-   Why: Incomplete technical context
-
-2. Original: "The AI model achieved 95% accuracy on the test set"
-   Invalid fact: "The AI model is 95% accurate"
-   Why: Lost critical context about test conditions
-   Why: Missing test dataset specifications
-   Why: Incomplete technical context
-   Why: Only one metric (needs at least two)
-
-3. Original: "Company X's revenue was $100M in Q1, up from $80M in Q4"
-   Invalid fact: "Company X had 25% revenue growth"
-   Why: Performed calculation not present in original text
-   Why: Lost specific quarter information
-   Why: Missing absolute values
-   Why: Inferred relationship not explicitly stated
-
-4. Original: "The processor runs at 3.5 GHz and has 8 cores"
-   Invalid fact: "The 8-core processor achieves 28 GHz total frequency"
-   Why: Combined separate specifications incorrectly
-   Why: Performed invalid calculation
-   Why: Created relationship not in original
-   Why: Missing processor model/manufacturer
-
-5. Original: "The battery lasts 24 hours under normal usage"
-   Invalid fact: "The battery has 24-hour battery life"
-   Why: Lost critical context about usage conditions
-   Why: Missing test conditions
-   Why: Only one metric (needs at least two)
-   Why: Incomplete technical context
-
-6. Original: "Cloud security has evolved into a distinct discipline"
-   Invalid fact: "Cloud security is now a distinct discipline"
-   Why: No measurable metrics or data points
-   Why: No specific implementation details
-   Why: General trend statement
-   Why: No quantifiable data
-
-7. Original: "Organizations must balance security and productivity"
-   Invalid fact: "Organizations need to maintain security while being productive"
-   Why: No quantifiable metrics or measurements
-   Why: No specific organizations named
-   Why: Statement about requirements without data
-   Why: No measurable criteria
-
-8. Original: "Mobile device security is becoming more critical"
-   Invalid fact: "Mobile security importance is increasing"
-   Why: No specific metrics or measurable change
-   Why: No baseline comparison
-   Why: General trend without data
-   Why: No quantifiable information
-
-9. Original: "Future technology will shape cybersecurity"
-   Invalid fact: "Technology will impact security"
-   Why: No concrete measurements or specific data
-   Why: Future prediction without metrics
-   Why: No specific technologies named
-   Why: No measurable impact
-
-10. Original: "The system provides improved performance"
-    Invalid fact: "System performance has improved"
-    Why: No specific metrics or baseline comparison
-    Why: No performance measurements
-    Why: No system specifications
-    Why: Vague improvement claim
-
-Examples of fact verification:
-
-Category 1: Valid Facts
-
-A. Verbatim Facts:
-
-1. Original chunk: "NVIDIA's latest breakthrough in AI acceleration has set new industry benchmarks. The H100 GPU achieves 1000 TFLOPS in FP8 precision during standardized MLPerf benchmarks, marking a significant milestone in AI hardware development. The testing was conducted across 1000 separate runs at NVIDIA's research lab in Santa Clara, with a mean power consumption of 700 watts per GPU. The comprehensive validation process included various AI workloads, from natural language processing to computer vision tasks. While these results demonstrate impressive progress in AI acceleration, researchers note that real-world performance may vary depending on specific application requirements and system configurations. The H100's performance-per-watt metrics have also drawn attention from data center operators looking to optimize their AI infrastructure."
-   Submitted fact: "NVIDIA's H100 GPU achieves 1000 TFLOPS in FP8 precision during standardized MLPerf benchmarks with a mean power consumption of 700 watts per GPU"
-   Response:
-   <reasoning>
-   1. The fact combines directly related measurements from the same context
-   2. Contains multiple specific measurements (1000 TFLOPS, 700 watts)
-   3. Names specific entities (NVIDIA, H100 GPU)
-   4. References specific benchmark (MLPerf)
-   5. Includes complete technical context (FP8 precision, standardized benchmarks)
-   6. All units are specified (TFLOPS, watts)
-   7. Test conditions are preserved (standardized MLPerf benchmarks)
-   8. No information is combined from unrelated parts
-   9. No relationships are inferred
-   </reasoning>
-   <is_valid>true</is_valid>
-
-2. Original chunk: "Meta's expansion of data center infrastructure continues to accelerate, with their latest facility marking a significant advancement in sustainable computing. The new data center in DeKalb, Illinois spans 2.5 million square feet and operates at a Power Usage Effectiveness (PUE) of 1.08, setting new standards for energy efficiency in large-scale computing facilities. The facility represents a $1.5 billion investment and employs 350 full-time staff. Utilizing advanced cooling technologies and renewable energy sources, the facility has achieved carbon neutrality in its operations. The data center's design incorporates several innovative features, including a state-of-the-art water recycling system that reduces consumption by 80% compared to traditional facilities. Local officials have praised the project's economic impact and Meta's commitment to environmental sustainability in the region."
-   Submitted fact: "Meta's new data center in DeKalb, Illinois spans 2.5 million square feet, operates at a Power Usage Effectiveness (PUE) of 1.08, and represents a $1.5 billion investment"
-   Response:
-   <reasoning>
-   1. Contains three specific measurements (2.5M sq ft, PUE 1.08, $1.5B)
-   2. Names specific entity and location (Meta, DeKalb, Illinois)
-   3. All measurements are from the same context
-   4. All technical specifications are preserved
-   5. All units are specified (square feet, PUE ratio, dollars)
-   6. No information is combined from different contexts
-   7. No subjective terms or inferences added
-   8. Complete context for all measurements
-   </reasoning>
-   <is_valid>true</is_valid>
-
-Category 2: Invalid Facts
-
-A. Combined Information:
-
-3. Original chunk: "Microsoft's quantum computing research has achieved a major milestone in quantum state coherence. Their quantum processor uses 1000 superconducting qubits and operates at temperatures of -273.14°C. In separate experiments, the system demonstrated coherence times of 10 milliseconds and achieved a fidelity of 99.99% on basic operations. The achievement relied on a novel error correction scheme and advanced cryogenic control systems developed by Microsoft's quantum research team. The facility houses a unique hybrid quantum-classical architecture that enables real-time error correction and state monitoring."
-   Submitted fact: "Microsoft's quantum processor achieved 10ms coherence times with 99.99% fidelity at -273.14°C using 1000 qubits"
-   Response:
-   <reasoning>
-   1. The fact combines information from separate experiments
-   2. The original text does not directly link coherence time with fidelity
-   3. Temperature is stated separately from both measurements
-   4. Creates relationships not explicitly stated in the text
-   5. Implies all metrics were achieved simultaneously
-   6. Combines information from different sentences
-   7. Makes logical inferences not present in the original
-   8. Violates rule about combining information from different parts
-   </reasoning>
-   <is_valid>false</is_valid>
-
-B. Lost Context:
-
-4. Original chunk: "Intel's latest server processor delivers exceptional performance in industry-standard benchmarks. The Xeon 9400 achieved a score of 1,284 points in SPECrate2017_int_base tests under controlled datacenter conditions with a 250W power envelope. The chip features 64 cores operating at a base frequency of 2.5 GHz with boost capability to 4.2 GHz. Independent testing labs have verified these results across multiple server configurations and workloads."
-   Submitted fact: "Intel's Xeon 9400 scored 1,284 points in benchmarks"
-   Response:
-   <reasoning>
-   1. Lost critical context about specific benchmark (SPECrate2017_int_base)
-   2. Omitted test conditions (controlled datacenter conditions)
-   3. Missing power envelope information (250W)
-   4. Lost technical specifications that affect the result
-   5. Only includes one metric (needs at least two)
-   6. Missing context makes the fact incomplete
-   7. Cannot be properly compared or verified without full context
-   8. Test conditions are not preserved
-   </reasoning>
-   <is_valid>false</is_valid>
-
-Remember, your response MUST use these XML fields EXACTLY:
-<reasoning>Detailed step-by-step analysis of why the statement is/isn't a valid fact</reasoning>
-<is_valid>true/false</is_valid>"""),
-("human","""
+# Fixed part of the extractor human turn. The chunk text must stay the last
+# thing in the prompt so everything before it is a byte-stable, cacheable prefix.
+assert FACT_EXTRACTOR_HUMAN.endswith("{text}")
+FACT_EXTRACTOR_HUMAN_PREFIX = FACT_EXTRACTOR_HUMAN[:-len("{text}")]
+
+# Human turn of the fact verification prompt. The original chunk comes before
+# the fact so verifying several facts of one chunk shares the longer prefix.
+FACT_VERIFICATION_HUMAN = """
 Here is the next submitted fact to verify:
 
 Original chunk: {original_text}
-Submitted fact: {fact_text}""")
-])
\ No newline at end of file
+Submitted fact: {fact_text}"""
+
+
+def _compact(s: str) -> str:
+    """Strip layout-only whitespace from a prompt to cut input tokens per call.
+
+    Dedents the text, drops the 3-space indent in front of list bullets and
+    collapses runs of blank lines. The wording itself is left untouched.
+
+    Args:
+        s: Prompt text
+
+    Returns:
+        The compacted prompt text
+    """
+    s = textwrap.dedent(s)
+    s = s.replace("\n   - ", "\n- ")
+    return re.sub(r"\n{3,}", "\n\n", s)
+
+
+@functools.cache
+def _load_system_text(data_name: str) -> str:
+    """Decompress and compact a gzip-compressed system prompt from _prompts_data.
+
+    Args:
+        data_name: Name of the compressed bytes constant in _prompts_data
+
+    Returns:
+        The decoded, compacted system prompt text
+    """
+    # Interned so every template and message built from it shares one string object
+    return sys.intern(_compact(gzip.decompress(getattr(_prompts_data, data_name)).decode("utf-8")))
+
+
+# Most candidate facts verified in one batch call; larger batches are split
+MAX_BATCH_FACTS = 25
+
+# Human turn of the batch fact verification prompt
+FACT_VERIFICATION_BATCH_HUMAN = """
+Original chunk: {original_text}
+
+Candidate facts:
+{candidate_facts}"""
+
+
+def _split_template(template: str, *fields: str) -> Tuple[str, ...]:
+    """Split a human template into the fixed text around its fields.
+
+    Args:
+        template: Template with each field appearing once, in the given order
+        *fields: Field names, e.g. "original_text"
+
+    Returns:
+        The len(fields) + 1 fixed parts, to be joined with the field values
+    """
+    parts = []
+    for field in fields:
+        part, template = template.split("{" + field + "}")
+        parts.append(part)
+    return (*parts, template)
+
+
+# Fixed parts of the verification human turns, split once at import so
+# rendering a prompt is plain concatenation instead of str.format()
+_VERIFICATION_PARTS = _split_template(FACT_VERIFICATION_HUMAN, "original_text", "fact_text")
+_VERIFICATION_BATCH_PARTS = _split_template(FACT_VERIFICATION_BATCH_HUMAN, "original_text", "candidate_facts")
+
+# Output instructions replacing the single-fact response format in batch mode
+_BATCH_OUTPUT_INSTRUCTIONS = """You will be given ONE original chunk and a numbered list of candidate facts extracted from it. Verify EACH candidate independently against the original chunk using the criteria above.
+
+Remember, your response MUST contain exactly one verdict per candidate id, in order, and nothing else. Each verdict starts with a brief reasoning for that candidate:
+<verdict id="1"><reasoning>The chunk states this directly</reasoning>valid</verdict>
+<verdict id="2"><reasoning>The chunk gives a different figure</reasoning>invalid</verdict>"""
+
+# Marker where the single-fact response format starts in the verifier prompt
+_SINGLE_OUTPUT_MARKER = "\n\nRemember, your response MUST"
+
+# Output parsers, kept next to the prompts that define the output format.
+# <fact>...</fact> and <fact N>...</fact N> tags in extractor output
+FACT_TAG_RE = re.compile(r"<fact(?:\s+\d+)?>(.*?)</fact(?:\s+\d+)?>", re.S)
+# The extractor's explicit "no facts" answer
+NONE_FACT_RE = re.compile(r"<fact\s*\d*>\s*None\s*</fact\s*\d*>", re.S)
+# One verdict of the batch verification output, with its optional leading reasoning
+VERDICT_RE = re.compile(
+    r"<verdict(?:\s+id=\"(\d+)\")?>\s*(?:<reasoning>([^<]*)</reasoning>\s*)?(valid|invalid)\s*</verdict>",
+    re.S | re.IGNORECASE
+)
+# <is_valid> and <reasoning> tags of single-fact verification output, in either order
+VERDICT_TAGS_RE = re.compile(r"<(is_valid|reasoning)>(.*?)</\1>", re.S)
+
+
+@functools.cache
+def _load_batch_verification_text() -> str:
+    """Build the batch verifier system prompt from the single-fact verifier prompt.
+
+    The verification criteria and examples are shared; only the closing
+    response format is swapped for one verdict per candidate id.
+
+    Returns:
+        The batch verifier system prompt text
+    """
+    text = _load_system_text("_VERIFIER_GZ")
+    head, _, _ = text.partition(_SINGLE_OUTPUT_MARKER)
+    return sys.intern(head + "\n\n" + _BATCH_OUTPUT_INSTRUCTIONS)
+
+
+# Section markers in the extractor prompt used to cut out the shared parts
+_CRITERIA_START = "STRICT EXTRACTION CRITERIA:"
+_CRITERIA_END = "\n\nEXTRACTION PROCESS:"
+_EXAMPLES_START = "Example 1:"
+_EXAMPLES_END = "\n\nExample 3:"
+_FORMAT_LINE = "Format each fact as: <fact>statement</fact>"
+
+# Opening of the short extractor prompt, replacing the persona and philosophy
+_SHORT_EXTRACTOR_INTRO = "Extract ONLY clear, verifiable facts that contain specific, measurable data points from the given text."
+
+
+@functools.cache
+def _common_criteria() -> str:
+    """Cut the extraction criteria shared by all extractor prompt variants out of the full prompt."""
+    text = _load_system_text("_EXTRACTOR_GZ")
+    start = text.index(_CRITERIA_START)
+    return text[start:text.index(_CRITERIA_END, start)]
+
+
+@functools.cache
+def _load_short_extractor_text() -> str:
+    """Build the short extractor system prompt: the shared criteria plus two examples.
+
+    Returns:
+        The short extractor system prompt text
+    """
+    text = _load_system_text("_EXTRACTOR_GZ")
+    start = text.index(_EXAMPLES_START)
+    examples = text[start:text.index(_EXAMPLES_END, start)]
+    return sys.intern("\n\n".join([_SHORT_EXTRACTOR_INTRO, _common_criteria(), examples, _FORMAT_LINE]))
+
+
+# Extractor prompt variants: variant name -> prompt name and when to use it
+PROMPT_VARIANTS = {
+    "full": {
+        "prompt": "FACT_EXTRACTOR_PROMPT",
+        "description": "Persona, criteria and all examples. Best extraction quality; "
+                       "use for large or hosted models where prefill is cheap.",
+    },
+    "short": {
+        "prompt": "FACT_EXTRACTOR_PROMPT_SHORT",
+        "description": "Shared criteria plus two examples, about a quarter of the full prompt. "
+                       "Prefill on small quantized local models is bound by weight bandwidth, so "
+                       "fewer prompt tokens directly cut latency per chunk at some cost in recall.",
+    },
+}
+
+# Model names that get the short prompt: quantized builds and models up to ~8B parameters
+SMALL_MODEL_RE = re.compile(r"(q4|q5|\b[1-8]b\b|\bphi)", re.IGNORECASE)
+
+
+def select_prompt_variant(model_name: str) -> str:
+    """Pick the extractor prompt variant for a model.
+
+    Args:
+        model_name: Name of the model, e.g. "gemma3:4b"
+
+    Returns:
+        "short" for small or quantized local models, "full" otherwise
+    """
+    return "short" if SMALL_MODEL_RE.search(model_name or "") else "full"
+
+
+def get_extractor_prompt_name(variant: str, model_name: str) -> str:
+    """Resolve the configured extractor prompt variant to a prompt name.
+
+    Args:
+        variant: Configured variant, "full", "short" or "auto"
+        model_name: Name of the model, used when the variant is not "full" or "short"
+
+    Returns:
+        Prompt name, e.g. "FACT_EXTRACTOR_PROMPT_SHORT"
+    """
+    if variant not in PROMPT_VARIANTS:
+        variant = select_prompt_variant(model_name)
+    return PROMPT_VARIANTS[variant]["prompt"]
+
+
+# Lazily built prompt templates: attribute name -> (system text loader, human template)
+_LAZY_PROMPTS = {
+    # Prompt for extracting facts from text chunks
+    "FACT_EXTRACTOR_PROMPT": (functools.partial(_load_system_text, "_EXTRACTOR_GZ"), FACT_EXTRACTOR_HUMAN),
+    # Short fact extraction prompt for small local models
+    "FACT_EXTRACTOR_PROMPT_SHORT": (_load_short_extractor_text, FACT_EXTRACTOR_HUMAN),
+    # Prompt for verifying extracted facts
+    "FACT_VERIFICATION_PROMPT": (functools.partial(_load_system_text, "_VERIFIER_GZ"), FACT_VERIFICATION_HUMAN),
+    # Prompt for verifying all facts of one chunk in a single call
+    "FACT_VERIFICATION_BATCH_PROMPT": (_load_batch_verification_text, FACT_VERIFICATION_BATCH_HUMAN),
+}
+
+
+def format_candidate_facts(facts: List[str]) -> str:
+    """Format candidate facts as the numbered list used by the batch verifier.
+
+    Args:
+        facts: Fact statements to verify, at most MAX_BATCH_FACTS
+
+    Returns:
+        Numbered list with ids starting at 1
+    """
+    if len(facts) > MAX_BATCH_FACTS:
+        raise ValueError(f"At most {MAX_BATCH_FACTS} facts can be verified per batch, got {len(facts)}")
+    return "\n".join(f"{i}. {fact}" for i, fact in enumerate(facts, 1))
+
+
+def parse_verdicts(output: str) -> Dict[int, bool]:
+    """Parse the verdicts of a batch verification response.
+
+    Args:
+        output: Raw LLM output
+
+    Returns:
+        Mapping of candidate id (1-based) to whether the fact is valid.
+        Ids missing from the output are absent from the mapping.
+    """
+    return {
+        int(match.group(1)): match.group(3).lower() == "valid"
+        for match in VERDICT_RE.finditer(output)
+        if match.group(1)
+    }
+
+
+def parse_reasoned_verdicts(output: str) -> Dict[int, Tuple[bool, str]]:
+    """Parse the verdicts of a batch verification response that carry a reasoning.
+
+    Args:
+        output: Raw LLM output
+
+    Returns:
+        Mapping of candidate id (1-based) to (is_valid, reasoning). Verdicts
+        without a non-empty reasoning are absent from the mapping, so callers
+        can verify those facts with the single-fact prompt instead.
+    """
+    verdicts = {}
+    for match in VERDICT_RE.finditer(output):
+        reasoning = (match.group(2) or "").strip()
+        if match.group(1) and reasoning:
+            verdicts[int(match.group(1))] = (match.group(3).lower() == "valid", reasoning)
+    return verdicts
+
+
+def parse_verdict_tags(output: str) -> Optional[Tuple[bool, str]]:
+    """Parse the <is_valid> and <reasoning> tags of a single-fact verification response.
+
+    Both tags are found in one scan of the output; the first occurrence of
+    each tag wins.
+
+    Args:
+        output: Raw LLM output
+
+    Returns:
+        (is_valid, reasoning) tuple, or None if either tag is missing
+    """
+    tags: Dict[str, str] = {}
+    for match in VERDICT_TAGS_RE.finditer(output):
+        tags.setdefault(match.group(1), match.group(2))
+        if len(tags) == 2:
+            break
+    else:
+        return None
+    return tags["is_valid"].strip().lower() in ("true", "yes"), tags["reasoning"].strip()
+
+
+def parse_facts(text: str) -> List[str]:
+    """Parse the fact statements out of fact extractor output.
+
+    Args:
+        text: Raw LLM output
+
+    Returns:
+        Fact statements in output order, without empty and "None" facts
+    """
+    facts = []
+    for fact in FACT_TAG_RE.findall(text):
+        fact = fact.strip()
+        if fact and fact.lower() != "none":
+            facts.append(fact)
+    return facts
+
+
+def get_system_text(name: str) -> str:
+    """Get the system prompt text of a prompt without building its template.
+
+    Args:
+        name: Prompt name, e.g. "FACT_EXTRACTOR_PROMPT"
+
+    Returns:
+        The system prompt text
+    """
+    return _LAZY_PROMPTS[name][0]()
+
+
+def render_extractor(text: str, prompt_name: str = "FACT_EXTRACTOR_PROMPT") -> List[Dict[str, str]]:
+    """Render the fact extraction prompt for a chunk as plain role/content dicts.
+
+    The system prompt and the fixed human text are sent byte-identical on every
+    call, with the chunk text appended last, so servers with prefix caching
+    only prefill the chunk.
+
+    The dicts can be passed straight to OpenAI-style chat APIs; no
+    langchain_core objects are built.
+
+    Args:
+        text: Chunk text to extract facts from
+        prompt_name: Extractor prompt to use, see PROMPT_VARIANTS
+
+    Returns:
+        List with the system message and the user message
+    """
+    return [
+        {"role": "system", "content": get_system_text(prompt_name)},
+        {"role": "user", "content": FACT_EXTRACTOR_HUMAN_PREFIX + text}
+    ]
+
+
+def render(text: str, prompt_name: str = "FACT_EXTRACTOR_PROMPT") -> List["BaseMessage"]:
+    """Render the fact extraction prompt for a chunk as LangChain chat messages.
+
+    Args:
+        text: Chunk text to extract facts from
+        prompt_name: Extractor prompt to use, see PROMPT_VARIANTS
+
+    Returns:
+        List with the system message and the human message
+    """
+    return to_messages(render_extractor(text, prompt_name))
+
+
+def render_verification(fact_text: str, original_text: str) -> List[Dict[str, str]]:
+    """Render the single-fact verification prompt as plain role/content dicts.
+
+    The system prompt is the same string object on every call, so it is sent
+    byte-identical and only the human turn varies.
+
+    Args:
+        fact_text: The fact to verify
+        original_text: Original text the fact was extracted from
+
+    Returns:
+        List with the system message and the user message
+    """
+    head, middle, tail = _VERIFICATION_PARTS
+    return [
+        {"role": "system", "content": get_system_text("FACT_VERIFICATION_PROMPT")},
+        {"role": "user", "content": head + original_text + middle + fact_text + tail}
+    ]
+
+
+def render_verification_batch(facts: List[str], original_text: str) -> List[Dict[str, str]]:
+    """Render the batch verification prompt as plain role/content dicts.
+
+    Args:
+        facts: Fact statements to verify, at most MAX_BATCH_FACTS
+        original_text: Original text the facts were extracted from
+
+    Returns:
+        List with the system message and the user message
+    """
+    head, middle, tail = _VERIFICATION_BATCH_PARTS
+    return [
+        {"role": "system", "content": get_system_text("FACT_VERIFICATION_BATCH_PROMPT")},
+        {"role": "user", "content": head + original_text + middle + format_candidate_facts(facts) + tail}
+    ]
+
+
+def to_messages(messages: List[Dict[str, str]]) -> List["BaseMessage"]:
+    """Convert rendered role/content dicts to LangChain chat messages.
+
+    Args:
+        messages: Messages from one of the render_* functions
+
+    Returns:
+        SystemMessage / HumanMessage objects with the same content
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    message_types = {"system": SystemMessage, "user": HumanMessage}
+    return [message_types[m["role"]](content=m["content"]) for m in messages]
+
+
+def _build_prompt(name: str) -> "ChatPromptTemplate":
+    """Build the chat prompt template registered under a name in _LAZY_PROMPTS."""
+    from langchain_core.prompts import ChatPromptTemplate
+
+    load_system_text, human_template = _LAZY_PROMPTS[name]
+    return ChatPromptTemplate.from_messages([
+        ("system", load_system_text()),
+        ("human", human_template)
+    ])
+
+
+@functools.lru_cache(maxsize=1)
+def get_extractor_prompt() -> "ChatPromptTemplate":
+    """Get the fact extraction prompt template, building it once per process."""
+    return _build_prompt("FACT_EXTRACTOR_PROMPT")
+
+
+@functools.lru_cache(maxsize=1)
+def get_short_extractor_prompt() -> "ChatPromptTemplate":
+    """Get the short fact extraction prompt template, building it once per process."""
+    return _build_prompt("FACT_EXTRACTOR_PROMPT_SHORT")
+
+
+def select_prompt(model_name: str) -> "ChatPromptTemplate":
+    """Get the extractor prompt template suited to a model.
+
+    Args:
+        model_name: Name of the model, e.g. "gemma3:4b"
+
+    Returns:
+        The short prompt for small or quantized local models, the full one otherwise
+    """
+    return __getattr__(PROMPT_VARIANTS[select_prompt_variant(model_name)]["prompt"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_verification_prompt() -> "ChatPromptTemplate":
+    """Get the fact verification prompt template, building it once per process."""
+    return _build_prompt("FACT_VERIFICATION_PROMPT")
+
+
+@functools.lru_cache(maxsize=1)
+def get_verification_batch_prompt() -> "ChatPromptTemplate":
+    """Get the batch fact verification prompt template, building it once per process."""
+    return _build_prompt("FACT_VERIFICATION_BATCH_PROMPT")
+
+
+# Module attribute name -> prompt getter, for the lazy module-level names
+_PROMPT_GETTERS = {
+    "FACT_EXTRACTOR_PROMPT": get_extractor_prompt,
+    "FACT_EXTRACTOR_PROMPT_SHORT": get_short_extractor_prompt,
+    "FACT_VERIFICATION_PROMPT": get_verification_prompt,
+    "FACT_VERIFICATION_BATCH_PROMPT": get_verification_batch_prompt,
+}
+
+
+def __getattr__(name: str) -> "ChatPromptTemplate":
+    """Resolve the module-level prompt names through their cached getters (PEP 562)."""
+    if name not in _PROMPT_GETTERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _PROMPT_GETTERS[name]()
+
+
+__all__ = [
+    "FACT_EXTRACTOR_PROMPT",
+    "FACT_EXTRACTOR_PROMPT_SHORT",
+    "FACT_VERIFICATION_PROMPT",
+    "FACT_VERIFICATION_BATCH_PROMPT",
+    "MAX_BATCH_FACTS",
+    "PROMPT_VARIANTS",
+    "select_prompt",
+    "select_prompt_variant",
+    "get_extractor_prompt_name",
+    "get_extractor_prompt",
+    "get_short_extractor_prompt",
+    "get_verification_prompt",
+    "get_verification_batch_prompt",
+    "format_candidate_facts",
+    "FACT_TAG_RE",
+    "NONE_FACT_RE",
+    "VERDICT_RE",
+    "parse_facts",
+    "parse_reasoned_verdicts",
+    "parse_verdicts",
+    "render",
+    "render_extractor",
+    "render_verification",
+    "render_verification_batch",
+    "to_messages"
+]
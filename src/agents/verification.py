@@ -2,91 +2,173 @@
 Fact verification agent that validates extracted facts using LLM.
 """
 
+import asyncio
+import hashlib
 import logging
-import sys
-import os
 import json
 import re
-from typing import Dict, Union
-from pydantic import BaseModel, Field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.output_parsers.json import parse_json_markdown
 
-from src.agents.prompts import FACT_VERIFICATION_PROMPT
+from src.agents import prompts
+
+# orjson is optional; its decode errors subclass ValueError like json's
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
-class VerificationResult(BaseModel):
-    """Result of fact verification."""
-    is_valid: bool = Field(description="Whether the fact is valid")
-    reason: str = Field(description="Reason for the verification decision")
-    verification_status: str = Field(description="Status string (verified/rejected/failed)")
+# Patterns for parsing verification output, compiled once at import
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_REASON_LINE_RE = re.compile(r'(?:reason|reasoning):\s*(.*?)(?:\n|$)', re.IGNORECASE)
+# Verdict keywords for free-form output
+_POSITIVE_INDICATORS = ("valid", "correct", "accurate", "supported", "verified", "true")
+_NEGATIVE_INDICATORS = ("not valid", "invalid", "incorrect", "inaccurate", "unsupported", "false", "not supported")
+# Numbers in fact and original text, with thousands separators and decimals
+_NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)*')
+
+# Allowed values of VerificationResult.verification_status
+VERIFICATION_STATUSES = ("verified", "rejected", "failed")
+
+@dataclass(slots=True, frozen=True)
+class VerificationResult:
+    """Result of fact verification.
+    
+    Frozen, so results shared through the agent's result cache cannot be
+    modified by one caller under another.
+    """
+    is_valid: bool  # Whether the fact is valid
+    reason: str  # Reason for the verification decision
+    verification_status: str  # Status string (verified/rejected/failed)
+    
+    def __post_init__(self):
+        if __debug__:
+            assert self.verification_status in VERIFICATION_STATUSES, \
+                f"Invalid verification status: {self.verification_status}"
+
+def _extract_json_objects(s: str) -> Iterator[str]:
+    """Yield the top-level {...} substrings of a string in a single pass.
+    
+    Tracks brace depth and skips braces inside string literals, so nested
+    objects are yielded whole.
+    
+    Args:
+        s: Text possibly containing JSON objects
+        
+    Yields:
+        Candidate JSON object substrings, in order
+    """
+    depth = 0
+    start = 0
+    in_string = False
+    escaped = False
+    for i, char in enumerate(s):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = depth > 0
+        elif char == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == '}' and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield s[start:i + 1]
+
+def _has_result_keys(parsed) -> bool:
+    """Check that parsed JSON is an object with the verification result keys."""
+    return isinstance(parsed, dict) and "is_valid" in parsed and "reason" in parsed
 
 def _parse_verification_output(output: str) -> Dict:
     """Parse the verification output from the LLM."""
-    try:
-        # Try to parse as XML first
-        is_valid_match = re.search(r'<is_valid>(.*?)</is_valid>', output, re.DOTALL)
-        reasoning_match = re.search(r'<reasoning>(.*?)</reasoning>', output, re.DOTALL)
-        
-        if is_valid_match and reasoning_match:
-            is_valid_str = is_valid_match.group(1).strip().lower()
-            is_valid = is_valid_str == "true" or is_valid_str == "yes"
-            reason = reasoning_match.group(1).strip()
-            
-            return {
-                "is_valid": is_valid,
-                "reason": reason,
-                "verification_status": "verified" if is_valid else "rejected"
-            }
-    except Exception as e:
-        logger.warning(f"XML parsing failed: {str(e)}")
+    # Try to parse as XML first; both tags are found in one scan
+    tag_verdict = prompts.parse_verdict_tags(output)
+    
+    if tag_verdict is not None:
+        is_valid, reason = tag_verdict
         
+        return {
+            "is_valid": is_valid,
+            "reason": reason,
+            "verification_status": "verified" if is_valid else "rejected"
+        }
+    
+    # A JSON verdict must carry the documented "is_valid" key; without it no
+    # JSON attempt can succeed, so skip the decode (and its exception) entirely
+    if '"is_valid"' not in output:
+        return _parse_free_form(output)
+        
+    # Try to parse as JSON
+    parsed = None
     try:
-        # Try to parse as JSON
-        # Find JSON block if wrapped in ``` or other markers
-        json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-        json_match = re.search(json_pattern, output)
-        
-        if json_match:
-            json_str = json_match.group(1)
-            parsed = json.loads(json_str)
+        # Only search for a wrapping ``` block when the output has a code fence
+        # and is not already a bare JSON object
+        has_fence = "```" in output and not output.lstrip().startswith('{')
+        json_match = _JSON_BLOCK_RE.search(output) if has_fence else None
+        # Parse the fenced block, or the entire response
+        parsed = _json_loads(json_match.group(1) if json_match else output)
+    except ValueError:
+        pass
+    
+    if not _has_result_keys(parsed):
+        # JSON embedded in prose: take the first object with the expected keys
+        parsed = None
+        for candidate in _extract_json_objects(output):
+            try:
+                obj = _json_loads(candidate)
+            except ValueError:
+                continue
+            if _has_result_keys(obj):
+                parsed = obj
+                break
+    
+    if parsed is not None:
+        # Normalize once here so callers can use the values as-is
+        is_valid = parsed["is_valid"]
+        if isinstance(is_valid, str):
+            is_valid = is_valid.strip().lower() in ("true", "yes")
         else:
-            # Try to parse the entire response as JSON
-            parsed = json.loads(output)
-            
-        if all(k in parsed for k in ["is_valid", "reason"]):
-            return {
-                "is_valid": parsed["is_valid"],
-                "reason": parsed["reason"],
-                "verification_status": "verified" if parsed["is_valid"] else "rejected"
-            }
-    except Exception as e:
-        logger.warning(f"JSON parsing failed: {str(e)}")
-        
-    # Fallback to simple parsing for free-form responses
-    is_valid = False
-    
-    # Check for positive verification keywords
-    positive_indicators = ["valid", "correct", "accurate", "supported", "verified", "true"]
-    negative_indicators = ["not valid", "invalid", "incorrect", "inaccurate", "unsupported", "false", "not supported"]
-    
-    # Check for negative indicators first (they're more specific)
-    if any(neg in output.lower() for neg in negative_indicators):
+            is_valid = bool(is_valid)
+        return {
+            "is_valid": is_valid,
+            "reason": str(parsed["reason"]),
+            "verification_status": "verified" if is_valid else "rejected"
+        }
+    logger.warning("JSON parsing failed: no verification object in output")
+    return _parse_free_form(output)
+
+def _parse_free_form(output: str) -> Dict:
+    """Parse a free-form verification response by keyword indicators."""
+    # Lowercase once; substring checks on it are cheaper than a regex scan
+    lowered = output.lower()
+    
+    # Check for negative indicators first (they're more specific),
+    # then for positive indicators
+    if any(neg in lowered for neg in _NEGATIVE_INDICATORS):
         is_valid = False
-    # Then check for positive indicators
-    elif any(pos in output.lower() for pos in positive_indicators):
-        is_valid = True
+    else:
+        is_valid = any(pos in lowered for pos in _POSITIVE_INDICATORS)
         
     # Extract a reason if possible
-    if "reason:" in output.lower():
-        reason_match = re.search(r'(?:reason|reasoning):\s*(.*?)(?:\n|$)', output, re.IGNORECASE)
+    if "reason:" in lowered:
+        reason_match = _REASON_LINE_RE.search(output)
         reason = reason_match.group(1).strip() if reason_match else output.strip()
     else:
         reason = output.strip()
     
-    logger.info(f"Used fallback parsing, determined is_valid={is_valid}")
+    logger.debug("Used fallback parsing, determined is_valid=%s", is_valid)
     
     return {
         "is_valid": is_valid,
@@ -94,16 +176,97 @@ def _parse_verification_output(output: str) -> Dict:
         "verification_status": "verified" if is_valid else "rejected"
     }
 
+def _group_batches(items: List[Tuple[str, str]]) -> List[List[int]]:
+    """Group item indices by original text, in batches of at most MAX_BATCH_FACTS.
+    
+    Args:
+        items: (fact_text, original_text) pairs
+        
+    Returns:
+        Lists of item indices sharing one original text
+    """
+    groups: Dict[str, List[int]] = {}
+    for i, (_, original_text) in enumerate(items):
+        groups.setdefault(original_text, []).append(i)
+    return [
+        indices[start:start + prompts.MAX_BATCH_FACTS]
+        for indices in groups.values()
+        for start in range(0, len(indices), prompts.MAX_BATCH_FACTS)
+    ]
+
+# Process-wide LLM shared by agents created without an explicit llm
+_SHARED_LLM: Optional[ChatOpenAI] = None
+_SHARED_LLM_LOCK = threading.Lock()
+
+def _get_shared_llm() -> ChatOpenAI:
+    """Get the process-wide shared LLM, loading src.llm_config on first use."""
+    global _SHARED_LLM
+    with _SHARED_LLM_LOCK:
+        if _SHARED_LLM is None:
+            from src.llm_config import default_llm
+            _SHARED_LLM = default_llm
+        return _SHARED_LLM
+
+def _prefilter_fact(fact: str, original_text: str) -> Optional[str]:
+    """Cheaply reject facts that can never pass verification.
+    
+    The verification criteria require at least one numerical data point and
+    every number preserved exactly from the original text, so a fact with no
+    number, or with a number the original does not contain, is invalid
+    whatever the LLM would say. Paraphrases are allowed, so the fact text
+    itself is not required to be a substring of the original.
+    
+    Args:
+        fact: The fact to verify
+        original_text: Original text to verify against
+        
+    Returns:
+        Rejection reason, or None if the fact needs LLM verification
+    """
+    fact_numbers = {n.replace(",", "") for n in _NUMBER_RE.findall(fact)}
+    if not fact_numbers:
+        return "Prefilter: fact contains no numerical data point"
+    
+    original_numbers = {n.replace(",", "") for n in _NUMBER_RE.findall(original_text)}
+    missing = sorted(fact_numbers - original_numbers)
+    if missing:
+        return f"Prefilter: numbers not found in original text: {', '.join(missing)}"
+    return None
+
+def _has_complete_verdict(output: str) -> bool:
+    """Check whether streamed single-fact output already holds a full verdict."""
+    if prompts.parse_verdict_tags(output) is not None:
+        return True
+    return any(_has_result_keys(_try_json(candidate)) for candidate in _extract_json_objects(output))
+
+def _try_json(text: str):
+    """Parse JSON text, returning None if it is not valid JSON."""
+    try:
+        return _json_loads(text)
+    except ValueError:
+        return None
+
+def _cache_key(fact: str, original_text: str) -> str:
+    """Hash a (fact, original text) pair into a short result cache key."""
+    return hashlib.blake2b((fact + "\x00" + original_text).encode("utf-8"), digest_size=16).hexdigest()
+
 class FactVerificationAgent:
     """Agent for verifying extracted facts against source text."""
     
-    def __init__(self, llm: ChatOpenAI):
+    # Maximum number of verification results kept in the result cache
+    CACHE_SIZE = 4096
+    
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
         """Initialize the verification agent.
         
         Args:
-            llm: Language model to use for verification
+            llm: Language model to use for verification. Defaults to the
+                process-wide shared LLM, so agents reuse one HTTP connection pool.
         """
-        self.llm = llm
+        self.llm = llm if llm is not None else _get_shared_llm()
+        logger.info(f"Initialized fact verification agent (result cache size {self.CACHE_SIZE})")
+        # LRU cache of verification results keyed by _cache_key(fact, original_text)
+        self._cache: "OrderedDict[str, VerificationResult]" = OrderedDict()
         
     async def verify_fact(
         self, 
@@ -123,28 +286,209 @@ class FactVerificationAgent:
         Returns:
             VerificationResult with decision and explanation
         """
+        results = await self.verify_facts_batch([(fact, source_text)])
+        return results[0]
+    
+    async def verify_facts_batch(self, items: List[Tuple[str, str]]) -> List[VerificationResult]:
+        """Verify many facts, reusing cached results for pairs seen before.
+        
+        Results of earlier verifications of the same (fact, original text)
+        pair are returned without calling the LLM; the rest are verified with
+        one LLM call per original text (see _verify_uncached). Failed
+        verifications are not cached so they are retried next time.
+        
+        Args:
+            items: (fact_text, original_text) pairs
+            
+        Returns:
+            VerificationResult for each item, in input order
+        """
+        results: List[Optional[VerificationResult]] = [None] * len(items)
+        keys = [_cache_key(fact, original_text) for fact, original_text in items]
+        
+        # Index of the first occurrence of each uncached pair; duplicates reuse its result
+        pending: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key in pending:
+                continue
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                results[i] = cached
+                continue
+            
+            # Facts that fail the cheap numeric checks are rejected without an LLM call
+            rejection = _prefilter_fact(*items[i])
+            if rejection:
+                results[i] = self._make_result(items[i][0], False, rejection)
+            else:
+                pending[key] = i
+        
+        if pending:
+            verified = await self._verify_uncached([items[i] for i in pending.values()])
+            verified_by_key = dict(zip(pending, verified))
+            for key, result in verified_by_key.items():
+                if result.verification_status != "failed":
+                    self._cache[key] = result
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            
+            # Project results back onto duplicates
+            for i, key in enumerate(keys):
+                if results[i] is None:
+                    results[i] = verified_by_key[key]
+        
+        return results
+    
+    async def _verify_uncached(self, items: List[Tuple[str, str]]) -> List[VerificationResult]:
+        """Verify many facts, using one LLM call per original text.
+        
+        Facts are grouped by their original text and each group is verified
+        with the batch verification prompt (at most MAX_BATCH_FACTS facts per
+        call), so the system prompt and the original text are sent once per
+        group instead of once per fact. Single facts, and facts the model gave
+        no verdict or no reasoning for, go through the single-fact prompt.
+        
+        Args:
+            items: (fact_text, original_text) pairs
+            
+        Returns:
+            VerificationResult for each item, in input order
+        """
+        results: List[Optional[VerificationResult]] = [None] * len(items)
+        
+        for batch in _group_batches(items):
+            original_text = items[batch[0]][1]
+            if len(batch) > 1:
+                verdicts = await self._verify_batch(
+                    [items[i][0] for i in batch], original_text
+                )
+                for position, i in enumerate(batch, 1):
+                    if position in verdicts:
+                        results[i] = self._make_result(items[i][0], *verdicts[position])
+            
+            # Single facts and facts missing from the batch verdicts
+            for i in batch:
+                if results[i] is None:
+                    results[i] = await self._verify_single(items[i][0], original_text)
+        
+        return results
+    
+    async def verify_many(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = 8
+    ) -> List[VerificationResult]:
+        """Verify many facts with concurrent LLM calls.
+        
+        Identical (fact, original text) pairs are verified once. Facts are
+        grouped by original text as in verify_facts_batch, and the groups are
+        verified concurrently, with at most `concurrency` groups in flight.
+        
+        Args:
+            items: (fact_text, original_text) pairs
+            concurrency: Maximum number of concurrent verification calls
+            
+        Returns:
+            VerificationResult for each item, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Verify each distinct (fact, original text) pair once
+        unique_items = list(dict.fromkeys(items))
+        batches = _group_batches(unique_items)
+        
+        async def verify_group(indices: List[int]) -> List[VerificationResult]:
+            async with semaphore:
+                return await self.verify_facts_batch([unique_items[i] for i in indices])
+        
+        group_results = await asyncio.gather(*(verify_group(indices) for indices in batches))
+        
+        results_by_item: Dict[Tuple[str, str], VerificationResult] = {}
+        for indices, batch_results in zip(batches, group_results):
+            for i, result in zip(indices, batch_results):
+                results_by_item[unique_items[i]] = result
+        return [results_by_item[item] for item in items]
+    
+    async def _verify_batch(self, facts: List[str], original_text: str) -> Dict[int, Tuple[bool, str]]:
+        """Verify the facts of one original text in a single LLM call.
+        
+        Args:
+            facts: Fact statements to verify, at most MAX_BATCH_FACTS
+            original_text: Original text the facts were extracted from
+            
+        Returns:
+            Mapping of 1-based fact position to (is_valid, reasoning) for the
+            verdicts that carry a reasoning; empty if the call failed
+        """
         try:
-            # Prepare prompt
-            prompt = FACT_VERIFICATION_PROMPT.format(
-                fact=fact,
-                source_text=source_text,
-                document_name=document_name,
-                source_url=source_url
+            messages = prompts.to_messages(prompts.render_verification_batch(facts, original_text))
+            output = await self._stream_until(
+                messages,
+                lambda buffer: len(prompts.parse_verdicts(buffer)) >= len(facts)
             )
+            return prompts.parse_reasoned_verdicts(output)
+        except Exception as e:
+            logger.exception(f"Batch verification failed: {str(e)}")
+            return {}
+    
+    async def _verify_single(self, fact: str, original_text: str) -> VerificationResult:
+        """Verify one fact with the single-fact verification prompt.
+        
+        Args:
+            fact: The fact to verify
+            original_text: Original text to verify against
             
-            # Get verification from LLM
-            output = await self.llm.agenerate(prompt)
+        Returns:
+            VerificationResult with decision and explanation
+        """
+        try:
+            # The system prompt is a constant string; only the human turn is rendered
+            messages = prompts.to_messages(prompts.render_verification(fact, original_text))
+            
+            # Get verification from LLM, stopping as soon as the verdict is complete
+            output = await self._stream_until(messages, _has_complete_verdict)
             parsed_output = _parse_verification_output(output)
             
-            # Create result
-            result = VerificationResult(
-                is_valid=bool(parsed_output["is_valid"]),
-                reason=str(parsed_output["reason"]),
-                verification_status=parsed_output["verification_status"]
+            return self._make_result(fact, parsed_output["is_valid"], parsed_output["reason"])
+            
+        except Exception as e:
+            logger.exception(f"Verification failed: {str(e)}")
+            return VerificationResult(
+                is_valid=False,
+                reason=f"Verification failed: {str(e)}",
+                verification_status="failed"
             )
+    
+    async def _stream_until(self, messages: List, is_complete: Callable[[str], bool]) -> str:
+        """Stream an LLM response until it is complete enough to parse.
+        
+        The completeness check only runs when a chunk contains a closing '>'
+        or '}', since a verdict can only complete on one of those.
+        
+        Args:
+            messages: Prompt messages
+            is_complete: Predicate on the accumulated output
             
-            # Log result
-            logger.info(
+        Returns:
+            The accumulated output, possibly cut short after the verdict
+        """
+        parts = []
+        async for chunk in self.llm.astream(messages):
+            content = chunk.content
+            parts.append(content)
+            if ('>' in content or '}' in content) and is_complete("".join(parts)):
+                break
+        return "".join(parts)
+    
+    @staticmethod
+    def _make_result(fact: str, is_valid: bool, reason: str) -> VerificationResult:
+        """Create and log the verification result of a fact."""
+        result = VerificationResult(is_valid, reason, "verified" if is_valid else "rejected")
+        
+        # Log result; the truncated fact is only built when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
                 "Verification result for fact: %s\n"
                 "Status: %s\n"
                 "Reason: %s",
@@ -152,13 +496,5 @@ class FactVerificationAgent:
                 result.verification_status,
                 result.reason
             )
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Verification failed: {str(e)}")
-            return VerificationResult(
-                is_valid=False,
-                reason=f"Verification failed: {str(e)}",
-                verification_status="failed"
-            ) 
\ No newline at end of file
+        
+        return result
@@ -23,6 +23,24 @@ DEFAULT_SETTINGS = {
     # Maximum number of chunks to process concurrently
     "max_concurrent_chunks": 5,
     
+    # Maximum number of fact verification requests in flight at once
+    "max_concurrent_verifications": 8,
+    
+    # Verify the facts of a chunk with one batch prompt instead of one request per fact
+    "batch_verification": True,
+    
+    # Skip the extraction request for chunks with no digits or capitalized words
+    "skip_factless_chunks": True,
+    
+    # Maximum number of LLM requests in flight across extraction and verification
+    "max_concurrent_llm_requests": 16,
+    
+    # LLM backend: "ollama" (OpenAI-compatible HTTP server, see src/llm_config.py)
+    # or "vllm" (in-process vLLM engine with continuous batching, see src/vllm_backend.py)
+    "llm_backend": "ollama",
+    "vllm_model": "google/gemma-3-4b-it",
+    "vllm_max_tokens": 2048,
+    
     # Rate limiting for API calls (requests per minute)
     "max_requests_per_minute": 60,
     
@@ -30,10 +48,18 @@ DEFAULT_SETTINGS = {
     "chunk_size": 3000,
     "chunk_overlap": 200,
     
+    # Extractor prompt variant: "auto" picks the short prompt for small local models,
+    # "full" or "short" force one (see src/agents/prompts.py PROMPT_VARIANTS)
+    "extractor_prompt_variant": "auto",
+    
     # Error retry settings
     "max_retries": 3,
     "retry_delay": 5,  # seconds
     
+    # Cache of LLM extraction/verification responses keyed by content hash
+    "llm_cache_enabled": True,
+    "llm_cache_path": "src/data/llm_cache.sqlite",
+    
     # Repository paths
     "chunks_excel_path": "src/data/all_chunks.xlsx",
     "facts_excel_path": "src/data/all_facts.xlsx",
@@ -55,6 +81,27 @@ def load_config() -> Dict[str, Any]:
         if "MAX_CONCURRENT_CHUNKS" in os.environ:
             config["max_concurrent_chunks"] = int(os.environ["MAX_CONCURRENT_CHUNKS"])
             
+        if "MAX_CONCURRENT_VERIFICATIONS" in os.environ:
+            config["max_concurrent_verifications"] = int(os.environ["MAX_CONCURRENT_VERIFICATIONS"])
+            
+        if "MAX_CONCURRENT_LLM_REQUESTS" in os.environ:
+            config["max_concurrent_llm_requests"] = int(os.environ["MAX_CONCURRENT_LLM_REQUESTS"])
+            
+        if "BATCH_VERIFICATION" in os.environ:
+            config["batch_verification"] = os.environ["BATCH_VERIFICATION"].lower() in ("1", "true", "yes")
+            
+        if "SKIP_FACTLESS_CHUNKS" in os.environ:
+            config["skip_factless_chunks"] = os.environ["SKIP_FACTLESS_CHUNKS"].lower() in ("1", "true", "yes")
+            
+        if "LLM_BACKEND" in os.environ:
+            config["llm_backend"] = os.environ["LLM_BACKEND"].lower()
+            
+        if "VLLM_MODEL" in os.environ:
+            config["vllm_model"] = os.environ["VLLM_MODEL"]
+            
+        if "VLLM_MAX_TOKENS" in os.environ:
+            config["vllm_max_tokens"] = int(os.environ["VLLM_MAX_TOKENS"])
+            
         if "MAX_REQUESTS_PER_MINUTE" in os.environ:
             config["max_requests_per_minute"] = int(os.environ["MAX_REQUESTS_PER_MINUTE"])
             
@@ -70,6 +117,15 @@ def load_config() -> Dict[str, Any]:
         if "RETRY_DELAY" in os.environ:
             config["retry_delay"] = float(os.environ["RETRY_DELAY"])
             
+        if "EXTRACTOR_PROMPT_VARIANT" in os.environ:
+            config["extractor_prompt_variant"] = os.environ["EXTRACTOR_PROMPT_VARIANT"]
+            
+        if "LLM_CACHE_ENABLED" in os.environ:
+            config["llm_cache_enabled"] = os.environ["LLM_CACHE_ENABLED"].lower() in ("1", "true", "yes")
+            
+        if "LLM_CACHE_PATH" in os.environ:
+            config["llm_cache_path"] = os.environ["LLM_CACHE_PATH"]
+            
         if "CHUNKS_EXCEL_PATH" in os.environ:
             config["chunks_excel_path"] = os.environ["CHUNKS_EXCEL_PATH"]
             
@@ -89,6 +145,18 @@ def load_config() -> Dict[str, Any]:
     elif config["max_concurrent_chunks"] > 20:
         logger.warning(f"max_concurrent_chunks value ({config['max_concurrent_chunks']}) is very high. This might cause performance issues.")
     
+    if config["max_concurrent_verifications"] < 1:
+        logger.warning(f"Invalid max_concurrent_verifications ({config['max_concurrent_verifications']}), setting to 1")
+        config["max_concurrent_verifications"] = 1
+    
+    if config["max_concurrent_llm_requests"] < 1:
+        logger.warning(f"Invalid max_concurrent_llm_requests ({config['max_concurrent_llm_requests']}), setting to 1")
+        config["max_concurrent_llm_requests"] = 1
+    
+    if config["llm_backend"] not in ("ollama", "vllm"):
+        logger.warning(f"Unknown llm_backend ({config['llm_backend']}), using ollama")
+        config["llm_backend"] = "ollama"
+    
     logger.info(f"Loaded configuration: max_concurrent_chunks={config['max_concurrent_chunks']}")
     
     return config
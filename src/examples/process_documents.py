@@ -5,10 +5,13 @@ Example script demonstrating document processing functionality.
 import asyncio
 import logging
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict
 
-from src.fact_extract.utils.document_loader import DocumentLoader
-from src.fact_extract.tests.test_document_processors import (
+from src.agents import prompts
+from src.agents.verification import FactVerificationAgent
+from src.config import config
+from src.utils.document_loader import DocumentLoader
+from src.tests.test_document_processors import (
     setup_module,
     teardown_module,
     TEST_DATA_DIR
@@ -21,31 +24,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def process_documents(file_paths: List[str]) -> List[Dict[str, str]]:
-    """Process multiple documents and extract their content.
+# Bound on sections/facts waiting between pipeline stages
+QUEUE_SIZE = 16
+
+async def process_documents(
+    file_paths: List[str],
+    llm: Any = None,
+    extract_workers: int = 4,
+    load_workers: int = 4
+) -> List[Dict[str, Any]]:
+    """Load, extract and verify documents in a bounded producer/consumer pipeline.
+    
+    The loaders, extractors and verifier run concurrently, linked by queues of
+    at most QUEUE_SIZE items, so only a queue's worth of sections is held in
+    memory between stages and file I/O overlaps with LLM calls. Each stage
+    signals the next one to stop with a None sentinel.
     
     Args:
         file_paths: List of paths to documents
+        llm: Chat model used for extraction and verification (defaults to the
+            configured default LLM)
+        extract_workers: Number of concurrent extraction workers
+        load_workers: Number of documents loaded at once
         
     Returns:
-        List of dictionaries containing extracted content
+        List of dictionaries containing extracted content and verified facts,
+        in document/section order
     """
+    if llm is None:
+        from src.llm_config import default_llm
+        llm = default_llm
+    
     loader = DocumentLoader()
+    verifier = FactVerificationAgent(llm)
+    # Same extractor prompt variant as the workflow nodes
+    prompt_name = prompts.get_extractor_prompt_name(
+        config["extractor_prompt_variant"], getattr(llm, "model_name", "")
+    )
+    path_q: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(file_paths):
+        path_q.put_nowait(item)
+    load_q: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    verify_q: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    results: List[tuple] = []
+    
+    async def load_worker() -> None:
+        """Load queued documents off the event loop and queue their sections."""
+        while not path_q.empty():
+            doc_index, path = path_q.get_nowait()
+            try:
+                sections = await asyncio.to_thread(loader.process_document, path)
+            except Exception as e:
+                logger.error(f"Error loading {path}: {str(e)}")
+                continue
+            for section_index, section in enumerate(sections):
+                await load_q.put(((doc_index, section_index), section))
+    
+    async def load_stage() -> None:
+        """Load up to load_workers documents at once."""
+        try:
+            await asyncio.gather(*(load_worker() for _ in range(load_workers)))
+        finally:
+            for _ in range(extract_workers):
+                await load_q.put(None)
+    
+    async def extract_stage() -> None:
+        """Extract candidate facts from queued sections."""
+        while (item := await load_q.get()) is not None:
+            order, section = item
+            try:
+                response = await llm.ainvoke(prompts.render(section["content"], prompt_name))
+                facts = prompts.parse_facts(response.content)
+            except Exception as e:
+                logger.error(f"Error extracting facts from {section['source']}: {str(e)}")
+                facts = []
+            await verify_q.put((order, section, facts))
+    
+    async def verify_stage() -> None:
+        """Verify candidate facts and collect the results."""
+        while (item := await verify_q.get()) is not None:
+            order, section, facts = item
+            verdicts = await verifier.verify_facts_batch(
+                [(fact, section["content"]) for fact in facts]
+            )
+            results.append((order, {
+                **section,
+                "facts": [
+                    {"statement": fact, "is_valid": verdict.is_valid, "reason": verdict.reason}
+                    for fact, verdict in zip(facts, verdicts)
+                ]
+            }))
+    
+    async def run_extractors() -> None:
+        await asyncio.gather(*(extract_stage() for _ in range(extract_workers)))
+        await verify_q.put(None)
+    
+    await asyncio.gather(load_stage(), run_extractors(), verify_stage())
     
-    # Process all documents
-    results = await loader.process_documents(file_paths)
+    results.sort(key=lambda pair: pair[0])
+    documents = [result for _, result in results]
     
     # Print results
     print("\nProcessed Documents:")
     print("=" * 50)
     
-    for result in results:
+    for result in documents:
+        valid_facts = sum(1 for fact in result["facts"] if fact["is_valid"])
         print(f"\nTitle: {result['title']}")
         print(f"Source: {result['source']}")
         print(f"Content preview: {result['content'][:100]}...")
+        print(f"Facts: {valid_facts} verified of {len(result['facts'])} extracted")
         print("-" * 50)
         
-    return results
+    return documents
 
 async def main():
     """Main entry point."""
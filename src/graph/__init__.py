@@ -8,7 +8,9 @@ from src.graph.nodes import (
     chunker_node,
     extractor_node,
     validator_node,
+    extract_and_verify_node,
     create_workflow,
+    enable_eager_tasks,
     parallel_process_chunks
 )
 
@@ -18,6 +20,8 @@ __all__ = [
     'chunker_node',
     'extractor_node',
     'validator_node',
+    'extract_and_verify_node',
     'create_workflow',
+    'enable_eager_tasks',
     'parallel_process_chunks'
 ] 
\ No newline at end of file
@@ -3,19 +3,19 @@ LangGraph nodes for the fact extraction workflow using v0.2.28+ patterns.
 Each node represents a discrete step in our processing pipeline.
 """
 
-from typing import Dict, Any, Tuple, List, cast
-from operator import itemgetter
+from typing import Dict, Any, Tuple, List, Optional
+from functools import lru_cache
 from datetime import datetime
-from uuid import UUID
 import json
 import asyncio
 import os
+import re
 import hashlib
+import time
+import weakref
 
 from langgraph.graph import END, StateGraph
-from langgraph.graph.message import MessageGraph
-from langchain_core.messages import HumanMessage
-from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.messages import AIMessage
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.documents import Document
 
@@ -24,121 +24,333 @@ from src.models.state import (
     WorkflowStateDict,
     TextChunkDict,
     FactDict,
-    MemoryDict,
-    create_initial_state,
     ProcessingState
 )
-from src.agents import FACT_EXTRACTOR_PROMPT, FACT_VERIFICATION_PROMPT
+from src.agents.prompts import (
+    FACT_TAG_RE,
+    MAX_BATCH_FACTS,
+    get_extractor_prompt_name,
+    parse_facts,
+    parse_verdict_tags,
+    parse_reasoned_verdicts,
+    render as render_extractor_prompt,
+    render_verification,
+    render_verification_batch,
+    to_messages
+)
 from src.storage.chunk_repository import ChunkRepository
 from src.storage.fact_repository import FactRepository, RejectedFactRepository
-from src.tools.submission import submit_fact
+from src.storage.llm_cache import LLMCache
 from src.config import config
 
 import logging
 logger = logging.getLogger(__name__)
 
+# orjson is optional; its decode errors subclass ValueError like json's
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Get the configured max concurrent chunks
 MAX_CONCURRENT_CHUNKS = config["max_concurrent_chunks"]
 logger.info(f"Using maximum concurrent chunks: {MAX_CONCURRENT_CHUNKS}")
 
+# Cap on fact verification requests in flight, to respect provider rate limits
+MAX_CONCURRENT_VERIFICATIONS = config["max_concurrent_verifications"]
+
+# Verify facts from the same chunk with one batch prompt, see _verification_groups()
+BATCH_VERIFICATION = config["batch_verification"]
+
+# Skip extraction for chunks that cannot hold a fact, see _is_factless()
+SKIP_FACTLESS_CHUNKS = config["skip_factless_chunks"]
+
+# Cap on LLM requests in flight across all nodes; rate-limit retries are left
+# to the OpenAI client's own backoff (max_retries in src/llm_config.py)
+MAX_CONCURRENT_LLM_REQUESTS = config["max_concurrent_llm_requests"]
+
 # Initialize repositories and LLM as module-level variables
 chunk_repo = ChunkRepository()
 fact_repo = FactRepository()
 rejected_fact_repo = RejectedFactRepository()
 llm = default_llm
+llm_cache = LLMCache(config["llm_cache_path"]) if config["llm_cache_enabled"] else None
+
+# Extractor prompt for the configured model; small local models get the short form
+EXTRACTOR_PROMPT_NAME = get_extractor_prompt_name(config["extractor_prompt_variant"], getattr(llm, "model_name", ""))
+logger.info(f"Using {EXTRACTOR_PROMPT_NAME} extractor prompt")
+
+# Numbered-list fallback for extraction output without fact tags ("1. fact")
+NUMBERED_FACT_RE = re.compile(r'(?:^|\n)\s*(\d+)[.:\)]\s*(.+?)(?=(?:^|\n)\s*\d+[.:\)]|$)', re.DOTALL)
+
+# Verification response formats, compiled once at import (see _parse_verdict)
+VALIDITY_RE = re.compile(r'<validity>(.*?)</validity>', re.DOTALL)
+EXPLANATION_RE = re.compile(r'<explanation>(.*?)</explanation>', re.DOTALL)
+VALID_LINE_RE = re.compile(r'Valid:\s*(.*?)(?:\n|$)', re.IGNORECASE)
+INVALID_LINE_RE = re.compile(r'Invalid:\s*(.*?)(?:\n|$)', re.IGNORECASE)
+REASON_LINE_RE = re.compile(r'Reason(?:ing)?:\s*(.*?)(?:\n|$)', re.IGNORECASE)
+
+# Anything a fact could be built on: a number or a capitalized word (names,
+# acronyms, sentence starts). Chunks without one are boilerplate such as
+# separators, page furniture or lowercase tables of contents.
+FACT_HINT_RE = re.compile(r'\d|\b[A-Z]')
+
+# Response recorded for facts the repository already holds; they were
+# verified when first stored, so they are not sent to the LLM again
+STORED_FACT_RESPONSE = "<is_valid>true</is_valid><reasoning>Already verified and stored</reasoning>"
+
+# Word-based splitter for chunker_node; its settings are constant, so build it once
+CHUNKER_TEXT_SPLITTER = RecursiveCharacterTextSplitter(
+    # Separators in order of priority; "" splits space-free runs as a last resort
+    separators=["\n\n", "\n", ". ", " ", ""],
+    chunk_size=750,  # Target 750 words per chunk
+    chunk_overlap=50,  # 50 words overlap
+    length_function=lambda x: len(x.split()),  # Word-based length function
+    add_start_index=True,
+    strip_whitespace=True
+)
+
+@lru_cache(maxsize=1)
+def get_document_splitter() -> RecursiveCharacterTextSplitter:
+    """Get the token-based splitter used by process_document.
+    
+    Built on first use rather than at import, since loading the tiktoken
+    encoding may need to download it.
+    
+    Returns:
+        Shared RecursiveCharacterTextSplitter configured from config
+    """
+    return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        chunk_size=config["chunk_size"],
+        chunk_overlap=config["chunk_overlap"],
+        separators=["\n\n", "\n", ". ", " ", ""],
+        is_separator_regex=False,
+    )
+
+
+# Inputs longer than this (in characters) are split in a worker thread so the
+# splitting doesn't stall the event loop; shorter ones aren't worth the handoff
+SPLIT_OFF_LOOP_THRESHOLD = 50_000
+
+def _split_words(text: str, metadata: Dict[str, Any]) -> List[Document]:
+    """Split text with CHUNKER_TEXT_SPLITTER."""
+    return CHUNKER_TEXT_SPLITTER.split_documents([Document(page_content=text, metadata=metadata)])
+
+def _split_tokens(text: str, metadata: Dict[str, Any]) -> List[Document]:
+    """Split text with the token-based document splitter."""
+    return get_document_splitter().create_documents([text], metadatas=[metadata])
+
+async def _split_off_loop(split_fn, text: str, metadata: Dict[str, Any]) -> List[Document]:
+    """Run a split function, off the event loop for large inputs.
+    
+    Large inputs are split in a worker thread. A process pool would need to
+    fork a process that already runs threads (repository writes, HTTP
+    clients, the LLM cache), which can deadlock the child, and a spawned
+    worker would re-import the whole workflow to split one document.
+    
+    Args:
+        split_fn: _split_words or _split_tokens
+        text: Text to split
+        metadata: Metadata for the resulting documents
+        
+    Returns:
+        Split documents
+    """
+    if len(text) <= SPLIT_OFF_LOOP_THRESHOLD:
+        return split_fn(text, metadata)
+    return await asyncio.to_thread(split_fn, text, metadata)
+
+
+def _iter_chunks(documents: List[Document]):
+    """Yield (index, document, text) for each non-empty split document.
+    
+    Both splitters strip whitespace (strip_whitespace defaults to True), so
+    the text is used as is rather than stripped again. Indices are positions
+    in the split, so they stay stable when empty chunks are dropped.
+    """
+    for i, doc in enumerate(documents):
+        text = doc.page_content
+        if text:
+            yield i, doc, text
+
+
+# One request semaphore per event loop, since asyncio semaphores are loop-bound
+_LLM_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Get the LLM request semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(MAX_CONCURRENT_LLM_REQUESTS)
+    return semaphore
+
+
+# Requests currently waiting on the LLM per event loop, by cache key. Identical
+# chunks (boilerplate repeated within or across documents) and repeated
+# verifications that arrive while the first request is still running wait for
+# its response instead of sending the same prompt again.
+_IN_FLIGHT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = weakref.WeakKeyDictionary()
+
+
+def _in_flight_requests() -> Dict[str, asyncio.Future]:
+    """Get the in-flight LLM requests of the running event loop."""
+    loop = asyncio.get_running_loop()
+    in_flight = _IN_FLIGHT.get(loop)
+    if in_flight is None:
+        in_flight = _IN_FLIGHT[loop] = {}
+    return in_flight
+
+
+async def _ainvoke(messages, model=None):
+    """Call the LLM while holding a slot of the shared request semaphore.
+    
+    Args:
+        messages: Prompt messages
+        model: Chat model to call instead of the module's llm
+    """
+    async with _llm_semaphore():
+        return await (model or llm).ainvoke(messages)
+
+
+def _metrics(state: Optional[WorkflowStateDict]) -> Dict[str, Any]:
+    """Get the performance metrics to count into; callers without a state get a throwaway dict."""
+    return state["memory"]["performance_metrics"] if state is not None else {}
+
+
+async def _invoke_cached(key: str, invoke, state: Optional[WorkflowStateDict]) -> str:
+    """Return the cached response text for key, or call the LLM and cache it.
+    
+    Keys are content-addressed (prompt inputs, not document names), so the
+    same chunk or fact seen in another document is answered from the cache,
+    and a request for a key that is already in flight shares its response.
+    
+    Args:
+        key: Cache key from LLMCache.make_key()
+        invoke: Zero-argument coroutine function that calls the LLM
+        state: Workflow state, for the cache hit/miss counters, or None
+        
+    Returns:
+        Response text
+    """
+    metrics = _metrics(state)
+    if llm_cache is not None:
+        cached = await asyncio.to_thread(llm_cache.get, key)
+        if cached is not None:
+            metrics["llm_cache_hits"] = metrics.get("llm_cache_hits", 0) + 1
+            return cached
+    
+    in_flight = _in_flight_requests()
+    pending = in_flight.get(key)
+    if pending is not None:
+        metrics["llm_requests_shared"] = metrics.get("llm_requests_shared", 0) + 1
+        return await asyncio.shield(pending)
+    
+    if llm_cache is not None:
+        metrics["llm_cache_misses"] = metrics.get("llm_cache_misses", 0) + 1
+    
+    future = in_flight[key] = asyncio.get_running_loop().create_future()
+    try:
+        response = await invoke()
+    except asyncio.CancelledError:
+        del in_flight[key]
+        future.cancel()
+        raise
+    except Exception as e:
+        del in_flight[key]
+        future.set_exception(e)
+        # Mark the exception as retrieved in case nobody else was waiting
+        future.exception()
+        raise
+    
+    # Release waiters first; the key stays in flight until the cache write
+    # lands so a request arriving meanwhile doesn't miss both and re-call
+    future.set_result(response.content)
+    try:
+        if llm_cache is not None:
+            await asyncio.to_thread(llm_cache.set, key, response.content)
+    finally:
+        del in_flight[key]
+    return response.content
+
+
+def _ensure_state(state: WorkflowStateDict) -> None:
+    """Add the fact, error and memory fields a node needs if they are missing.
+    
+    States from create_initial_state() already have them, so the default
+    memory is only built for states assembled by hand.
+    """
+    state.setdefault("extracted_facts", [])
+    state.setdefault("errors", [])
+    if "memory" not in state:
+        state["memory"] = {
+            "document_stats": {},
+            "fact_patterns": [],
+            "entity_mentions": {},
+            "recent_facts": [],
+            "error_counts": {},
+            "performance_metrics": {
+                "start_time": datetime.now().isoformat(),
+                "chunks_processed": 0,
+                "facts_extracted": 0,
+                "errors_encountered": 0
+            }
+        }
+
 
 async def chunker_node(state: WorkflowStateDict) -> WorkflowStateDict:
     """Split input text into chunks and manage chunk storage."""
-    print("\n" + "="*80)
-    print("CHUNKER NODE START")
-    print("="*80)
+    logger.debug("Chunker node start")
     
     try:
-        # Initialize state fields if not present
-        if "extracted_facts" not in state:
-            state["extracted_facts"] = []
-        if "errors" not in state:
-            state["errors"] = []
-        if "memory" not in state:
-            state["memory"] = {
-                "document_stats": {},
-                "fact_patterns": [],
-                "entity_mentions": {},
-                "recent_facts": [],
-                "error_counts": {},
-                "performance_metrics": {
-                    "start_time": datetime.now().isoformat(),
-                    "chunks_processed": 0,
-                    "facts_extracted": 0,
-                    "errors_encountered": 0
-                }
-            }
+        _ensure_state(state)
         
-        print("\nInput:")
-        print("-"*40)
-        print(f"Document: {state['document_name']}")
-        print(f"Source URL: {state['source_url']}")
-        print(f"Input text length: {len(state['input_text'])} characters")
-        print(f"First 200 chars: {state['input_text'][:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Chunking %s (source %s): %d characters, starts %r",
+                         state['document_name'], state['source_url'],
+                         len(state['input_text']), state['input_text'][:200])
         
         # Generate a document hash for duplicate detection
-        document_hash = hashlib.md5(state['input_text'].encode()).hexdigest()
-        print(f"Document hash: {document_hash}")
+        document_hash = ChunkRepository.document_hash(state['input_text'])
+        logger.debug("Document hash: %s", document_hash)
         
         # Check if document has already been processed
-        existing_chunks = chunk_repo.get_all_chunks()
-        for chunk in existing_chunks:
-            if chunk.get("document_hash") == document_hash:
-                print(f"Document with hash {document_hash} has already been processed.")
-                print("Skipping processing and marking as complete.")
-                state["is_complete"] = True
-                state["chunks"] = []
-                return state
-        
-        print("\nChunking Configuration:")
-        print("-"*40)
-        print("Chunk size: 750 words")
-        print("Chunk overlap: 50 words")
-        print("Using: RecursiveCharacterTextSplitter")
-        print("Separators: [\\n\\n, \\n, . , ]")
-        
-        # Create text splitter with word-based chunking
-        text_splitter = RecursiveCharacterTextSplitter(
-            separators=["\n\n", "\n", ". ", " "],  # Separators in order of priority
-            chunk_size=750,  # Target 750 words per chunk
-            chunk_overlap=50,  # 50 words overlap
-            length_function=lambda x: len(x.split()),  # Word-based length function
-            add_start_index=True,
-            strip_whitespace=True
-        )
+        if chunk_repo.has_document_hash(document_hash):
+            logger.info("Document with hash %s has already been processed, marking as complete", document_hash)
+            state["is_complete"] = True
+            state["chunks"] = []
+            return state
         
-        # Create a proper Document object
-        initial_doc = Document(
-            page_content=state["input_text"],
-            metadata={
+        # Split the document (in a worker thread for large inputs)
+        text_splitter = await _split_off_loop(
+            _split_words,
+            state["input_text"],
+            {
                 "source": state["document_name"],
                 "url": state["source_url"]
             }
         )
         
-        # Split the document
-        text_splitter = text_splitter.split_documents([initial_doc])
-        
         # Initialize tracking variables
         new_chunks = []
+        pending_rows = []
         skipped_chunks = 0
         
-        # Process each chunk
-        for i, doc in enumerate(text_splitter):
-            chunk = doc.page_content
-            if not chunk.strip():
-                continue
-                
+        # Load the document's processed chunk hashes once for set lookups
+        processed_hashes = chunk_repo.get_processed_hashes(state["document_name"])
+        
+        # One timestamp for the whole batch of chunks
+        now_iso = datetime.now().isoformat()
+        
+        # Process each non-empty chunk
+        for i, doc, chunk in _iter_chunks(text_splitter):
             # Count words in chunk
             word_count = len(chunk.split())
             
             chunk_data: TextChunkDict = {
-                "content": chunk.strip(),
+                "content": chunk,
                 "index": i,
                 "metadata": {
                     "word_count": word_count,
@@ -146,19 +358,20 @@ async def chunker_node(state: WorkflowStateDict) -> WorkflowStateDict:
                     "start_index": doc.metadata.get("start_index", 0),
                     "source": doc.metadata.get("source", ""),
                     "url": doc.metadata.get("url", ""),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "document_hash": document_hash
                 }
             }
             
             # Check if chunk has already been processed successfully
-            if chunk_repo.is_chunk_processed(chunk_data, state["document_name"]):
-                print(f"Chunk {i} has already been processed successfully, skipping...")
+            chunk_hash = ChunkRepository.content_hash(chunk)
+            if chunk_hash in processed_hashes:
+                logger.debug("Chunk %d has already been processed successfully, skipping", i)
                 skipped_chunks += 1
                 continue
                 
-            # Store new chunk as pending
-            chunk_repo.store_chunk({
+            # Queue new chunk to be stored as pending
+            pending_rows.append({
                 "timestamp": chunk_data["metadata"]["timestamp"],
                 "document_name": state["document_name"],
                 "source_url": state["source_url"],
@@ -169,6 +382,7 @@ async def chunker_node(state: WorkflowStateDict) -> WorkflowStateDict:
                 "error_message": None,
                 "processing_time": None,
                 "document_hash": document_hash,
+                "content_hash": chunk_hash,
                 "all_facts_extracted": False,  # Initialize as false
                 "metadata": chunk_data["metadata"]
             })
@@ -176,41 +390,35 @@ async def chunker_node(state: WorkflowStateDict) -> WorkflowStateDict:
             # Add chunk to state for processing
             new_chunks.append(chunk_data)
         
+        # Store all new chunks with a single write, off the event loop
+        await asyncio.to_thread(chunk_repo.store_chunks, pending_rows)
+        
         # Update state
         state["chunks"] = new_chunks
         state["current_chunk_index"] = 0
         state["is_complete"] = len(new_chunks) == 0
         
         # Update memory metrics
-        state["memory"]["performance_metrics"]["chunks_processed"] = len(new_chunks)
-        state["memory"]["performance_metrics"]["chunks_skipped"] = skipped_chunks
-        
-        print("\nChunking Results:")
-        print("-"*40)
-        print(f"Total chunks created: {len(text_splitter)}")
-        print(f"Empty chunks filtered: {len(text_splitter) - len(new_chunks) - skipped_chunks}")
-        print(f"Skipped (already processed): {skipped_chunks}")
-        print(f"New chunks to process: {len(new_chunks)}")
-        
-        print("\nChunk Details:")
-        print("-"*40)
-        for i, chunk in enumerate(new_chunks):
-            print(f"\nChunk {i}:")
-            print(f"Word count: {chunk['metadata']['word_count']} words")
-            print(f"Length: {len(chunk['content'])} chars")
-            print(f"Start index: {chunk['metadata']['start_index']}")
-            print(f"First 100 chars: {chunk['content'][:100]}...")
-        
-        print("\nCHUNKER NODE COMPLETE")
-        print("="*80)
+        metrics = state["memory"]["performance_metrics"]
+        metrics["chunks_processed"] = len(new_chunks)
+        metrics["chunks_skipped"] = skipped_chunks
+        
+        logger.info("Chunking results: %d chunks created, %d empty filtered, %d already processed, %d new",
+                    len(text_splitter), len(text_splitter) - len(new_chunks) - skipped_chunks,
+                    skipped_chunks, len(new_chunks))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, chunk in enumerate(new_chunks):
+                logger.debug("Chunk %d: %d words, %d chars, start index %s, starts %r",
+                             i, chunk['metadata']['word_count'], len(chunk['content']),
+                             chunk['metadata']['start_index'], chunk['content'][:100])
+
+        logger.debug("Chunker node complete")
         
         return state
         
     except Exception as e:
         error_msg = f"Error in chunking: {str(e)}"
-        print("\nERROR IN CHUNKER NODE:")
-        print("-"*40)
-        print(error_msg)
+        logger.error(error_msg)
         
         # Initialize errors list if not present
         if "errors" not in state:
@@ -226,209 +434,593 @@ async def chunker_node(state: WorkflowStateDict) -> WorkflowStateDict:
         return state
 
 
+def _make_fact(
+    statement: str,
+    chunk: TextChunkDict,
+    document_name: str,
+    source_url: str,
+    timestamp: str
+) -> FactDict:
+    """Create a pending fact record for a statement extracted from a chunk."""
+    return {
+        "statement": statement,
+        "document_name": document_name,
+        "source_url": source_url,
+        "original_text": chunk["content"],
+        "chunk_index": chunk["index"],
+        "source_chunk": chunk["index"],
+        "timestamp": timestamp,
+        "status": "pending",
+        "verification_status": "pending"
+    }
+
+
+def _parse_extracted_facts(
+    content: str,
+    chunk: TextChunkDict,
+    document_name: str,
+    source_url: str,
+    timestamp: str = None
+) -> List[FactDict]:
+    """Parse candidate facts from an extraction response.
+    
+    Reads <fact>...</fact> and numbered <fact N>...</fact N> tags, skipping
+    "None" facts; a response without any fact tags is treated as one
+    statement per substantial line.
+    
+    Args:
+        content: LLM response text
+        chunk: Chunk the facts were extracted from
+        document_name: Name of the document
+        source_url: URL of the source document
+        timestamp: Extraction timestamp shared by the node's facts;
+            defaults to the current time
+        
+    Returns:
+        List of pending fact records
+    """
+    if timestamp is None:
+        timestamp = datetime.now().isoformat()
+    
+    # <fact>content</fact> and numbered <fact 1>content</fact 1> tags in one pass
+    statements = parse_facts(content)
+    
+    # Free-form responses without any fact tags: one statement per substantial line
+    if not statements and content.strip() and not FACT_TAG_RE.search(content):
+        logger.debug("No numbered facts found, trying to extract statements")
+        for line in content.strip().split('\n'):
+            line = line.strip()
+            # Skip short lines, headers, or obvious non-facts
+            if (len(line) > 15 and not line.startswith("Here are") and 
+                not line.lower().startswith("i found") and
+                not line.lower().startswith("these are")):
+                statements.append(line)
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, statement in enumerate(statements, 1):
+            logger.debug("Fact %d: %s", i, statement)
+    
+    return [_make_fact(statement, chunk, document_name, source_url, timestamp) for statement in statements]
+
+
+def _is_factless(chunk: TextChunkDict, state: Optional[WorkflowStateDict]) -> bool:
+    """Check if a chunk's extraction request can be skipped.
+    
+    Skipped chunks are counted in the factless_chunks_skipped metric and
+    recorded as processed with no facts.
+    
+    Args:
+        chunk: Chunk to extract facts from
+        state: Workflow state, for the metric, or None
+        
+    Returns:
+        True if skipping is enabled and the chunk has no digit or capitalized word
+    """
+    if not SKIP_FACTLESS_CHUNKS or FACT_HINT_RE.search(chunk["content"]):
+        return False
+    metrics = _metrics(state)
+    metrics["factless_chunks_skipped"] = metrics.get("factless_chunks_skipped", 0) + 1
+    return True
+
+
+async def _extract_chunk_text(chunk: TextChunkDict, state: Optional[WorkflowStateDict], model=None) -> str:
+    """Get the extraction response for a chunk, from the LLM cache if possible.
+    
+    Args:
+        chunk: Chunk to extract facts from
+        state: Workflow state, for the metrics, or None
+        model: Chat model to call instead of the module's llm
+        
+    Returns:
+        Response text
+    """
+    if _is_factless(chunk, state):
+        return ""
+    model = model or llm
+    return await _invoke_cached(
+        LLMCache.make_key("extract", getattr(model, "model_name", ""), EXTRACTOR_PROMPT_NAME, chunk["content"]),
+        lambda: _ainvoke(render_extractor_prompt(chunk["content"], EXTRACTOR_PROMPT_NAME), model),
+        state
+    )
+
+
+async def _stream_chunk_text(chunk: TextChunkDict, state: WorkflowStateDict, on_statement) -> str:
+    """Stream the extraction response for a chunk, reporting facts as they complete.
+    
+    Each <fact>...</fact> tag is passed to on_statement as soon as its closing
+    tag arrives, so its verification can start while the model is still
+    generating. Cached responses are returned whole without any callbacks.
+    
+    Args:
+        chunk: Chunk to extract facts from
+        state: Workflow state, for the cache hit/miss counters
+        on_statement: Coroutine function called with each completed statement
+        
+    Returns:
+        Full response text
+    """
+    if _is_factless(chunk, state):
+        return ""
+    
+    async def stream():
+        # One growing buffer, scanned only past the last complete fact tag
+        text = ""
+        parsed_end = 0
+        async with _llm_semaphore():
+            async for piece in llm.astream(render_extractor_prompt(chunk["content"], EXTRACTOR_PROMPT_NAME)):
+                text += piece.content
+                # A fact tag can only complete on a chunk containing '>'
+                if '>' not in piece.content:
+                    continue
+                for match in FACT_TAG_RE.finditer(text, parsed_end):
+                    parsed_end = match.end()
+                    statement = match.group(1).strip()
+                    if statement and statement.lower() != "none":
+                        await on_statement(statement)
+        return AIMessage(content=text)
+    
+    return await _invoke_cached(
+        LLMCache.make_key("extract", getattr(llm, "model_name", ""), EXTRACTOR_PROMPT_NAME, chunk["content"]),
+        stream,
+        state
+    )
+
+
+def _record_extraction(
+    state: WorkflowStateDict,
+    chunk: TextChunkDict,
+    response,
+    status_updates: List[Dict[str, Any]],
+    streamed_facts: List[FactDict] = None,
+    timestamp: str = None
+) -> List[FactDict]:
+    """Parse one chunk's extraction response into the state.
+    
+    Args:
+        state: Workflow state; extracted facts, errors and metrics are updated
+        chunk: The chunk that was sent for extraction
+        response: Response text, or the exception raised by the request
+        status_updates: List the chunk's status update is appended to
+        streamed_facts: Facts already created while the response streamed;
+            they are reused in place of the same statements parsed here
+        timestamp: Extraction timestamp shared by the node's facts
+        
+    Returns:
+        The facts extracted from the chunk
+    """
+    logger.debug("Processing chunk %d (%d chars)", chunk['index'], len(chunk['content']))
+    memory = state["memory"]
+    metrics = memory["performance_metrics"]
+    
+    if isinstance(response, Exception):
+        error_msg = f"Error in extractor node: {str(response)}"
+        logger.error(error_msg)
+        state["errors"].append(error_msg)
+        error_counts = memory["error_counts"]
+        error_counts["extraction_error"] = error_counts.get("extraction_error", 0) + 1
+        metrics["errors_encountered"] += 1
+        status_updates.append({
+            "document_name": state["document_name"],
+            "chunk_index": chunk["index"],
+            "status": "error",
+            "contains_facts": False,
+            "error_message": str(response)
+        })
+        return []
+    
+    logger.debug("LLM response for chunk %d:\n%s", chunk['index'], response)
+    facts = _parse_extracted_facts(
+        response,
+        chunk,
+        state["document_name"],
+        state.get("source_url", ""),
+        timestamp
+    )
+    
+    # Keep the streamed fact objects, which may already be queued for verification
+    if streamed_facts:
+        streamed_statements = [fact["statement"] for fact in streamed_facts]
+        if streamed_statements == [fact["statement"] for fact in facts[:len(streamed_facts)]]:
+            facts[:len(streamed_facts)] = streamed_facts
+    
+    # Update state with extracted facts
+    if facts:
+        state["extracted_facts"].extend(facts)
+        metrics["facts_extracted"] += len(facts)
+    else:
+        logger.debug("No facts found in chunk %d", chunk['index'])
+    
+    # Queue chunk status update
+    status_updates.append({
+        "document_name": state["document_name"],
+        "chunk_index": chunk["index"],
+        "status": "processed",
+        "contains_facts": bool(facts),
+        "error_message": None
+    })
+    metrics["chunks_processed"] += 1
+    return facts
+
+
+async def _verify_fact_text(fact: FactDict, state: Optional[WorkflowStateDict], model=None) -> str:
+    """Get the verification response for a fact, from the LLM cache if possible.
+    
+    Args:
+        fact: Fact to verify against its original text
+        state: Workflow state, for the metrics, or None
+        model: Chat model to call instead of the module's llm
+        
+    Returns:
+        Response text
+    """
+    model = model or llm
+    return await _invoke_cached(
+        LLMCache.make_key("verify", getattr(model, "model_name", ""), fact.get("statement", ""), fact.get("original_text", "")),
+        # The system message text is built once; only the human turn is formatted
+        lambda: _ainvoke(to_messages(render_verification(
+            fact.get("statement", ""),
+            fact.get("original_text", "")
+        )), model),
+        state
+    )
+
+
+async def _verify_fact_group(facts: List[FactDict], state: WorkflowStateDict) -> List[Any]:
+    """Verify facts that share one original text with a single batch prompt.
+    
+    Each reasoned batch verdict is turned into an <is_valid>/<reasoning>
+    response for _record_verifications. Single facts, facts the model gave
+    no verdict or no reasoning for, and groups whose batch request failed go
+    through the single-fact prompt.
+    
+    Args:
+        facts: Facts with the same original text, at most MAX_BATCH_FACTS
+        state: Workflow state, for the cache hit/miss counters
+        
+    Returns:
+        Response text, or the exception raised, for each fact
+    """
+    verdicts: Dict[int, Tuple[bool, str]] = {}
+    if len(facts) > 1:
+        statements = [fact.get("statement", "") for fact in facts]
+        original_text = facts[0].get("original_text", "")
+        try:
+            content = await _invoke_cached(
+                LLMCache.make_key("verify_batch", getattr(llm, "model_name", ""), original_text, *statements),
+                lambda: _ainvoke(to_messages(render_verification_batch(statements, original_text))),
+                state
+            )
+            verdicts = parse_reasoned_verdicts(content)
+        except Exception as e:
+            logger.warning(f"Batch verification failed, verifying facts one by one: {str(e)}")
+    
+    responses: List[Any] = []
+    for position, fact in enumerate(facts, 1):
+        if position in verdicts:
+            is_valid, reasoning = verdicts[position]
+            responses.append(
+                f"<is_valid>{'true' if is_valid else 'false'}</is_valid><reasoning>{reasoning}</reasoning>"
+            )
+            continue
+        try:
+            responses.append(await _verify_fact_text(fact, state))
+        except Exception as e:
+            responses.append(e)
+    return responses
+
+
+def _stored_flags(facts: List[FactDict]) -> List[bool]:
+    """Check which facts are already stored for their document and original text.
+    
+    Only those can skip verification; the same statement from another
+    document is verified, since it comes from a different text.
+    """
+    return [
+        fact_repo.has_fact(
+            fact.get("statement", ""),
+            fact.get("document_name", ""),
+            fact.get("original_text", "")
+        )
+        for fact in facts
+    ]
+
+
+def _verification_groups(facts: List[FactDict]) -> List[List[FactDict]]:
+    """Split facts into the groups that are verified with one request each.
+    
+    With BATCH_VERIFICATION, facts sharing an original text (chunk) form
+    groups of at most MAX_BATCH_FACTS facts; otherwise each fact is its own
+    group.
+    """
+    if not BATCH_VERIFICATION:
+        return [[fact] for fact in facts]
+    
+    by_text: Dict[str, List[FactDict]] = {}
+    for fact in facts:
+        by_text.setdefault(fact.get("original_text", ""), []).append(fact)
+    return [
+        group[start:start + MAX_BATCH_FACTS]
+        for group in by_text.values()
+        for start in range(0, len(group), MAX_BATCH_FACTS)
+    ]
+
+
+def _statement_key(statement: str) -> bytes:
+    """Key a fact statement for deduplication, ignoring case and whitespace.
+    
+    Overlapping chunks often yield the same fact twice, so each distinct
+    statement only needs to be verified once.
+    """
+    normalized = " ".join(statement.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def _parse_json_verdict(content: str):
+    """Parse a JSON verification response such as {"is_valid": true, "reason": "..."}.
+    
+    Returns:
+        (is_valid, reasoning) tuple, or None if the response is not a JSON verdict
+    """
+    text = content.strip()
+    if not text.startswith('{') or '"is_valid"' not in text:
+        return None
+    try:
+        verdict = _json_loads(text)
+    except ValueError:
+        return None
+    if not isinstance(verdict, dict) or "is_valid" not in verdict:
+        return None
+    
+    is_valid = verdict["is_valid"]
+    if isinstance(is_valid, str):
+        is_valid = is_valid.strip().lower() in ("true", "yes", "valid")
+    reasoning = verdict.get("reason") or verdict.get("reasoning") or ""
+    return bool(is_valid), str(reasoning).strip()
+
+
+def _parse_verdict(content: str) -> Tuple[bool, str]:
+    """Parse a verification response into a verdict.
+    
+    Tries the JSON and <is_valid>/<reasoning> formats the verifier prompt
+    asks for, then older tag and line formats, then a keyword fallback.
+    
+    Args:
+        content: Verification response text
+        
+    Returns:
+        (is_valid, reasoning) tuple
+    """
+    # Format 0: JSON object with "is_valid" and "reason" keys
+    json_verdict = _parse_json_verdict(content)
+    if json_verdict is not None:
+        is_valid, reasoning = json_verdict
+    else:
+        # Format 1: <is_valid> and <reasoning> XML tags, found in one scan
+        tag_verdict = parse_verdict_tags(content)
+    
+        if tag_verdict is not None:
+            is_valid, reasoning = tag_verdict
+        else:
+            # Format 2: <validity> and <explanation> tags
+            is_valid_match = VALIDITY_RE.search(content)
+            reasoning_match = EXPLANATION_RE.search(content)
+        
+            if is_valid_match and reasoning_match:
+                is_valid_str = is_valid_match.group(1).strip().lower()
+                is_valid = is_valid_str == "true" or is_valid_str == "yes" or is_valid_str == "valid"
+                reasoning = reasoning_match.group(1).strip()
+            else:
+                # Format 3: Look for "Valid: " or "Invalid: " patterns
+                valid_match = VALID_LINE_RE.search(content)
+                invalid_match = INVALID_LINE_RE.search(content)
+                reason_match = REASON_LINE_RE.search(content)
+            
+                if (valid_match or invalid_match) and reason_match:
+                    is_valid = bool(valid_match and not invalid_match)
+                    reasoning = reason_match.group(1).strip()
+                else:
+                    # Format 4: Fallback - use keywords to determine validity
+                    is_valid = "valid" in content.lower() and "not valid" not in content.lower()
+                    reasoning = content.strip()
+    
+    return is_valid, reasoning or "No specific reasoning provided"
+
+
+async def _record_verifications(state: WorkflowStateDict, facts: List[FactDict], responses: List[Any]) -> None:
+    """Apply verification responses to facts and store the results.
+    
+    Verified facts go to the fact repository and rejected facts to the
+    rejected fact repository, one write each, and the chunks with verified
+    facts are marked as fully extracted. The writes run in a worker thread
+    so rewriting the workbooks doesn't block the event loop.
+    
+    Args:
+        state: Workflow state; errors and metrics are updated
+        facts: Facts that were sent for verification
+        responses: Response text, or the exception raised, for each fact
+    """
+    # Track verified facts per chunk
+    chunk_verified_facts: Dict[int, List[FactDict]] = {}
+    
+    # Facts to store once all results are parsed, one write per repository
+    verified_to_store: List[FactDict] = []
+    rejected_to_store: List[FactDict] = []
+    
+    # One timestamp for the whole batch of facts
+    current_time = datetime.now().isoformat()
+    
+    # Bound once rather than looked up again for every failed fact
+    metrics = state["memory"]["performance_metrics"]
+    error_counts = state["memory"]["error_counts"]
+    
+    # Parse and store results sequentially
+    for fact, content in zip(facts, responses):
+        try:
+            if isinstance(content, Exception):
+                raise content
+            
+            # Get the original text from the fact data
+            original_text = fact.get("original_text", "")
+            chunk_index = fact.get("source_chunk", 0)
+            
+            # No per-fact printing here: this runs once per fact, so only
+            # log when debug output is on (and skip the formatting otherwise)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Verifying fact from chunk %s: statement=%s orig=%s response=%s",
+                    chunk_index, fact.get("statement", ""), original_text[:200], content
+                )
+            
+            # Parse the response
+            try:
+                is_valid, reasoning = _parse_verdict(content)
+                    
+                # Update fact status based on validation
+                fact["verification_status"] = "verified" if is_valid else "rejected"
+                fact["verification_reason"] = reasoning
+                
+                # Ensure all required fields are present for Excel storage
+                if "timestamp" not in fact:
+                    fact["timestamp"] = current_time
+                
+                fact["date_uploaded"] = current_time
+                fact["source_name"] = state.get("source_name", "")
+                fact["source_url"] = state.get("source_url", "")
+                
+                # Store fact based on validation status
+                if is_valid:
+                    verified_to_store.append(fact)
+                    # Track verified facts by chunk
+                    if chunk_index not in chunk_verified_facts:
+                        chunk_verified_facts[chunk_index] = []
+                    chunk_verified_facts[chunk_index].append(fact)
+                else:
+                    rejected_to_store.append(fact)
+                
+            except (ValueError, AttributeError) as e:
+                logger.warning("Error parsing validation response: %s", e)
+                fact["verification_status"] = "rejected"
+                fact["verification_reason"] = "Invalid validation response format"
+                state["errors"].append(f"Error parsing validation response: {str(e)}")
+                # Store the rejected fact due to parsing error
+                rejected_to_store.append(fact)
+            
+        except Exception as e:
+            error_msg = f"Error validating fact: {str(e)}"
+            logger.error(error_msg)
+            state["errors"].append(error_msg)
+            
+            # Update error stats in memory
+            error_counts["validation_error"] = error_counts.get("validation_error", 0) + 1
+            metrics["errors_encountered"] += 1
+    
+    # The store lists already count the outcomes, so the summary needs no
+    # scan of every fact in the state
+    logger.info("Validation summary: %d facts processed, %d verified, %d rejected",
+                len(facts), len(verified_to_store), len(rejected_to_store))
+    
+    # Update chunk statuses based on verification results
+    status_updates = []
+    for chunk_index, verified_facts in chunk_verified_facts.items():
+        status_updates.append({
+            "document_name": state["document_name"],
+            "chunk_index": chunk_index,
+            "status": "processed",
+            "contains_facts": len(verified_facts) > 0,
+            "error_message": None,
+            "all_facts_extracted": True  # Mark as having all facts extracted
+        })
+    
+    def store() -> None:
+        # store_facts adds the facts to both Excel and the vector database
+        fact_repo.store_facts(verified_to_store)
+        rejected_fact_repo.store_rejected_facts(rejected_to_store)
+        chunk_repo.update_chunk_statuses(status_updates)
+    
+    await asyncio.to_thread(store)
+
+
 async def extractor_node(state: WorkflowStateDict) -> WorkflowStateDict:
-    """Extract facts from chunks and manage storage."""
-    print("\n" + "="*80)
-    print("EXTRACTOR NODE START")
-    print("="*80)
+    """Extract facts from all remaining chunks and manage storage.
+    
+    Extraction requests for every pending chunk are sent concurrently (at
+    most MAX_CONCURRENT_CHUNKS in flight) so the LLM server can batch them,
+    and the graph does not loop back through this node once per chunk.
+    
+    create_workflow() runs extract_and_verify_node instead; this node and
+    validator_node are kept for running the two stages separately.
+    """
+    logger.debug("Extractor node start")
     
     try:
-        # Initialize state fields if not present
-        if "extracted_facts" not in state:
-            state["extracted_facts"] = []
-        if "errors" not in state:
-            state["errors"] = []
-        if "memory" not in state:
-            state["memory"] = {
-                "document_stats": {},
-                "fact_patterns": [],
-                "entity_mentions": {},
-                "recent_facts": [],
-                "error_counts": {},
-                "performance_metrics": {
-                    "start_time": datetime.now().isoformat(),
-                    "chunks_processed": 0,
-                    "facts_extracted": 0,
-                    "errors_encountered": 0
-                }
-            }
+        _ensure_state(state)
         
         # Check if we're done processing chunks
         if state["current_chunk_index"] >= len(state["chunks"]):
-            print("\nNo more chunks to process")
+            logger.debug("No more chunks to process")
             state["is_complete"] = True
             return state
             
-        current_chunk = state["chunks"][state["current_chunk_index"]]
-        start_time = datetime.now()
-        
-        print("\nProcessing Chunk:")
-        print("-"*40)
-        print(f"Chunk Index: {current_chunk['index']}")
-        print(f"Chunk Length: {len(current_chunk['content'])} chars")
-        
-        # Check if this chunk has already been processed but not all facts extracted
-        existing_chunk = chunk_repo.get_chunk(state["document_name"], current_chunk["index"])
-        if existing_chunk and existing_chunk.get("status") == "processed" and existing_chunk.get("contains_facts") and not existing_chunk.get("all_facts_extracted", False):
-            print(f"Chunk {current_chunk['index']} has been processed before but may have more facts to extract.")
-        
-        print("\nChunk Content:")
-        print("-"*40)
-        print(current_chunk["content"])
-        print("-"*40)
-        
-        # Extract facts using LLM
-        print("\nSending to LLM for fact extraction...")
-        response = await llm.ainvoke(
-            [HumanMessage(content=FACT_EXTRACTOR_PROMPT.format(text=current_chunk["content"]))]
-        )
+        pending_chunks = state["chunks"][state["current_chunk_index"]:]
+        start_time = time.perf_counter()
+        # One timestamp for every fact extracted by this node
+        now_iso = datetime.now().isoformat()
         
-        print("\nLLM Response:")
-        print("-"*40)
-        print(response.content)
-        print("-"*40)
+        logger.info("Sending %d chunks to LLM for fact extraction", len(pending_chunks))
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+        
+        async def extract(chunk: TextChunkDict) -> str:
+            async with semaphore:
+                return await _extract_chunk_text(chunk, state)
+        
+        responses = await asyncio.gather(
+            *(extract(chunk) for chunk in pending_chunks),
+            return_exceptions=True
+        )
         
         # Track processing time
-        processing_time = (datetime.now() - start_time).total_seconds()
-        
-        # Parse facts
-        facts_found = False
-        facts = []
-        import re
-        
-        print("\nParsing Facts:")
-        print("-"*40)
-        
-        # Try multiple fact formats
-        
-        # Format 1: <fact>content</fact>
-        fact_pattern = re.compile(r'<fact>(.+?)</fact>', re.DOTALL)
-        matches = fact_pattern.finditer(response.content)
-        fact_count = 0
-        
-        for match in matches:
-            fact_text = match.group(1).strip()
-            if fact_text:
-                fact_count += 1
-                facts_found = True
-                print(f"Fact {fact_count}:")
-                print("-"*20)
-                print(fact_text)
-                
-                # Create the fact record
-                fact_data = {
-                    "statement": fact_text,
-                    "document_name": state["document_name"],
-                    "source_url": state.get("source_url", ""),
-                    "original_text": current_chunk["content"],
-                    "chunk_index": current_chunk["index"],
-                    "source_chunk": current_chunk["index"],
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "pending",
-                    "verification_status": "pending"
-                }
-                facts.append(fact_data)
+        processing_time = time.perf_counter() - start_time
         
-        # If no <fact> tags, try numbered format
-        if not facts_found:
-            # Try numbered facts: <fact 1>content</fact 1>
-            fact_pattern = re.compile(r'<fact (\d+)>(.*?)</fact \1>', re.DOTALL)
-            matches = fact_pattern.finditer(response.content)
-            
-            for match in matches:
-                fact_num = match.group(1)
-                fact_text = match.group(2).strip()
-                if fact_text:
-                    facts_found = True
-                    print(f"Fact {fact_num}:")
-                    print("-"*20)
-                    print(fact_text)
-                    
-                    # Create the fact record
-                    fact_data = {
-                        "statement": fact_text,
-                        "document_name": state["document_name"],
-                        "source_url": state.get("source_url", ""),
-                        "original_text": current_chunk["content"],
-                        "chunk_index": current_chunk["index"],
-                        "source_chunk": current_chunk["index"],
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "pending",
-                        "verification_status": "pending"
-                    }
-                    facts.append(fact_data)
-        
-        # If still no facts, try fact: pattern for free-form responses
-        if not facts_found and len(response.content.strip()) > 0:
-            print("No numbered facts found, trying to extract statements...")
-            
-            # Split by newlines and consider each non-empty line a potential fact
-            for i, line in enumerate(response.content.strip().split('\n')):
-                line = line.strip()
-                # Skip short lines, headers, or obvious non-facts
-                if (len(line) > 15 and not line.startswith("Here are") and 
-                    not line.lower().startswith("i found") and
-                    not line.lower().startswith("these are")):
-                    facts_found = True
-                    print(f"Statement {i+1}:")
-                    print("-"*20)
-                    print(line)
-                    
-                    # Create the fact record
-                    fact_data = {
-                        "statement": line,
-                        "document_name": state["document_name"],
-                        "source_url": state.get("source_url", ""),
-                        "original_text": current_chunk["content"],
-                        "chunk_index": current_chunk["index"],
-                        "source_chunk": current_chunk["index"],
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "pending",
-                        "verification_status": "pending"
-                    }
-                    facts.append(fact_data)
-        
-        # Update state with extracted facts
-        if facts:
-            state["extracted_facts"].extend(facts)
-            state["memory"]["performance_metrics"]["facts_extracted"] += len(facts)
-            
-            # Update chunk status
-            chunk_repo.update_chunk_status(
-                document_name=state["document_name"],
-                chunk_index=current_chunk["index"],
-                status="processed",
-                contains_facts=True,
-                error_message=None
-            )
-        else:
-            print("\nNo facts found in chunk")
-            chunk_repo.update_chunk_status(
-                document_name=state["document_name"],
-                chunk_index=current_chunk["index"],
-                status="processed",
-                contains_facts=False,
-                error_message=None
-            )
+        total_facts = 0
+        status_updates = []
+        for current_chunk, response in zip(pending_chunks, responses):
+            total_facts += len(_record_extraction(state, current_chunk, response, status_updates, timestamp=now_iso))
         
-        # Move to next chunk
-        state["current_chunk_index"] += 1
-        state["memory"]["performance_metrics"]["chunks_processed"] += 1
+        # Write all chunk status updates at once, off the event loop
+        await asyncio.to_thread(chunk_repo.update_chunk_statuses, status_updates)
         
-        print("\nExtraction Summary:")
-        print("-"*40)
-        print(f"Facts found: {len(facts)}")
-        print(f"Processing time: {processing_time:.2f} seconds")
+        # All chunks are drained in this single pass
+        state["current_chunk_index"] = len(state["chunks"])
+        state["is_complete"] = True
         
-        print("\nEXTRACTOR NODE COMPLETE")
-        print("="*80)
+        logger.info("Extraction summary: %d chunks processed, %d facts found in %.2f seconds",
+                    len(pending_chunks), total_facts, processing_time)
+        logger.debug("Extractor node complete")
         return state
         
     except Exception as e:
         error_msg = f"Error in extractor node: {str(e)}"
-        print("\nERROR IN EXTRACTOR NODE:")
-        print("-"*40)
-        print(error_msg)
+        logger.error(error_msg)
         
         # Initialize errors list if not present
         if "errors" not in state:
@@ -439,228 +1031,258 @@ async def extractor_node(state: WorkflowStateDict) -> WorkflowStateDict:
         state["memory"]["error_counts"]["extraction_error"] = state["memory"]["error_counts"].get("extraction_error", 0) + 1
         state["memory"]["performance_metrics"]["errors_encountered"] += 1
         
-        # Update chunk status
-        if "current_chunk_index" in state and state["current_chunk_index"] < len(state["chunks"]):
-            current_chunk = state["chunks"][state["current_chunk_index"]]
-            chunk_repo.update_chunk_status(
-                document_name=state["document_name"],
-                chunk_index=current_chunk["index"],
-                status="error",
-                contains_facts=False,
-                error_message=str(e)
-            )
-        
-        # Move to next chunk even on error
-        state["current_chunk_index"] = state.get("current_chunk_index", 0) + 1
+        # Don't retry the batch; the validator handles whatever was extracted
+        state["current_chunk_index"] = len(state.get("chunks", []))
+        state["is_complete"] = True
         return state
 
 
 async def validator_node(state: WorkflowStateDict) -> WorkflowStateDict:
-    """Validate extracted facts using LLM and store approved facts."""
-    print("\n" + "="*80)
-    print("VALIDATOR NODE START")
-    print("="*80)
+    """Validate extracted facts using LLM and store approved facts.
+    
+    Not part of create_workflow(), which verifies facts in
+    extract_and_verify_node; see extractor_node.
+    """
+    logger.debug("Validator node start")
     
     try:
-        # Initialize state fields if not present
-        if "extracted_facts" not in state:
-            state["extracted_facts"] = []
-        if "errors" not in state:
-            state["errors"] = []
-        if "memory" not in state:
-            state["memory"] = {
-                "document_stats": {},
-                "fact_patterns": [],
-                "entity_mentions": {},
-                "recent_facts": [],
-                "error_counts": {},
-                "performance_metrics": {
-                    "start_time": datetime.now().isoformat(),
-                    "chunks_processed": 0,
-                    "facts_extracted": 0,
-                    "errors_encountered": 0
-                }
-            }
+        _ensure_state(state)
         
-        # Track verified facts per chunk
-        chunk_verified_facts: Dict[int, List[FactDict]] = {}
-        
-        print("\nFacts to Validate:")
-        print("-"*40)
         pending_facts = [f for f in state["extracted_facts"] if f.get("verification_status") == "pending"]
-        print(f"Total pending facts: {len(pending_facts)}")
-        
+        logger.debug("Total pending facts: %d", len(pending_facts))
+
         if not pending_facts:
-            print("No facts to validate")
+            logger.debug("No facts to validate")
             state["is_complete"] = True
             return state
         
-        # Validate each pending fact
-        for fact in pending_facts:
+        # Verify each distinct statement once; duplicates from overlapping
+        # chunks reuse the first fact's response
+        fact_keys = [_statement_key(fact.get("statement", "")) for fact in pending_facts]
+        unique_facts: Dict[bytes, FactDict] = {}
+        for key, fact in zip(fact_keys, pending_facts):
+            unique_facts.setdefault(key, fact)
+        duplicates = len(pending_facts) - len(unique_facts)
+        if duplicates:
+            metrics = state["memory"]["performance_metrics"]
+            metrics["duplicate_facts_skipped"] = metrics.get("duplicate_facts_skipped", 0) + duplicates
+        
+        # Facts stored by an earlier run over the same text are not verified
+        # again; the repository lookups run off the event loop
+        stored = await asyncio.to_thread(_stored_flags, list(unique_facts.values()))
+        stored_keys = [key for key, is_stored in zip(list(unique_facts), stored) if is_stored]
+        for key in stored_keys:
+            del unique_facts[key]
+        if stored_keys:
+            metrics = state["memory"]["performance_metrics"]
+            metrics["stored_facts_skipped"] = metrics.get("stored_facts_skipped", 0) + len(stored_keys)
+        
+        # Send all verification requests concurrently, bounded by a semaphore;
+        # each request retries on rate limits independently
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VERIFICATIONS)
+        
+        if BATCH_VERIFICATION:
+            # One request per original text (chunk), at most MAX_BATCH_FACTS facts each
+            groups: Dict[str, List[bytes]] = {}
+            for key, fact in unique_facts.items():
+                groups.setdefault(fact.get("original_text", ""), []).append(key)
+            batches = [
+                keys[start:start + MAX_BATCH_FACTS]
+                for keys in groups.values()
+                for start in range(0, len(keys), MAX_BATCH_FACTS)
+            ]
+        else:
+            batches = [[key] for key in unique_facts]
+        
+        async def verify(keys: List[bytes]) -> List[Any]:
+            async with semaphore:
+                return await _verify_fact_group([unique_facts[key] for key in keys], state)
+        
+        logger.info("Sending %d facts to LLM for verification in %d requests (%d duplicates, %d stored facts skipped)",
+                    len(unique_facts), len(batches), duplicates, len(stored_keys))
+        batch_responses = await asyncio.gather(*(verify(keys) for keys in batches))
+        response_by_key = dict.fromkeys(stored_keys, STORED_FACT_RESPONSE)
+        response_by_key.update(
+            (key, response)
+            for keys, responses in zip(batches, batch_responses)
+            for key, response in zip(keys, responses)
+        )
+        responses = [response_by_key[key] for key in fact_keys]
+        
+        await _record_verifications(state, pending_facts, responses)
+        
+        # Mark state as complete
+        state["is_complete"] = True
+        logger.debug("Validator node complete")
+        return state
+        
+    except Exception as e:
+        error_msg = f"Error in validator node: {str(e)}"
+        logger.error(error_msg)
+        
+        # Initialize errors list if not present
+        if "errors" not in state:
+            state["errors"] = []
+        state["errors"].append(error_msg)
+        
+        # Ensure state is marked as complete even on error
+        state["is_complete"] = True
+        return state
+
+
+async def extract_and_verify_node(state: WorkflowStateDict) -> WorkflowStateDict:
+    """Extract facts from all remaining chunks and verify them as they arrive.
+    
+    Extraction and verification run as a pipeline: each chunk's facts are
+    queued for verification as soon as its extraction response is parsed,
+    so verification of early chunks overlaps extraction of later ones
+    instead of waiting for every chunk to be extracted. With
+    BATCH_VERIFICATION, a chunk's facts are queued together and verified
+    with one batch prompt; otherwise each fact is queued as it is streamed.
+    """
+    logger.debug("Extract and verify node start")
+    
+    try:
+        _ensure_state(state)
+        
+        pending_chunks = state["chunks"][state["current_chunk_index"]:]
+        start_time = time.perf_counter()
+        # One timestamp for every fact extracted by this node
+        now_iso = datetime.now().isoformat()
+        
+        # Groups of facts to verify, see _verification_groups(); facts left
+        # pending by an earlier run are verified too
+        fact_queue: asyncio.Queue = asyncio.Queue()
+        pending_facts = [f for f in state["extracted_facts"] if f.get("verification_status") == "pending"]
+        for group in _verification_groups(pending_facts):
+            fact_queue.put_nowait(group)
+        
+        extract_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+        status_updates: List[Dict[str, Any]] = []
+        verified_facts: List[FactDict] = []
+        verification_responses: List[Any] = []
+        
+        async def extract(chunk: TextChunkDict) -> None:
+            # Without batching, facts are queued for verification as soon as
+            # they are streamed
+            streamed: List[FactDict] = []
+            
+            async def on_statement(statement: str) -> None:
+                fact = _make_fact(statement, chunk, state["document_name"], state.get("source_url", ""), now_iso)
+                streamed.append(fact)
+                if not BATCH_VERIFICATION:
+                    await fact_queue.put([fact])
+            
+            async with extract_semaphore:
+                try:
+                    response = await _stream_chunk_text(chunk, state, on_statement)
+                except Exception as e:
+                    response = e
+            facts = _record_extraction(state, chunk, response, status_updates, streamed, now_iso)
+            # Queue whatever was not queued while streaming (batched, cached
+            # or untagged responses)
+            queued = set() if BATCH_VERIFICATION else {id(fact) for fact in streamed}
+            for group in _verification_groups([fact for fact in facts if id(fact) not in queued]):
+                await fact_queue.put(group)
+        
+        async def run_extraction() -> None:
             try:
-                # Get the original text from the fact data
-                original_text = fact.get("original_text", "")
-                chunk_index = fact.get("source_chunk", 0)
+                await asyncio.gather(*(extract(chunk) for chunk in pending_chunks))
+            finally:
+                # One sentinel per verification worker
+                for _ in range(MAX_CONCURRENT_VERIFICATIONS):
+                    await fact_queue.put(None)
+        
+        # Response future per distinct statement, so a duplicate fact from an
+        # overlapping chunk waits for the first verification instead of repeating it
+        verifications: Dict[bytes, asyncio.Future] = {}
+        loop = asyncio.get_running_loop()
+        stored_facts_skipped = 0
+        
+        async def verification_worker() -> None:
+            nonlocal stored_facts_skipped
+            while (group := await fact_queue.get()) is not None:
+                # This worker verifies the group's first fact of each new
+                # statement; the others wait for their statement's future
+                futures: List[asyncio.Future] = []
+                new_facts: List[Tuple[FactDict, asyncio.Future]] = []
+                for fact in group:
+                    key = _statement_key(fact.get("statement", ""))
+                    pending = verifications.get(key)
+                    if pending is None:
+                        pending = verifications[key] = loop.create_future()
+                        new_facts.append((fact, pending))
+                    futures.append(pending)
                 
-                print("\nValidating Fact:")
-                print("-"*40)
-                print(f"From chunk: {chunk_index}")
-                print(f"Statement: {fact.get('statement', 'No statement')}")
-                print("\nOriginal Context:")
-                print("-"*40)
-                print(original_text)
-                print("-"*40)
-                
-                # Validate fact using LLM with FACT_VERIFICATION_PROMPT
-                max_retries = 3
-                retry_delay = 5
-                
-                print("\nSending to LLM for verification...")
-                for attempt in range(max_retries):
-                    try:
-                        response = await llm.ainvoke(
-                            [HumanMessage(content=FACT_VERIFICATION_PROMPT.format(
-                                fact_text=fact.get("statement", ""),
-                                original_text=original_text
-                            ))]
-                        )
-                        break
-                    except Exception as e:
-                        if "429" in str(e) and attempt < max_retries - 1:
-                            print(f"Rate limited, retrying in {retry_delay} seconds...")
-                            await asyncio.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
+                if new_facts:
+                    stored = await asyncio.to_thread(_stored_flags, [fact for fact, _ in new_facts])
+                    to_verify = []
+                    for (fact, pending), is_stored in zip(new_facts, stored):
+                        if is_stored:
+                            pending.set_result(STORED_FACT_RESPONSE)
                         else:
-                            raise
-                
-                print("\nLLM Response:")
-                print("-"*40)
-                print(response.content)
-                print("-"*40)
-                
-                # Parse XML response
-                try:
-                    import re
-                    
-                    # Try multiple formats for extracting validation information
+                            to_verify.append((fact, pending))
+                    stored_facts_skipped += len(new_facts) - len(to_verify)
                     
-                    # Format 1: <is_valid> and <reasoning> XML tags
-                    is_valid_match = re.search(r'<is_valid>(.*?)</is_valid>', response.content, re.DOTALL)
-                    reasoning_match = re.search(r'<reasoning>(.*?)</reasoning>', response.content, re.DOTALL)
-                    
-                    if is_valid_match and reasoning_match:
-                        is_valid_str = is_valid_match.group(1).strip().lower()
-                        is_valid = is_valid_str == "true" or is_valid_str == "yes"
-                        reasoning = reasoning_match.group(1).strip()
-                    else:
-                        # Format 2: <validity> and <explanation> tags
-                        is_valid_match = re.search(r'<validity>(.*?)</validity>', response.content, re.DOTALL)
-                        reasoning_match = re.search(r'<explanation>(.*?)</explanation>', response.content, re.DOTALL)
-                        
-                        if is_valid_match and reasoning_match:
-                            is_valid_str = is_valid_match.group(1).strip().lower()
-                            is_valid = is_valid_str == "true" or is_valid_str == "yes" or is_valid_str == "valid"
-                            reasoning = reasoning_match.group(1).strip()
-                        else:
-                            # Format 3: Look for "Valid: " or "Invalid: " patterns
-                            valid_match = re.search(r'Valid:\s*(.*?)(?:\n|$)', response.content, re.IGNORECASE)
-                            invalid_match = re.search(r'Invalid:\s*(.*?)(?:\n|$)', response.content, re.IGNORECASE)
-                            reason_match = re.search(r'Reason(?:ing)?:\s*(.*?)(?:\n|$)', response.content, re.IGNORECASE)
-                            
-                            if (valid_match or invalid_match) and reason_match:
-                                is_valid = bool(valid_match and not invalid_match)
-                                reasoning = reason_match.group(1).strip()
-                            else:
-                                # Format 4: Fallback - use keywords to determine validity
-                                is_valid = "valid" in response.content.lower() and "not valid" not in response.content.lower()
-                                reasoning = response.content.strip()
-                    
-                    if not reasoning:
-                        reasoning = "No specific reasoning provided"
-                        
-                    print("\nVerification Result:")
-                    print("-"*40)
-                    print(f"Valid: {is_valid}")
-                    print(f"Reasoning: {reasoning}")
-                    
-                    # Update fact status based on validation
-                    fact["verification_status"] = "verified" if is_valid else "rejected"
-                    fact["verification_reason"] = reasoning
-                    
-                    # Ensure all required fields are present for Excel storage
-                    current_time = datetime.now().isoformat()
-                    
-                    # Add or update required fields
-                    if "timestamp" not in fact:
-                        fact["timestamp"] = current_time
-                    
-                    fact["date_uploaded"] = current_time
-                    fact["source_name"] = state.get("source_name", "")
-                    fact["source_url"] = state.get("source_url", "")
-                    
-                    # Store fact based on validation status
-                    if is_valid:
-                        print("Fact verified - storing in approved repository")
-                        # fact_repo.store_fact will automatically add the fact to both Excel and the vector database
-                        fact_repo.store_fact(fact)
-                        # Track verified facts by chunk
-                        if chunk_index not in chunk_verified_facts:
-                            chunk_verified_facts[chunk_index] = []
-                        chunk_verified_facts[chunk_index].append(fact)
-                    else:
-                        print("Fact rejected - storing in rejected repository")
-                        rejected_fact_repo.store_rejected_fact(fact)
-                    
-                except (ValueError, AttributeError) as e:
-                    print(f"\nError parsing validation response: {str(e)}")
-                    fact["verification_status"] = "rejected"
-                    fact["verification_reason"] = "Invalid validation response format"
-                    state["errors"].append(f"Error parsing validation response: {str(e)}")
-                    # Store the rejected fact due to parsing error
-                    rejected_fact_repo.store_rejected_fact(fact)
+                    if to_verify:
+                        try:
+                            responses = await _verify_fact_group([fact for fact, _ in to_verify], state)
+                        except Exception as e:
+                            responses = [e] * len(to_verify)
+                        # Exceptions are passed on as results, like the responses
+                        for (_, pending), response in zip(to_verify, responses):
+                            pending.set_result(response)
                 
-            except Exception as e:
-                error_msg = f"Error validating fact: {str(e)}"
-                print(f"\nError: {error_msg}")
-                state["errors"].append(error_msg)
-                
-                # Update error stats in memory
-                state["memory"]["error_counts"]["validation_error"] = state["memory"]["error_counts"].get("validation_error", 0) + 1
-                state["memory"]["performance_metrics"]["errors_encountered"] += 1
-        
-        print("\nValidation Summary:")
-        print("-"*40)
-        verified_count = len([f for f in state["extracted_facts"] if f.get("verification_status") == "verified"])
-        rejected_count = len([f for f in state["extracted_facts"] if f.get("verification_status") == "rejected"])
-        print(f"Total facts processed: {len(pending_facts)}")
-        print(f"Verified: {verified_count}")
-        print(f"Rejected: {rejected_count}")
-        
-        # Update chunk statuses based on verification results
-        print("\nUpdating Chunk Statuses:")
-        print("-"*40)
-        for chunk_index, verified_facts in chunk_verified_facts.items():
-            print(f"Chunk {chunk_index}: {len(verified_facts)} verified facts")
-            chunk_repo.update_chunk_status(
-                document_name=state["document_name"],
-                chunk_index=chunk_index,
-                status="processed",
-                contains_facts=len(verified_facts) > 0,
-                error_message=None,
-                all_facts_extracted=True  # Mark as having all facts extracted
-            )
+                for fact, pending in zip(group, futures):
+                    verified_facts.append(fact)
+                    verification_responses.append(await pending)
+        
+        logger.info("Extracting and verifying facts from %d chunks", len(pending_chunks))
+        await asyncio.gather(
+            run_extraction(),
+            *(verification_worker() for _ in range(MAX_CONCURRENT_VERIFICATIONS))
+        )
+        
+        # Write all chunk status updates at once, off the event loop
+        await asyncio.to_thread(chunk_repo.update_chunk_statuses, status_updates)
+        state["current_chunk_index"] = len(state["chunks"])
+        
+        # Record results in extraction order rather than completion order.
+        # Streamed facts that did not make it into the state (the stream
+        # failed partway, or its facts differ from the parsed response) are
+        # dropped, so they are neither stored nor counted for their chunk.
+        fact_order = {id(fact): i for i, fact in enumerate(state["extracted_facts"])}
+        results = sorted(
+            (result for result in zip(verified_facts, verification_responses) if id(result[0]) in fact_order),
+            key=lambda result: fact_order[id(result[0])]
+        )
+        if len(results) < len(verified_facts):
+            logger.debug("Dropped %d streamed facts of failed or re-parsed extractions",
+                         len(verified_facts) - len(results))
+        await _record_verifications(
+            state,
+            [fact for fact, _ in results],
+            [response for _, response in results]
+        )
+        
+        duplicates = len(verified_facts) - len(verifications)
+        metrics = state["memory"]["performance_metrics"]
+        if duplicates:
+            metrics["duplicate_facts_skipped"] = metrics.get("duplicate_facts_skipped", 0) + duplicates
+        if stored_facts_skipped:
+            metrics["stored_facts_skipped"] = metrics.get("stored_facts_skipped", 0) + stored_facts_skipped
+        
+        processing_time = time.perf_counter() - start_time
+        logger.info("Processing time: %.2f seconds", processing_time)
         
         # Mark state as complete
         state["is_complete"] = True
-        print("\nVALIDATOR NODE COMPLETE")
-        print("="*80)
+        logger.debug("Extract and verify node complete")
         return state
         
     except Exception as e:
-        error_msg = f"Error in validator node: {str(e)}"
-        print("\nERROR IN VALIDATOR NODE:")
-        print("-"*40)
-        print(error_msg)
+        error_msg = f"Error in extract and verify node: {str(e)}"
+        logger.error(error_msg)
         
         # Initialize errors list if not present
         if "errors" not in state:
@@ -672,6 +1294,36 @@ async def validator_node(state: WorkflowStateDict) -> WorkflowStateDict:
         return state
 
 
+def enable_eager_tasks(loop: asyncio.AbstractEventLoop = None) -> bool:
+    """Install the eager task factory on an event loop (Python 3.12+).
+    
+    With eager tasks, coroutines that finish without suspending (cache hits,
+    fast parses) complete immediately instead of waiting for a full event
+    loop iteration. On older Python versions this is a no-op.
+    
+    Args:
+        loop: Event loop to configure (defaults to the running loop)
+        
+    Returns:
+        True if the eager task factory is installed on the loop
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+    
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop yet; callers can install it once one exists
+            return False
+    
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(eager_task_factory)
+        logger.info("Using eager task factory for the workflow event loop")
+    return loop.get_task_factory() is eager_task_factory
+
+
 def create_workflow(
     chunk_repo: ChunkRepository,
     fact_repo: FactRepository
@@ -685,31 +1337,20 @@ def create_workflow(
     Returns:
         Tuple of workflow graph and input key
     """
+    # Let node coroutines that finish synchronously skip a loop iteration
+    enable_eager_tasks()
+    
     # Create workflow graph
     workflow = StateGraph(WorkflowStateDict)
     
     # Add nodes with async wrappers
     workflow.add_node("chunker", chunker_node)
-    workflow.add_node("extractor", extractor_node)
-    workflow.add_node("validator", validator_node)
-    
-    # Define edges
-    workflow.add_edge("chunker", "extractor")
-    workflow.add_edge("extractor", "validator")
-    
-    # Add conditional edges with explicit completion check
-    def should_continue(state: WorkflowStateDict) -> str:
-        """Determine if processing should continue or end."""
-        if state["is_complete"]:
-            return END
-        if state["current_chunk_index"] >= len(state["chunks"]):
-            return END
-        return "extractor"
+    workflow.add_node("extract_and_verify", extract_and_verify_node)
     
-    workflow.add_conditional_edges(
-        "validator",
-        should_continue
-    )
+    # Define edges; extraction and verification are pipelined in one node,
+    # which drains every chunk, so there is no loop back
+    workflow.add_edge("chunker", "extract_and_verify")
+    workflow.add_edge("extract_and_verify", END)
     
     # Set entry point
     workflow.set_entry_point("chunker")
@@ -727,7 +1368,9 @@ async def process_chunk(
     chunk_repo: ChunkRepository,
     fact_repo: FactRepository,
     rejected_fact_repo: RejectedFactRepository,
-    llm
+    llm,
+    status_updates: List[Dict[str, Any]] = None,
+    timestamp: str = None
 ) -> Dict[str, Any]:
     """Process a single chunk to extract and validate facts.
     
@@ -739,77 +1382,61 @@ async def process_chunk(
         fact_repo: Repository for facts
         rejected_fact_repo: Repository for rejected facts
         llm: Language model for extraction and validation
+        status_updates: If given, the chunk's final status update is appended
+            here for the caller to write in one batch, instead of being
+            written straight away (the intermediate "extracted" status is
+            then skipped)
+        timestamp: Extraction timestamp shared by the batch's facts;
+            defaults to the current time
         
     Returns:
         Dictionary with processing results
     """
+    def record_status(**fields) -> None:
+        fields.update(document_name=document_name, chunk_index=chunk['index'])
+        if status_updates is None:
+            chunk_repo.update_chunk_status(**fields)
+        elif fields["status"] != "extracted":
+            status_updates.append(fields)
+    
     try:
-        print(f"\nProcessing chunk {chunk['index']} in parallel")
-        start_time = datetime.now()
+        logger.debug("Processing chunk %d in parallel", chunk['index'])
+        start_time = time.perf_counter()
         
         # Extract facts from the chunk
-        print(f"Extracting facts from chunk {chunk['index']}")
-        extraction_response = await llm.ainvoke(
-            [HumanMessage(content=FACT_EXTRACTOR_PROMPT.format(text=chunk['content']))]
-        )
-        
-        # Parse facts
-        facts_found = False
-        facts = []
-        import re
-        
-        # Format 1: <fact>content</fact>
-        fact_pattern = re.compile(r'<fact>(.+?)</fact>', re.DOTALL)
-        matches = fact_pattern.finditer(extraction_response.content)
-        
-        for match in matches:
-            fact_text = match.group(1).strip()
-            if fact_text:
-                facts_found = True
-                
-                # Create the fact record
-                fact_data = {
-                    "statement": fact_text,
-                    "document_name": document_name,
-                    "source_url": source_url,
-                    "original_text": chunk['content'],
-                    "chunk_index": chunk['index'],
-                    "source_chunk": chunk['index'],
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "pending",
-                    "verification_status": "pending"
-                }
-                facts.append(fact_data)
-        
-        # Try alternative formats if no facts found
-        if not facts_found:
-            # Format 2: Numbered facts
-            numbered_pattern = re.compile(r'(?:^|\n)\s*(\d+)[.:\)]\\s*(.+?)(?=(?:^|\n)\s*\d+[.:\)]|$)', re.DOTALL)
-            matches = numbered_pattern.finditer(extraction_response.content)
-            
-            for match in matches:
-                fact_text = match.group(2).strip()
-                if fact_text:
-                    facts_found = True
-                    
-                    # Create the fact record
-                    fact_data = {
-                        "statement": fact_text,
-                        "document_name": document_name,
-                        "source_url": source_url,
-                        "original_text": chunk['content'],
-                        "chunk_index": chunk['index'],
-                        "source_chunk": chunk['index'],
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "pending",
-                        "verification_status": "pending"
-                    }
-                    facts.append(fact_data)
+        logger.debug("Extracting facts from chunk %d", chunk['index'])
+        # Bounded by the shared request semaphore and answered from the LLM
+        # cache where possible, like the workflow nodes
+        content = await _extract_chunk_text(chunk, None, llm)
+        
+        # Parse facts: fact tags first, then a numbered list
+        statements = parse_facts(content)
+        if not statements:
+            statements = [
+                match.group(2).strip()
+                for match in NUMBERED_FACT_RE.finditer(content)
+            ]
+        
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        facts = [
+            {
+                "statement": fact_text,
+                "document_name": document_name,
+                "source_url": source_url,
+                "original_text": chunk['content'],
+                "chunk_index": chunk['index'],
+                "source_chunk": chunk['index'],
+                "timestamp": timestamp,
+                "status": "pending",
+                "verification_status": "pending"
+            }
+            for fact_text in statements
+            if fact_text
+        ]
         
         # Update chunk status after extraction
-        chunk_repo.update_chunk_status(
-            document_name=document_name,
-            chunk_index=chunk['index'],
+        record_status(
             status="extracted",
             contains_facts=len(facts) > 0,
             error_message=None
@@ -820,66 +1447,37 @@ async def process_chunk(
         rejected_facts = []
         
         if facts:
-            print(f"Validating {len(facts)} facts from chunk {chunk['index']}")
+            logger.debug("Validating %d facts from chunk %d", len(facts), chunk['index'])
             
             for fact in facts:
                 # Validate each fact
-                verification_response = await llm.ainvoke(
-                    [HumanMessage(content=FACT_VERIFICATION_PROMPT.format(fact=fact["statement"]))]
-                )
+                verification_response = await _verify_fact_text(fact, None, llm)
                 
-                # Parse the validation result
-                import re
-                verification_result = "unknown"
-                reason = ""
-                reasoning = ""
+                # Parse the verdict the same way as the workflow nodes
+                is_valid, reasoning = _parse_verdict(verification_response)
+                fact["verification_status"] = "verified" if is_valid else "rejected"
+                fact["verification_reason"] = reasoning
                 
-                # Extract verification result with regex
-                result_pattern = re.compile(r'<verification_result>(.*?)</verification_result>', re.DOTALL)
-                result_match = result_pattern.search(verification_response.content)
-                
-                if result_match:
-                    verification_result = result_match.group(1).strip().lower()
-                
-                # Extract verification reason
-                reason_pattern = re.compile(r'<verification_reason>(.*?)</verification_reason>', re.DOTALL)
-                reason_match = reason_pattern.search(verification_response.content)
-                
-                if reason_match:
-                    reason = reason_match.group(1).strip()
-                
-                # Extract detailed reasoning
-                reasoning_pattern = re.compile(r'<verification_reasoning>(.*?)</verification_reasoning>', re.DOTALL)
-                reasoning_match = reasoning_pattern.search(verification_response.content)
-                
-                if reasoning_match:
-                    reasoning = reasoning_match.group(1).strip()
-                
-                # Add verification info to the fact
-                fact["verification_status"] = verification_result if verification_result in ["verified", "rejected"] else "pending"
-                fact["verification_reason"] = reason
-                fact["verification_reasoning"] = reasoning
-                
-                # Store fact in appropriate repository
-                if fact["verification_status"] == "verified":
-                    fact_repo.store_fact(fact)
+                # Sort fact into the appropriate repository batch
+                if is_valid:
                     verified_facts.append(fact)
-                elif fact["verification_status"] == "rejected":
-                    rejected_fact_repo.store_rejected_fact(fact)
+                else:
                     rejected_facts.append(fact)
+            
+            # Store the chunk's facts with one write per repository, off the event loop
+            await asyncio.to_thread(fact_repo.store_facts, verified_facts)
+            await asyncio.to_thread(rejected_fact_repo.store_rejected_facts, rejected_facts)
         
         # Mark chunk as fully processed
-        chunk_repo.update_chunk_status(
-            document_name=document_name,
-            chunk_index=chunk['index'],
+        record_status(
             status="processed",
             contains_facts=len(facts) > 0,
             error_message=None,
             all_facts_extracted=True
         )
         
-        processing_time = (datetime.now() - start_time).total_seconds()
-        print(f"Chunk {chunk['index']} processing completed in {processing_time:.2f} seconds")
+        processing_time = time.perf_counter() - start_time
+        logger.debug("Chunk %d processing completed in %.2f seconds", chunk['index'], processing_time)
         
         return {
             "chunk_index": chunk['index'],
@@ -892,12 +1490,10 @@ async def process_chunk(
         
     except Exception as e:
         error_msg = f"Error processing chunk {chunk['index']}: {str(e)}"
-        print(f"ERROR: {error_msg}")
+        logger.error(error_msg)
         
         # Update chunk status to mark error
-        chunk_repo.update_chunk_status(
-            document_name=document_name,
-            chunk_index=chunk['index'],
+        record_status(
             status="error",
             error_message=error_msg
         )
@@ -943,12 +1539,8 @@ async def parallel_process_chunks(
     if not _chunk_repo or not _fact_repo or not _rejected_fact_repo or not _llm:
         raise ValueError("Repositories and LLM must be provided or available as module-level variables")
     
-    start_time = datetime.now()
-    print(f"\nStarting parallel processing of {len(chunks)} chunks with {max_concurrent_chunks} workers")
-    
-    # Create a queue of chunks to process
-    import asyncio
-    from asyncio import Queue, Semaphore
+    start_time = time.perf_counter()
+    logger.info("Starting parallel processing of %d chunks with %d workers", len(chunks), max_concurrent_chunks)
     
     # Results tracking
     results = []
@@ -958,7 +1550,12 @@ async def parallel_process_chunks(
     total_rejected_facts = 0
     
     # Create a semaphore to limit concurrent processing
-    semaphore = Semaphore(max_concurrent_chunks)
+    semaphore = asyncio.Semaphore(max_concurrent_chunks)
+    
+    # Chunk status updates, written in one batch once all chunks are done
+    status_updates: List[Dict[str, Any]] = []
+    # One timestamp for every fact extracted in this batch
+    now_iso = datetime.now().isoformat()
     
     async def process_chunk_with_semaphore(chunk):
         async with semaphore:
@@ -969,7 +1566,9 @@ async def parallel_process_chunks(
                 chunk_repo=_chunk_repo,
                 fact_repo=_fact_repo,
                 rejected_fact_repo=_rejected_fact_repo,
-                llm=_llm
+                llm=_llm,
+                status_updates=status_updates,
+                timestamp=now_iso
             )
     
     # Create tasks for each chunk
@@ -993,14 +1592,15 @@ async def parallel_process_chunks(
         except Exception as e:
             errors.append(f"Task error: {str(e)}")
     
+    await asyncio.to_thread(_chunk_repo.update_chunk_statuses, status_updates)
+    
     # Calculate total processing time
-    total_time = (datetime.now() - start_time).total_seconds()
+    total_time = time.perf_counter() - start_time
     
-    print(f"\nParallel processing complete:")
-    print(f"Processed {len(chunks)} chunks in {total_time:.2f} seconds")
-    print(f"Extracted {facts_extracted} facts ({total_verified_facts} verified, {total_rejected_facts} rejected)")
+    logger.info("Parallel processing complete: %d chunks in %.2f seconds, %d facts extracted (%d verified, %d rejected)",
+                len(chunks), total_time, facts_extracted, total_verified_facts, total_rejected_facts)
     if errors:
-        print(f"Encountered {len(errors)} errors")
+        logger.warning("Encountered %d errors", len(errors))
     
     # Compile full results
     return {
@@ -1031,14 +1631,13 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
         max_concurrent_chunks = MAX_CONCURRENT_CHUNKS
         
     import os
-    import hashlib
     
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
     
     # Check if file has already been processed
     if file_path in state.processed_files:
-        print(f"File {file_path} has already been processed in this session.")
+        logger.info("File %s has already been processed in this session", file_path)
         return {
             "status": "skipped",
             "reason": "already_processed_in_session",
@@ -1059,26 +1658,17 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
         }
     
     # Generate document hash for duplicate detection
-    document_hash = hashlib.md5(content.encode()).hexdigest()
+    document_hash = ChunkRepository.document_hash(content)
     
     # Check if document has already been processed by checking chunks repository
-    from src.storage.chunk_repository import ChunkRepository
     chunk_repo = ChunkRepository()
-    existing_chunks = chunk_repo.get_all_chunks()
+    existing_chunks = chunk_repo.get_chunks_by_document_hash(document_hash)
     
     # Check if all chunks for this document have had all facts extracted
-    all_chunks_processed = True
-    chunks_to_process = []
-    
-    for chunk in existing_chunks:
-        if chunk.get("document_hash") == document_hash:
-            # Document exists, check if all facts have been extracted
-            if not chunk.get("all_facts_extracted", False):
-                all_chunks_processed = False
-                chunks_to_process.append(chunk)
-    
-    if all_chunks_processed and any(chunk.get("document_hash") == document_hash for chunk in existing_chunks):
-        print(f"Document with hash {document_hash} has already been fully processed.")
+    chunks_to_process = [chunk for chunk in existing_chunks if not chunk.get("all_facts_extracted", False)]
+    
+    if existing_chunks and not chunks_to_process:
+        logger.info("Document with hash %s has already been fully processed", document_hash)
         state.complete_file(file_path)
         return {
             "status": "skipped",
@@ -1089,7 +1679,7 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
     
     # If some chunks need further processing, we'll continue with those
     if chunks_to_process:
-        print(f"Document with hash {document_hash} has {len(chunks_to_process)} chunks that need further processing.")
+        logger.info("Document with hash %s has %d chunks that need further processing", document_hash, len(chunks_to_process))
     
     # Start processing
     state.start_processing(file_path)
@@ -1103,33 +1693,26 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
     rejected_fact_repo = RejectedFactRepository()
     
     # Step 1: Split text into chunks (same as chunker_node)
-    print("\nSplitting document into chunks...")
-    
-    text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-        chunk_size=config["chunk_size"],
-        chunk_overlap=config["chunk_overlap"],
-        separators=["\n\n", "\n", ". ", " ", ""],
-        is_separator_regex=False,
-    )
+    logger.debug("Splitting document into chunks")
     
-    # Split the text into documents with metadata
-    documents = text_splitter.create_documents(
-        [content],
-        metadatas=[{"source": file_path, "document_hash": document_hash}]
+    # Split the text into documents with metadata (in a worker thread for large inputs)
+    documents = await _split_off_loop(
+        _split_tokens,
+        content,
+        {"source": file_path, "document_hash": document_hash}
     )
     
     # Create chunk objects
     chunks = []
-    for i, doc in enumerate(documents):
-        chunk = doc.page_content
-        if not chunk.strip():
-            continue
-            
+    pending_rows = []
+    processed_hashes = chunk_repo.get_processed_hashes(document_name)
+    now_iso = datetime.now().isoformat()
+    for i, doc, chunk in _iter_chunks(documents):
         # Count words in chunk
         word_count = len(chunk.split())
         
         chunk_data = {
-            "content": chunk.strip(),
+            "content": chunk,
             "index": i,
             "metadata": {
                 "word_count": word_count,
@@ -1140,13 +1723,14 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
         }
         
         # Check if chunk has already been processed successfully
-        if chunk_repo.is_chunk_processed(chunk_data, document_name):
-            print(f"Chunk {i} has already been processed successfully, skipping...")
+        chunk_hash = ChunkRepository.content_hash(chunk)
+        if chunk_hash in processed_hashes:
+            logger.debug("Chunk %d has already been processed successfully, skipping", i)
             continue
             
-        # Store new chunk as pending
-        chunk_repo.store_chunk({
-            "timestamp": datetime.now().isoformat(),
+        # Queue new chunk to be stored as pending
+        pending_rows.append({
+            "timestamp": now_iso,
             "document_name": document_name,
             "source_url": "",
             "chunk_content": chunk_data["content"],
@@ -1156,6 +1740,7 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
             "error_message": None,
             "processing_time": None,
             "document_hash": document_hash,
+            "content_hash": chunk_hash,
             "all_facts_extracted": False,
             "metadata": chunk_data["metadata"]
         })
@@ -1163,11 +1748,14 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
         # Add chunk to list for processing
         chunks.append(chunk_data)
     
-    print(f"Split document into {len(chunks)} chunks")
+    # Store all new chunks with a single write, off the event loop
+    await asyncio.to_thread(chunk_repo.store_chunks, pending_rows)
+    
+    logger.info("Split document into %d chunks", len(chunks))
     
     # Step 2: Process chunks in parallel
     if not chunks:
-        print("No chunks to process, document may have been empty or already processed")
+        logger.info("No chunks to process, document may have been empty or already processed")
         state.complete_file(file_path)
         return {
             "status": "success",
@@ -1179,7 +1767,7 @@ async def process_document(file_path: str, state: ProcessingState, max_concurren
     
     try:
         # Process chunks in parallel
-        print(f"Processing {len(chunks)} chunks in parallel with {max_concurrent_chunks} workers")
+        logger.info("Processing %d chunks in parallel with %d workers", len(chunks), max_concurrent_chunks)
         result = await parallel_process_chunks(
             chunks=chunks,
             document_name=document_name,
@@ -1,14 +1,20 @@
 """
 Central configuration module for LLM settings.
-Configures Gemma 3 4B through Ollama using the ChatOpenAI wrapper.
+Configures Gemma 3 4B through Ollama using the ChatOpenAI wrapper, or an
+in-process vLLM engine when LLM_BACKEND=vllm (see src/vllm_backend.py).
 """
 
 import os
+import atexit
+import asyncio
 import logging
 import time
 import subprocess
+import httpx
 from langchain_openai import ChatOpenAI
 
+from src.config import config
+
 logger = logging.getLogger(__name__)
 
 # Ollama base URL - configurable via environment variable
@@ -24,6 +30,60 @@ RETRY_DELAY = 2  # Initial delay in seconds
 # Dummy API key for ChatOpenAI when using Ollama
 DUMMY_API_KEY = "dummy-key-for-ollama"
 
+# Connection pool shared by every LLM instance, sized so each request allowed
+# by the node-level LLM semaphore can hold its own keep-alive connection
+HTTP_LIMITS = httpx.Limits(
+    max_connections=config["max_concurrent_llm_requests"] * 2,
+    max_keepalive_connections=config["max_concurrent_llm_requests"]
+)
+
+def _http2_available() -> bool:
+    """
+    Check whether HTTP/2 can be used for the LLM endpoint.
+    
+    httpx only speaks HTTP/2 over TLS and needs the optional h2 package;
+    a plain-http local Ollama server always uses HTTP/1.1 keep-alive.
+    """
+    if not OLLAMA_BASE_URL.startswith("https://"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+_http_client = None
+_http_async_client = None
+
+def get_http_clients():
+    """
+    Get the pooled HTTP clients shared by all ChatOpenAI instances.
+    
+    Created on first use so connections (and TLS sessions) are reused across
+    every LLM call instead of each instance opening its own pool.
+    
+    Returns:
+        Tuple of (httpx.Client, httpx.AsyncClient)
+    """
+    global _http_client, _http_async_client
+    if _http_client is None:
+        http2 = _http2_available()
+        _http_client = httpx.Client(http2=http2, limits=HTTP_LIMITS, timeout=DEFAULT_TIMEOUT)
+        _http_async_client = httpx.AsyncClient(http2=http2, limits=HTTP_LIMITS, timeout=DEFAULT_TIMEOUT)
+        logger.info(f"Created pooled HTTP clients (http2={http2}, max_connections={HTTP_LIMITS.max_connections})")
+    return _http_client, _http_async_client
+
+@atexit.register
+def _close_http_clients():
+    """Close the pooled HTTP clients at interpreter exit."""
+    if _http_client is not None:
+        _http_client.close()
+    if _http_async_client is not None and not _http_async_client.is_closed:
+        try:
+            asyncio.run(_http_async_client.aclose())
+        except Exception as e:
+            logger.debug(f"Error closing async HTTP client: {str(e)}")
+
 def preload_model(model_name=MODEL_NAME):
     """
     Preload the model into RAM by making a call to Ollama directly.
@@ -84,7 +144,8 @@ def get_llm(temperature=DEFAULT_TEMPERATURE, timeout=DEFAULT_TIMEOUT):
     """
     for attempt in range(MAX_RETRIES):
         try:
-            # Configure ChatOpenAI to use Ollama
+            # Configure ChatOpenAI to use Ollama over the shared connection pool
+            http_client, http_async_client = get_http_clients()
             llm = ChatOpenAI(
                 model=MODEL_NAME,
                 temperature=temperature,
@@ -94,6 +155,8 @@ def get_llm(temperature=DEFAULT_TEMPERATURE, timeout=DEFAULT_TIMEOUT):
                 streaming=True,
                 max_retries=3,                    # Built-in retries
                 request_timeout=timeout,          # Explicit request timeout
+                http_client=http_client,
+                http_async_client=http_async_client,
             )
             
             # Test the connection to Ollama
@@ -118,10 +181,19 @@ def get_llm(temperature=DEFAULT_TEMPERATURE, timeout=DEFAULT_TIMEOUT):
                 logger.error(f"All {MAX_RETRIES} attempts to initialize LLM failed")
                 raise
 
-# Preload the model into RAM
-preload_success = preload_model()
-if not preload_success:
-    logger.warning("Model preloading failed, continuing without preloading")
+if config["llm_backend"] == "vllm":
+    # The engine loads the model itself, so there is no Ollama warm-up
+    from src.vllm_backend import VLLMChatBackend
+    default_llm = VLLMChatBackend(
+        config["vllm_model"],
+        temperature=DEFAULT_TEMPERATURE,
+        max_tokens=config["vllm_max_tokens"]
+    )
+else:
+    # Preload the model into RAM
+    preload_success = preload_model()
+    if not preload_success:
+        logger.warning("Model preloading failed, continuing without preloading")
 
-# Default singleton LLM instance with standard settings
-default_llm = get_llm() 
\ No newline at end of file
+    # Default singleton LLM instance with standard settings
+    default_llm = get_llm() 
\ No newline at end of file
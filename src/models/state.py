@@ -42,7 +42,7 @@ class WorkflowStateDict(TypedDict):
     chunks: List[TextChunkDict]  # Text chunks to process
     
     # Processing state
-    current_chunk_index: int  # Index of chunk being processed
+    current_chunk_index: int  # First chunk not yet extracted; nodes drain all remaining chunks in one pass
     extracted_facts: List[FactDict]  # Facts extracted so far
     
     # Memory state
@@ -53,7 +53,7 @@ class WorkflowStateDict(TypedDict):
     errors: List[str]  # Any errors encountered
     
     # Completion state
-    is_complete: bool  # Whether processing is complete
+    is_complete: bool  # Whether processing is complete (informational; the graph no longer loops on it)
 
 
 class MemoryDict(TypedDict):
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Script to compile the agent system prompts into gzip-compressed bytes.
+
+The plain-text prompt sources live in src/agents/prompt_sources/. This script
+compresses them and writes src/agents/_prompts_data.py, which is what
+src/agents/prompts.py decompresses lazily at runtime. Re-run it after editing
+any of the prompt sources:
+
+    python src/scripts/compile_prompts.py
+"""
+
+import gzip
+import os
+
+AGENTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "agents"))
+SOURCES_DIR = os.path.join(AGENTS_DIR, "prompt_sources")
+OUTPUT_PATH = os.path.join(AGENTS_DIR, "_prompts_data.py")
+
+# Generated constant name -> prompt source file
+PROMPT_SOURCES = {
+    "_EXTRACTOR_GZ": "fact_extractor_system.txt",
+    "_VERIFIER_GZ": "fact_verification_system.txt",
+}
+
+# Width of each bytes literal line in the generated module
+LINE_WIDTH = 64
+
+
+def read_source(file_name):
+    """Read a prompt source file, dropping the single trailing newline."""
+    with open(os.path.join(SOURCES_DIR, file_name), "r", encoding="utf-8") as f:
+        text = f.read()
+    if text.endswith("\n"):
+        text = text[:-1]
+    return text
+
+
+def compress_text(text):
+    """Compress prompt text deterministically (fixed mtime) so output is reproducible."""
+    return gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0)
+
+
+def format_bytes_literal(name, data):
+    """Format compressed bytes as a parenthesized, line-wrapped bytes literal."""
+    lines = [f"{name}: bytes = ("]
+    for start in range(0, len(data), LINE_WIDTH):
+        lines.append(f"    {data[start:start + LINE_WIDTH]!r}")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def compile_prompts():
+    """Compress every prompt source and write the generated data module."""
+    parts = [
+        '"""',
+        "Gzip-compressed system prompts used by src/agents/prompts.py.",
+        "",
+        "GENERATED FILE - do not edit by hand. Edit src/agents/prompt_sources/",
+        "and re-run: python src/scripts/compile_prompts.py",
+        '"""',
+        "",
+    ]
+    for name, file_name in PROMPT_SOURCES.items():
+        text = read_source(file_name)
+        data = compress_text(text)
+        print(f"{file_name}: {len(text)} chars -> {len(data)} compressed bytes")
+        parts.append(format_bytes_literal(name, data))
+        parts.append("")
+
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    compile_prompts()
@@ -2,8 +2,9 @@
 Repository for storing and managing text chunks.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
 from datetime import datetime
+import hashlib
 import os
 import pandas as pd
 import logging
@@ -20,6 +21,9 @@ class ChunkRepository:
         """Initialize the chunk repository with the path to the Excel file."""
         logging.debug("Initializing ChunkRepository with path: %s", excel_path)
         self.chunks: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        # document_hash -> (document_name, chunk_index) keys of its chunks, so
+        # duplicate-document checks don't scan every stored chunk
+        self._document_hash_index: Dict[str, Set[Tuple[str, int]]] = {}
         self.excel_path = excel_path
         self.lock = _chunk_repo_lock  # Use global lock to ensure all instances share the same lock
         
@@ -55,11 +59,35 @@ class ChunkRepository:
                                 metadata[metadata_key] = chunk_data.pop(col, None)
                         
                         chunk_data["metadata"] = metadata
+                        
+                        # Clean NaN values (empty cells) so checks like error_message is None hold
+                        for key, value in list(chunk_data.items()):
+                            if key != "metadata" and pd.isna(value):
+                                chunk_data[key] = None
+                        
                         self.chunks[document_name][chunk_index] = chunk_data
+                        self._index_chunk(chunk_data)
                         
                 except Exception as e:
                     print(f"Error loading chunks from Excel: {e}")
     
+    def _index_chunk(self, chunk_data: Dict[str, Any]) -> None:
+        """Add a chunk to the document hash index."""
+        document_hash = chunk_data.get("document_hash")
+        if document_hash:
+            self._document_hash_index.setdefault(document_hash, set()).add(
+                (chunk_data["document_name"], chunk_data["chunk_index"])
+            )
+    
+    def _unindex_chunk(self, chunk_data: Dict[str, Any]) -> None:
+        """Remove a chunk from the document hash index."""
+        document_hash = chunk_data.get("document_hash")
+        keys = self._document_hash_index.get(document_hash)
+        if keys is not None:
+            keys.discard((chunk_data["document_name"], chunk_data["chunk_index"]))
+            if not keys:
+                del self._document_hash_index[document_hash]
+    
     def _save_to_excel(self) -> None:
         """Save all chunks to Excel file."""
         with self.lock:
@@ -93,23 +121,47 @@ class ChunkRepository:
         Args:
             chunk_data: Dictionary containing chunk information
         """
+        self.store_chunks([chunk_data])
+    
+    def store_chunks(self, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Store several chunks, saving to Excel once.
+        
+        Args:
+            chunks: Dictionaries containing chunk information
+        """
+        if not chunks:
+            return
+        
         with self.lock:
-            document_name = chunk_data["document_name"]
-            chunk_index = chunk_data["chunk_index"]
-            
-            # Add all_facts_extracted field if not present
-            if "all_facts_extracted" not in chunk_data:
-                chunk_data["all_facts_extracted"] = False
-            
-            if document_name not in self.chunks:
-                self.chunks[document_name] = {}
+            last_updated = datetime.now().isoformat()
+            for chunk_data in chunks:
+                document_name = chunk_data["document_name"]
+                chunk_index = chunk_data["chunk_index"]
                 
-            self.chunks[document_name][chunk_index] = {
-                **chunk_data,
-                "last_updated": datetime.now().isoformat()
-            }
+                # Add all_facts_extracted field if not present
+                if "all_facts_extracted" not in chunk_data:
+                    chunk_data["all_facts_extracted"] = False
+                
+                # Store the content hash so processed-chunk lookups need not rehash
+                if not isinstance(chunk_data.get("content_hash"), str) and isinstance(chunk_data.get("chunk_content"), str):
+                    chunk_data["content_hash"] = self.content_hash(chunk_data["chunk_content"])
+                
+                if document_name not in self.chunks:
+                    self.chunks[document_name] = {}
+                
+                # A replaced chunk may have come from a different version of the document
+                previous = self.chunks[document_name].get(chunk_index)
+                if previous is not None:
+                    self._unindex_chunk(previous)
+                    
+                self.chunks[document_name][chunk_index] = {
+                    **chunk_data,
+                    "last_updated": last_updated
+                }
+                self._index_chunk(self.chunks[document_name][chunk_index])
             
-            # Save to Excel after each update
+            # Save to Excel once for the whole batch
             self._save_to_excel()
     
     async def async_store_chunk(self, chunk_data: Dict[str, Any]) -> None:
@@ -143,19 +195,43 @@ class ChunkRepository:
             error_message: Error message if any
             all_facts_extracted: Whether all facts have been extracted from the chunk
         """
+        self.update_chunk_statuses([{
+            "document_name": document_name,
+            "chunk_index": chunk_index,
+            "status": status,
+            "contains_facts": contains_facts,
+            "error_message": error_message,
+            "all_facts_extracted": all_facts_extracted
+        }])
+    
+    def update_chunk_statuses(self, updates: List[Dict[str, Any]]) -> None:
+        """
+        Update the status of several chunks, saving to Excel once.
+        
+        Args:
+            updates: Dictionaries with the update_chunk_status() arguments;
+                document_name, chunk_index and status are required, the
+                other fields are left unchanged when missing or None
+        """
         with self.lock:
-            if document_name in self.chunks and chunk_index in self.chunks[document_name]:
-                chunk = self.chunks[document_name][chunk_index]
-                chunk["status"] = status
-                if contains_facts is not None:
-                    chunk["contains_facts"] = contains_facts
-                if error_message is not None:
-                    chunk["error_message"] = error_message
-                if all_facts_extracted is not None:
-                    chunk["all_facts_extracted"] = all_facts_extracted
-                chunk["last_updated"] = datetime.now().isoformat()
+            last_updated = datetime.now().isoformat()
+            changed = False
+            for update in updates:
+                document_name = update["document_name"]
+                chunk_index = update["chunk_index"]
+                if document_name not in self.chunks or chunk_index not in self.chunks[document_name]:
+                    continue
                 
-                # Save to Excel after each update
+                chunk = self.chunks[document_name][chunk_index]
+                chunk["status"] = update["status"]
+                for field in ("contains_facts", "error_message", "all_facts_extracted"):
+                    if update.get(field) is not None:
+                        chunk[field] = update[field]
+                chunk["last_updated"] = last_updated
+                changed = True
+            
+            # Save to Excel once for the whole batch
+            if changed:
                 self._save_to_excel()
     
     async def async_update_chunk_status(
@@ -214,6 +290,98 @@ class ChunkRepository:
                 )
             return False
     
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Hash chunk content for processed-chunk lookups.
+        
+        Args:
+            content: Chunk text
+            
+        Returns:
+            str: Hex BLAKE2b digest of the content
+        """
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def document_hash(text: str, block_size: int = 1 << 20) -> str:
+        """
+        Hash a full document's text for duplicate-document detection.
+        
+        The text is encoded and hashed one block at a time, so a large
+        document is never copied into a single bytes object.
+        
+        Args:
+            text: Document text
+            block_size: Characters encoded per update
+            
+        Returns:
+            str: Hex BLAKE2b digest of the UTF-8 text
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for start in range(0, len(text), block_size):
+            digest.update(text[start:start + block_size].encode("utf-8"))
+        return digest.hexdigest()
+    
+    def get_processed_hashes(self, document_name: str) -> Set[str]:
+        """
+        Get the content hashes of a document's fully processed chunks.
+        
+        Loading these once lets callers check many chunks with set lookups
+        instead of one is_chunk_processed() call each.
+        
+        Args:
+            document_name: Name of the document
+            
+        Returns:
+            Set[str]: content_hash() of every chunk that has been processed
+                successfully with all facts extracted
+        """
+        with self.lock:
+            hashes = set()
+            for chunk in self.chunks.get(document_name, {}).values():
+                if not (
+                    chunk.get("status") == "processed"
+                    and chunk.get("error_message") is None
+                    and chunk.get("all_facts_extracted", False) == True
+                ):
+                    continue
+                # Chunks saved before content_hash was stored are hashed here
+                if isinstance(chunk.get("content_hash"), str):
+                    hashes.add(chunk["content_hash"])
+                elif isinstance(chunk.get("chunk_content"), str):
+                    hashes.add(self.content_hash(chunk["chunk_content"]))
+            return hashes
+    
+    def has_document_hash(self, document_hash: str) -> bool:
+        """
+        Check whether any chunk of a document with this content hash is stored.
+        
+        Args:
+            document_hash: Hash of the full document text
+            
+        Returns:
+            bool: True if chunks with this document hash exist
+        """
+        with self.lock:
+            return document_hash in self._document_hash_index
+    
+    def get_chunks_by_document_hash(self, document_hash: str) -> List[Dict[str, Any]]:
+        """
+        Get all chunks of a document by its content hash.
+        
+        Args:
+            document_hash: Hash of the full document text
+            
+        Returns:
+            List[Dict]: Chunks with this document hash
+        """
+        with self.lock:
+            return [
+                self.chunks[document_name][chunk_index].copy()
+                for document_name, chunk_index in self._document_hash_index.get(document_hash, ())
+            ]
+    
     def get_chunk(self, document_name: str, chunk_index: int) -> Optional[Dict[str, Any]]:
         """
         Get a chunk by document name and index.
@@ -253,6 +421,8 @@ class ChunkRepository:
         """
         with self.lock:
             if document_name in self.chunks:
+                for chunk_data in self.chunks[document_name].values():
+                    self._unindex_chunk(chunk_data)
                 del self.chunks[document_name]
                 
                 # Save to Excel after each update
@@ -2,7 +2,7 @@
 Repository for storing and managing extracted facts.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 import os
 import pandas as pd
@@ -48,6 +48,8 @@ class FactRepository:
             collection_name: Name of the ChromaDB collection to use
         """
         self.facts: Dict[str, List[Dict[str, Any]]] = {}
+        # Hashes of every stored statement, for constant-time duplicate checks
+        self._statement_hashes: Set[str] = set()
         self.excel_path = excel_path
         # Valid status values
         self.valid_statuses = ["verified", "rejected", "pending"]
@@ -63,6 +65,7 @@ class FactRepository:
         
         # Load existing facts from Excel if file exists
         self._load_from_excel()
+        self._rebuild_statement_hashes()
         
         logger.info(f"Initialized FactRepository with Excel path: {self.excel_path} and vector store in {vector_store_dir}")
         
@@ -291,8 +294,9 @@ class FactRepository:
         Returns:
             str: Hash of the fact
         """
-        # Use only the statement to create a unique hash
-        fact_text = fact_data.get("statement", "").strip()
+        # Use only the statement to create a unique hash (Excel can load
+        # numeric statements, so convert to text first)
+        fact_text = str(fact_data.get("statement") or "").strip()
         
         # Create a hash of the fact text to identify duplicates
         hash_input = fact_text.encode('utf-8')
@@ -308,16 +312,41 @@ class FactRepository:
         Returns:
             bool: True if the fact is a duplicate
         """
-        fact_hash = self._generate_fact_hash(fact_data)
+        return self._is_duplicate_fact(self._generate_fact_hash(fact_data))
+    
+    def has_fact(self, statement: str, document_name: str, original_text: str) -> bool:
+        """
+        Check if a statement is already stored for a document and original text.
         
-        # Check all facts in all documents
-        for document_name, facts_list in self.facts.items():
-            for existing_fact in facts_list:
-                existing_hash = self._generate_fact_hash(existing_fact)
-                if existing_hash == fact_hash:
-                    return True
+        A statement stored for another document or chunk does not count, as it
+        was verified against a different text.
         
-        return False
+        Args:
+            statement: The statement text
+            document_name: Name of the document the fact was extracted from
+            original_text: Text of the chunk the fact was extracted from
+            
+        Returns:
+            bool: True if the fact is already stored
+        """
+        if not self._is_duplicate_fact(self._generate_fact_hash({"statement": statement})):
+            return False
+        
+        statement = str(statement or "").strip()
+        with fact_repo_lock:
+            return any(
+                str(fact.get("statement") or "").strip() == statement
+                and (fact.get("original_text") or "") == (original_text or "")
+                for fact in self.facts.get(document_name, [])
+            )
+    
+    def _rebuild_statement_hashes(self) -> None:
+        """Recompute the statement hashes from the stored facts."""
+        self._statement_hashes = {
+            self._generate_fact_hash(fact)
+            for facts_list in self.facts.values()
+            for fact in facts_list
+        }
         
     def store_fact(self, fact_data: Dict[str, Any]) -> str:
         """
@@ -329,33 +358,60 @@ class FactRepository:
         Returns:
             String ID of the stored fact
         """
-        # Generate a unique ID for the fact
-        fact_id = self._generate_fact_id(fact_data)
-        
-        # Check for duplicates
-        fact_hash = self._generate_fact_hash(fact_data)
-        if self._is_duplicate_fact(fact_hash):
-            logger.info(f"Duplicate fact detected, skipping: {fact_data.get('statement', '')[:30]}...")
-            return fact_id
+        return self.store_facts([fact_data])[0]
+    
+    def store_facts(self, facts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store several facts, saving to Excel once and adding them to the
+        vector database in one batch.
         
-        # Store in Excel (existing implementation)
-        document_name = fact_data.get("document_name", "")
-        if document_name not in self.facts:
-            self.facts[document_name] = []
+        Args:
+            facts: Dictionaries containing fact data
             
-        self.facts[document_name].append(fact_data)
+        Returns:
+            String IDs of the facts, in input order (duplicates are not stored
+            again but still get an ID)
+        """
+        fact_ids = []
+        added = []
         
-        # Save to Excel
-        self._save_to_excel()
+        with fact_repo_lock:
+            for fact_data in facts:
+                # Generate a unique ID for the fact
+                fact_id = self._generate_fact_id(fact_data)
+                fact_ids.append(fact_id)
+                
+                # Check for duplicates, including earlier facts of this batch
+                fact_hash = self._generate_fact_hash(fact_data)
+                if self._is_duplicate_fact(fact_hash):
+                    logger.info(f"Duplicate fact detected, skipping: {fact_data.get('statement', '')[:30]}...")
+                    continue
+                
+                # Store in Excel (existing implementation)
+                document_name = fact_data.get("document_name", "")
+                if document_name not in self.facts:
+                    self.facts[document_name] = []
+                    
+                self.facts[document_name].append(fact_data)
+                self._statement_hashes.add(fact_hash)
+                added.append((fact_id, fact_hash, fact_data))
+            
+            if not added:
+                return fact_ids
+            
+            # Save to Excel once for the whole batch
+            self._save_to_excel()
         
         # Additionally, store in vector database
-        try:
+        extracted_at = str(datetime.now())
+        metadatas = []
+        for _, fact_hash, fact_data in added:
             # Create metadata for the vector store
             metadata = {
                 "document_name": fact_data.get("document_name", ""),
                 "chunk_index": fact_data.get("chunk_index", 0),
                 "source": fact_data.get("source_name", ""),
-                "extracted_at": str(datetime.now()),
+                "extracted_at": extracted_at,
                 "fact_hash": fact_hash,
                 "verification_status": fact_data.get("verification_status", "pending")
             }
@@ -365,20 +421,33 @@ class FactRepository:
                 for key, value in fact_data["metadata"].items():
                     if key not in metadata:  # Don't overwrite existing fields
                         metadata[key] = value
-            
-            # Add to vector store
-            self.vector_store.add_fact(
-                fact_id=fact_id,
-                statement=fact_data.get("statement", ""),
-                metadata=metadata
+            metadatas.append(metadata)
+        
+        try:
+            self.vector_store.add_facts_batch(
+                fact_ids=[fact_id for fact_id, _, _ in added],
+                statements=[fact_data.get("statement", "") for _, _, fact_data in added],
+                metadatas=metadatas
             )
-            logger.info(f"Fact {fact_id} added to vector store")
+            logger.info(f"{len(added)} facts added to vector store")
         except Exception as e:
-            logger.error(f"Error adding fact to vector store: {e}")
-            logger.error(traceback.format_exc())
-            # Still return the ID since it was stored in Excel
+            logger.error(f"Error adding facts batch to vector store: {e}")
+            # Fall back to one fact at a time so one bad fact (e.g. an ID
+            # collision) does not keep the others out of the vector store
+            for (fact_id, _, fact_data), metadata in zip(added, metadatas):
+                try:
+                    self.vector_store.add_fact(
+                        fact_id=fact_id,
+                        statement=fact_data.get("statement", ""),
+                        metadata=metadata
+                    )
+                    logger.info(f"Fact {fact_id} added to vector store")
+                except Exception as e:
+                    logger.error(f"Error adding fact to vector store: {e}")
+                    logger.error(traceback.format_exc())
+                    # Still keep the ID since it was stored in Excel
         
-        return fact_id
+        return fact_ids
     
     def get_facts(
         self,
@@ -503,6 +572,7 @@ class FactRepository:
                 # Remove from the list in reverse order to maintain correct indices
                 for index in sorted(indices_to_remove, reverse=True):
                     self.facts[document_name].pop(index)
+                self._rebuild_statement_hashes()
                 
                 # Save changes to Excel
                 self._save_to_excel()
@@ -559,6 +629,7 @@ class FactRepository:
                 if not fact_found:
                     logger.warning(f"No fact found with statement: {old_statement}")
                     return False
+                self._rebuild_statement_hashes()
                 
                 # Save changes to Excel
                 self._save_to_excel()
@@ -633,14 +704,7 @@ class FactRepository:
         Returns:
             bool: True if the fact is a duplicate
         """
-        # Check all facts in all documents
-        for document_name, facts_list in self.facts.items():
-            for existing_fact in facts_list:
-                existing_hash = self._generate_fact_hash(existing_fact)
-                if existing_hash == fact_hash:
-                    return True
-        
-        return False
+        return fact_hash in self._statement_hashes
     
     def _reload_facts_from_excel(self) -> None:
         """Reload facts from Excel file to ensure they're stored correctly."""
@@ -709,6 +773,8 @@ class FactRepository:
                 # Restore backup if loading fails
                 self.facts = facts_backup
                 return False
+            finally:
+                self._rebuild_statement_hashes()
                 
             return True
         return False
@@ -726,6 +792,7 @@ class FactRepository:
         with fact_repo_lock:  # Use lock to prevent concurrent modifications
             if document_name in self.facts:
                 del self.facts[document_name]
+                self._rebuild_statement_hashes()
                 # Save changes to Excel
                 self._save_to_excel()
                 logger.info(f"Cleared all facts for document: {document_name}")
@@ -1098,48 +1165,71 @@ class RejectedFactRepository:
         Args:
             fact_data: Dictionary containing rejected fact information
         """
+        self.store_rejected_facts([fact_data])
+    
+    def store_rejected_facts(self, facts: List[Dict[str, Any]]) -> None:
+        """
+        Store several rejected facts, skipping duplicates and saving to Excel once.
+        
+        Args:
+            facts: Dictionaries containing rejected fact information
+        """
+        with rejected_fact_repo_lock:  # Use lock to prevent concurrent modifications
+            stored = [fact_data for fact_data in facts if self._add_rejected_fact(fact_data)]
+            
+            # Save changes to Excel once for the whole batch
+            if stored:
+                self._save_to_excel()
+    
+    def _add_rejected_fact(self, fact_data: Dict[str, Any]) -> bool:
+        """
+        Add a rejected fact in memory without saving to Excel.
+        
+        Args:
+            fact_data: Dictionary containing rejected fact information
+            
+        Returns:
+            bool: True if the fact was added, False if it was a duplicate
+        """
         logger.info(f"store_rejected_fact called with statement: {fact_data.get('statement', '')[:40]}...")
         logger.info(f"Status: {fact_data.get('verification_status', 'None')}")
         logger.info(f"Rejection reason: {fact_data.get('rejection_reason', fact_data.get('verification_reason', 'None'))[:40]}...")
         
-        with rejected_fact_repo_lock:  # Use lock to prevent concurrent modifications
-            document_name = fact_data["document_name"]
-            
-            # Validate the verification status
-            if "verification_status" in fact_data:
-                status = fact_data["verification_status"]
-                if status not in self.valid_statuses:
-                    logger.warning(f"Warning: Invalid verification status '{status}'. Setting to 'rejected'.")
-                    fact_data["verification_status"] = "rejected"
-            else:
+        document_name = fact_data["document_name"]
+        
+        # Validate the verification status
+        if "verification_status" in fact_data:
+            status = fact_data["verification_status"]
+            if status not in self.valid_statuses:
+                logger.warning(f"Warning: Invalid verification status '{status}'. Setting to 'rejected'.")
                 fact_data["verification_status"] = "rejected"
-                
-            # Check if this is a duplicate fact - skip if it's explicitly marked as edited
-            if not fact_data.get("edited", False) and self.is_duplicate_fact(fact_data):
-                logger.info(f"Duplicate rejected fact detected, not storing: {fact_data.get('statement', '')[:40]}...")
-                return
-                
-            if document_name not in self.rejected_facts:
-                self.rejected_facts[document_name] = []
-                logger.info(f"Created new document entry in rejected facts: {document_name}")
-                
-            # Add timestamp if not present
-            if "timestamp" not in fact_data:
-                fact_data["timestamp"] = datetime.now().isoformat()
-                
-            # Ensure the rejection reason is set
-            if "rejection_reason" not in fact_data and "verification_reason" in fact_data:
-                fact_data["rejection_reason"] = fact_data["verification_reason"]
-                logger.info(f"Using verification_reason as rejection_reason: {fact_data['rejection_reason'][:40]}...")
-                
-            # Store the rejected fact
-            self.rejected_facts[document_name].append(fact_data)
+        else:
+            fact_data["verification_status"] = "rejected"
             
-            logger.info(f"Stored rejected fact: {fact_data.get('statement', '')[:40]}... in document: {document_name}")
-            logger.info(f"Current rejected fact count for document {document_name}: {len(self.rejected_facts[document_name])}")
+        # Check if this is a duplicate fact - skip if it's explicitly marked as edited
+        if not fact_data.get("edited", False) and self.is_duplicate_fact(fact_data):
+            logger.info(f"Duplicate rejected fact detected, not storing: {fact_data.get('statement', '')[:40]}...")
+            return False
             
-            # Save changes to Excel immediately
-            self._save_to_excel()
+        if document_name not in self.rejected_facts:
+            self.rejected_facts[document_name] = []
+            logger.info(f"Created new document entry in rejected facts: {document_name}")
+            
+        # Add timestamp if not present
+        if "timestamp" not in fact_data:
+            fact_data["timestamp"] = datetime.now().isoformat()
+            
+        # Ensure the rejection reason is set
+        if "rejection_reason" not in fact_data and "verification_reason" in fact_data:
+            fact_data["rejection_reason"] = fact_data["verification_reason"]
+            logger.info(f"Using verification_reason as rejection_reason: {fact_data['rejection_reason'][:40]}...")
+            
+        # Store the rejected fact
+        self.rejected_facts[document_name].append(fact_data)
+        
+        logger.info(f"Stored rejected fact: {fact_data.get('statement', '')[:40]}... in document: {document_name}")
+        logger.info(f"Current rejected fact count for document {document_name}: {len(self.rejected_facts[document_name])}")
+        return True
     
     def get_rejected_facts(
         self,
@@ -0,0 +1,101 @@
+"""
+Content-addressed cache for LLM responses.
+"""
+
+from typing import Optional
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Bump when the extraction or verification prompts change so stale entries are ignored
+PROMPT_VERSION = "v3"
+
+class LLMCache:
+    """SQLite-backed cache of LLM response text keyed by a content hash.
+
+    Extraction and verification prompts are near-deterministic, so re-running
+    the workflow over unchanged text can reuse earlier responses instead of
+    calling the model again.
+    """
+
+    def __init__(self, db_path: str = "src/data/llm_cache.sqlite"):
+        """Initialize the cache; the database file is only opened on first use."""
+        logger.debug("Initializing LLMCache with path: %s", db_path)
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database, creating the file and table if needed (call with lock held)."""
+        if self._conn is None:
+            # Ensure directory exists
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+                )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the prompt version and the prompt inputs.
+
+        Args:
+            *parts: Values that determine the response (stage, model, prompt inputs)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256(PROMPT_VERSION.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\x00")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        with self.lock:
+            row = self._connection().execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Key from make_key()
+            content: Response text
+        """
+        try:
+            with self.lock:
+                conn = self._connection()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content)
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write LLM cache entry: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self.lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM responses")
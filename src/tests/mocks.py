@@ -2,8 +2,10 @@
 Mock objects for testing.
 """
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock
-from typing import Tuple, Any
+from typing import Callable, Dict, List, Tuple, Any, Union
 
 class MockLLM:
     """Mock LLM for testing."""
@@ -24,6 +26,96 @@ class MockNodes:
         """Mock create_workflow function."""
         return Mock(), "input"
 
+# Verifier responses in the single-fact prompt's format
+VALID_VERDICT = "<is_valid>true</is_valid><reasoning>Stated in the text</reasoning>"
+INVALID_VERDICT = "<is_valid>false</is_valid><reasoning>Not in the text</reasoning>"
+
+class FakeChatLLM:
+    """Configurable chat model stand-in for the extraction and verification code.
+    
+    Requests are told apart by their prompt: batch verification prompts list
+    "Candidate facts:", single-fact verification prompts contain "Submitted
+    fact:", and anything else is an extraction prompt. ainvoke() returns the
+    whole response; astream() yields it in pieces, yielding to the event loop
+    after each one so verification can run while extraction is streaming.
+    
+    Args:
+        extraction: Response to extraction prompts
+        verification: Response to single-fact prompts, or a function of the prompt text
+        batch_verification: Response to batch verification prompts
+        stream_pieces: Pieces to stream extraction responses in (default: 7 characters each)
+        stream_error: Exception raised once the extraction pieces are streamed
+    """
+    
+    def __init__(
+        self,
+        extraction: str = "",
+        verification: Union[str, Callable[[str], str]] = VALID_VERDICT,
+        batch_verification: str = "",
+        stream_pieces: List[str] = None,
+        stream_error: Exception = None
+    ):
+        self.extraction = extraction
+        self.verification = verification
+        self.batch_verification = batch_verification
+        self.stream_pieces = stream_pieces
+        self.stream_error = stream_error
+        # Messages of every request, and "verify"/"extraction done" events in order
+        self.calls: List[Any] = []
+        self.events: List[str] = []
+        self.streamed = 0
+    
+    def _respond(self, messages) -> Tuple[str, bool]:
+        """Log a request and return its response text and whether it is an extraction."""
+        self.calls.append(messages)
+        last = messages[-1]
+        prompt = last["content"] if isinstance(last, dict) else last.content
+        if "Candidate facts:" in prompt:
+            self.events.append("verify")
+            return self.batch_verification, False
+        if "Submitted fact:" in prompt:
+            self.events.append("verify")
+            if callable(self.verification):
+                return self.verification(prompt), False
+            return self.verification, False
+        return self.extraction, True
+    
+    async def ainvoke(self, messages):
+        content, _ = self._respond(messages)
+        return SimpleNamespace(content=content)
+    
+    async def astream(self, messages):
+        content, is_extraction = self._respond(messages)
+        if is_extraction and self.stream_pieces is not None:
+            pieces = self.stream_pieces
+        else:
+            pieces = [content[start:start + 7] for start in range(0, len(content), 7)]
+        for piece in pieces:
+            self.streamed += 1
+            yield SimpleNamespace(content=piece)
+            # Give the verification workers a chance to run between pieces
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        if is_extraction:
+            if self.stream_error is not None:
+                raise self.stream_error
+            self.events.append("extraction done")
+
+def make_fact(
+    statement: str,
+    original_text: str = "Revenue grew 12% in 2023. The plant produces 500 units per day.",
+    document_name: str = "test.txt",
+    source_chunk: int = 0
+) -> Dict[str, Any]:
+    """Create a pending fact as the extraction nodes do."""
+    return {
+        "statement": statement,
+        "document_name": document_name,
+        "original_text": original_text,
+        "source_chunk": source_chunk,
+        "verification_status": "pending"
+    }
+
 # Create mock instances
 mock_llm = MockLLM()
 mock_submission = MockSubmission()
@@ -0,0 +1,94 @@
+"""
+Test script to verify that duplicate facts are only sent to the LLM once for verification.
+"""
+
+import os
+import sys
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.graph import nodes
+from src.models.state import create_initial_state
+from src.tests.mocks import FakeChatLLM, make_fact
+
+def test_statement_key_normalizes():
+    """Test that case and whitespace differences map to the same key."""
+    assert nodes._statement_key("Revenue grew  12%\nin 2023 ") == nodes._statement_key("revenue GREW 12% in 2023")
+    assert nodes._statement_key("Revenue grew 12% in 2023") != nodes._statement_key("Revenue grew 13% in 2023")
+
+@pytest.mark.asyncio
+async def test_validator_verifies_duplicates_once(monkeypatch):
+    """Test that duplicate statements from overlapping chunks share one verification."""
+    llm = FakeChatLLM()
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", False)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="test.txt")
+    state["extracted_facts"] = [
+        make_fact("Revenue grew 12% in 2023"),
+        make_fact("The plant produces 500 units per day"),
+        make_fact("revenue grew 12%  in 2023", source_chunk=1),
+    ]
+
+    result = await nodes.validator_node(state)
+
+    assert len(llm.calls) == 2
+    assert [f["verification_status"] for f in result["extracted_facts"]] == ["verified"] * 3
+    assert result["memory"]["performance_metrics"]["duplicate_facts_skipped"] == 1
+
+@pytest.mark.asyncio
+async def test_validator_skips_stored_facts(monkeypatch):
+    """Test that only facts stored for the same document and text skip verification."""
+    llm = FakeChatLLM()
+    original_text = make_fact("")["original_text"]
+    stored = {
+        ("Revenue grew 12% in 2023", "test.txt", original_text),
+        # Stored for another document only, so still verified for this one
+        ("The plant produces 500 units per day", "other.txt", original_text),
+    }
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", False)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.side_effect": lambda *fact: fact in stored}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="test.txt")
+    state["extracted_facts"] = [
+        make_fact("Revenue grew 12% in 2023"),
+        make_fact("The plant produces 500 units per day"),
+    ]
+
+    result = await nodes.validator_node(state)
+
+    assert len(llm.calls) == 1
+    assert [f["verification_status"] for f in result["extracted_facts"]] == ["verified"] * 2
+    assert result["memory"]["performance_metrics"]["stored_facts_skipped"] == 1
+
+@pytest.mark.asyncio
+async def test_identical_requests_in_flight_share_one_call(monkeypatch):
+    """Test that concurrent requests with the same key, e.g. a chunk repeated across documents, call the LLM once."""
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    calls = 0
+
+    async def invoke():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return MagicMock(content="<fact>Revenue grew 12% in 2023</fact>")
+
+    state = create_initial_state(input_text="", document_name="test.txt")
+    key = nodes.LLMCache.make_key("extract", "model", "Same boilerplate paragraph")
+    results = await asyncio.gather(*(nodes._invoke_cached(key, invoke, state) for _ in range(3)))
+
+    assert calls == 1
+    assert results == ["<fact>Revenue grew 12% in 2023</fact>"] * 3
+    assert state["memory"]["performance_metrics"]["llm_requests_shared"] == 2
@@ -0,0 +1,34 @@
+"""
+Test script to verify the content-addressed LLM response cache.
+"""
+
+import os
+import sys
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.storage.llm_cache import LLMCache
+
+def test_cache_round_trip(tmp_path):
+    """Test storing and reading back a response, including across instances."""
+    db_path = str(tmp_path / "cache" / "llm_cache.sqlite")
+    cache = LLMCache(db_path)
+    assert not os.path.exists(db_path)
+    key = LLMCache.make_key("extract", "gemma3:4b", "Chunk text")
+
+    assert cache.get(key) is None
+    cache.set(key, "<fact>Chunk fact</fact>")
+    assert cache.get(key) == "<fact>Chunk fact</fact>"
+    assert LLMCache(db_path).get(key) == "<fact>Chunk fact</fact>"
+
+    cache.clear()
+    assert cache.get(key) is None
+
+def test_make_key_separates_parts():
+    """Test that keys depend on every part and on part boundaries."""
+    key = LLMCache.make_key("verify", "fact", "original")
+    assert len(key) == 64
+    assert key == LLMCache.make_key("verify", "fact", "original")
+    assert key != LLMCache.make_key("verify", "fac", "toriginal")
+    assert key != LLMCache.make_key("extract", "fact", "original")
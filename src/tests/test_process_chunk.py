@@ -0,0 +1,64 @@
+"""
+Test script to verify that process_chunk stores facts by the verifier's verdict.
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.graph import nodes
+from src.storage.llm_cache import LLMCache
+from src.tests.mocks import FakeChatLLM, VALID_VERDICT
+
+def make_llm() -> FakeChatLLM:
+    """Create an LLM stand-in that extracts two facts and rejects the second."""
+    return FakeChatLLM(
+        extraction="<fact>Revenue grew 12% in 2023</fact>\n<fact>Revenue doubled in 2023</fact>",
+        verification=lambda prompt: (
+            VALID_VERDICT if prompt.endswith("Revenue grew 12% in 2023")
+            else "<is_valid>false</is_valid><reasoning>The text says 12%</reasoning>"
+        )
+    )
+
+@pytest.mark.asyncio
+async def test_process_chunk_stores_verdicts(monkeypatch):
+    """Test that verified and rejected facts are stored and the chunk is only then marked processed."""
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    fact_repo, rejected_fact_repo = MagicMock(), MagicMock()
+    status_updates = []
+
+    result = await nodes.process_chunk(
+        {"content": "Revenue grew 12% in 2023.", "index": 0, "metadata": {}},
+        "chunk.txt", "", MagicMock(), fact_repo, rejected_fact_repo, make_llm(),
+        status_updates=status_updates
+    )
+
+    assert result["status"] == "success"
+    assert (result["verified_facts"], result["rejected_facts"]) == (1, 1)
+    [verified] = fact_repo.store_facts.call_args.args[0]
+    assert verified["statement"] == "Revenue grew 12% in 2023"
+    assert verified["verification_status"] == "verified"
+    [rejected] = rejected_fact_repo.store_rejected_facts.call_args.args[0]
+    assert rejected["verification_status"] == "rejected"
+    assert rejected["verification_reason"] == "The text says 12%"
+    assert status_updates[-1]["status"] == "processed"
+
+@pytest.mark.asyncio
+async def test_process_chunk_uses_llm_cache(monkeypatch, tmp_path):
+    """Test that process_chunk answers a repeated chunk from the LLM cache."""
+    monkeypatch.setattr(nodes, "llm_cache", LLMCache(str(tmp_path / "cache.sqlite")))
+    llm = make_llm()
+    chunk = {"content": "Revenue grew 12% in 2023.", "index": 0, "metadata": {}}
+
+    for _ in range(2):
+        result = await nodes.process_chunk(
+            chunk, "chunk.txt", "", MagicMock(), MagicMock(), MagicMock(), llm, status_updates=[]
+        )
+        assert (result["verified_facts"], result["rejected_facts"]) == (1, 1)
+
+    # One extraction and two verifications, all on the first pass
+    assert len(llm.calls) == 3
@@ -0,0 +1,156 @@
+"""
+Test script to verify the agent prompt templates and their helpers.
+"""
+
+import os
+import sys
+import pytest
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.agents import prompts
+
+def test_render_matches_extractor_template():
+    """Test that render() produces the same messages as the extractor template."""
+    text = "The H100 GPU achieves 1000 TFLOPS in FP8 precision."
+    rendered = prompts.render(text)
+    expected = prompts.FACT_EXTRACTOR_PROMPT.format_messages(text=text)
+
+    assert [m.content for m in rendered] == [m.content for m in expected]
+    # The chunk text must be the very last thing in the prompt
+    assert rendered[-1].content.endswith(text)
+
+def test_batch_verification_prompt_variables():
+    """Test the batch verification prompt inputs and output instructions."""
+    prompt = prompts.FACT_VERIFICATION_BATCH_PROMPT
+    assert sorted(prompt.input_variables) == ["candidate_facts", "original_text"]
+
+    messages = prompt.format_messages(
+        original_text="Original text",
+        candidate_facts=prompts.format_candidate_facts(["Fact A", "Fact B"])
+    )
+    assert '<verdict id="1">' in messages[0].content
+    assert "<is_valid>true/false</is_valid>" not in messages[0].content
+    assert messages[1].content.endswith("Candidate facts:\n1. Fact A\n2. Fact B")
+
+def test_format_candidate_facts_cap():
+    """Test that batches larger than MAX_BATCH_FACTS are refused."""
+    with pytest.raises(ValueError):
+        prompts.format_candidate_facts(["fact"] * (prompts.MAX_BATCH_FACTS + 1))
+
+def test_parse_verdicts():
+    """Test parsing verdicts, including case, whitespace and missing ids."""
+    output = (
+        '<verdict id="1">valid</verdict>\n'
+        '<verdict id="2"> Invalid </verdict>\n'
+        '<verdict id="4">valid</verdict>'
+    )
+    assert prompts.parse_verdicts(output) == {1: True, 2: False, 4: True}
+    assert prompts.parse_verdicts("no verdicts here") == {}
+
+def test_parse_reasoned_verdicts():
+    """Test that only verdicts with a reasoning are returned, with the reasoning."""
+    output = (
+        '<verdict id="1"><reasoning> Stated in the chunk </reasoning>valid</verdict>\n'
+        '<verdict id="2">invalid</verdict>\n'
+        '<verdict id="3"><reasoning>Wrong year</reasoning> Invalid </verdict>'
+    )
+    assert prompts.parse_reasoned_verdicts(output) == {1: (True, "Stated in the chunk"), 3: (False, "Wrong year")}
+    assert prompts.parse_verdicts(output) == {1: True, 2: False, 3: False}
+
+def test_parse_verdict_tags():
+    """Test parsing single-fact verdict tags in either order."""
+    assert prompts.parse_verdict_tags("<is_valid>true</is_valid><reasoning> Stated </reasoning>") == (True, "Stated")
+    assert prompts.parse_verdict_tags("<reasoning>\nNot in text\n</reasoning>\n<is_valid>False</is_valid>") == (False, "Not in text")
+    assert prompts.parse_verdict_tags("<is_valid>true</is_valid>") is None
+
+def test_select_prompt_variant():
+    """Test that small or quantized local models get the short extractor prompt."""
+    assert prompts.select_prompt_variant("gemma3:4b") == "short"
+    assert prompts.select_prompt_variant("llama3:8b-instruct-q4_K_M") == "short"
+    assert prompts.select_prompt_variant("phi3") == "short"
+    assert prompts.select_prompt_variant("gpt-4o") == "full"
+    assert prompts.select_prompt_variant("llama3:70b") == "full"
+    assert prompts.select_prompt_variant("gemma:2b") == "short"
+    assert prompts.select_prompt_variant("dolphin-mixtral:8x7b") == "full"
+    assert prompts.select_prompt("gemma3:4b") is prompts.FACT_EXTRACTOR_PROMPT_SHORT
+    assert prompts.get_extractor_prompt_name("auto", "gemma3:4b") == "FACT_EXTRACTOR_PROMPT_SHORT"
+    assert prompts.get_extractor_prompt_name("full", "gemma3:4b") == "FACT_EXTRACTOR_PROMPT"
+
+def test_short_prompt_shares_criteria():
+    """Test that the short extractor prompt reuses the full prompt's criteria."""
+    full = prompts.get_system_text("FACT_EXTRACTOR_PROMPT")
+    short = prompts.get_system_text("FACT_EXTRACTOR_PROMPT_SHORT")
+
+    assert len(short) < len(full) / 3
+    assert "STRICT EXTRACTION CRITERIA:" in short
+    assert "Example 2:" in short and "Example 3:" not in short
+    assert prompts.FACT_EXTRACTOR_PROMPT_SHORT.input_variables == ["text"]
+
+def test_render_extractor_plain_dicts():
+    """Test that render_extractor() returns role/content dicts matching render()."""
+    text = "Tesla's Model Y production line in Texas outputs 5,000 vehicles per week."
+    messages = prompts.render_extractor(text)
+
+    assert [m["role"] for m in messages] == ["system", "user"]
+    assert [m["content"] for m in messages] == [m.content for m in prompts.render(text)]
+
+def test_parse_facts():
+    """Test parsing both fact tag shapes and skipping "None" facts."""
+    output = (
+        "<fact 1>AMD's EPYC 9994X features 128 cores</fact 1>\n"
+        "<fact>NVIDIA's H200 delivers 141 petaFLOPS of FP8 performance</fact>\n"
+        "<fact 3> None </fact 3>"
+    )
+    assert prompts.parse_facts(output) == [
+        "AMD's EPYC 9994X features 128 cores",
+        "NVIDIA's H200 delivers 141 petaFLOPS of FP8 performance"
+    ]
+    assert prompts.NONE_FACT_RE.search("<fact 1>None</fact 1>")
+    assert prompts.parse_facts("<fact 1>None</fact 1>") == []
+
+def test_render_verification_matches_templates():
+    """Test that the verification renderers match the verification templates."""
+    single = prompts.render_verification("Fact {A}", "Original text")
+    expected = prompts.FACT_VERIFICATION_PROMPT.format_messages(fact_text="Fact {A}", original_text="Original text")
+    assert [m["content"] for m in single] == [m.content for m in expected]
+    assert single[0]["content"] is prompts.render_verification("Other", "Other")[0]["content"]
+
+    batch = prompts.render_verification_batch(["Fact A", "Fact B"], "Original text")
+    expected = prompts.FACT_VERIFICATION_BATCH_PROMPT.format_messages(
+        original_text="Original text",
+        candidate_facts=prompts.format_candidate_facts(["Fact A", "Fact B"])
+    )
+    assert [m.content for m in prompts.to_messages(batch)] == [m.content for m in expected]
+
+def test_extractor_prefix_is_stable():
+    """Test that the extractor prompt prefix is the same for every chunk, including after rendering other prompts."""
+    for name in ("FACT_EXTRACTOR_PROMPT", "FACT_EXTRACTOR_PROMPT_SHORT"):
+        first = prompts.render_extractor("Chunk one", name)
+        prompts.render_verification("Fact", "Chunk one")
+        second = prompts.render_extractor("Chunk two", name)
+        # The cached system text is reused as the same object, so it is sent byte-identical
+        assert first[0]["content"] is second[0]["content"], name
+        assert first[1]["content"] == prompts.FACT_EXTRACTOR_HUMAN_PREFIX + "Chunk one", name
+        assert second[1]["content"] == prompts.FACT_EXTRACTOR_HUMAN_PREFIX + "Chunk two", name
+
+def test_variable_data_only_in_prompt_suffix():
+    """Test that prompts differ only at the end, so servers can cache the static prefix."""
+    renderers = {
+        "FACT_EXTRACTOR_PROMPT": lambda value: prompts.render_extractor(value),
+        "FACT_EXTRACTOR_PROMPT_SHORT": lambda value: prompts.render_extractor(value, "FACT_EXTRACTOR_PROMPT_SHORT"),
+        "FACT_VERIFICATION_PROMPT": lambda value: prompts.render_verification(value, "Original chunk"),
+        "FACT_VERIFICATION_BATCH_PROMPT": lambda value: prompts.render_verification_batch([value], "Original chunk"),
+    }
+    for name, render in renderers.items():
+        first, second = render("A"), render("B")
+        # System turns are fully static
+        assert first[:-1] == second[:-1], name
+        # The human turn differs only in its last character
+        assert first[-1]["content"][:-1] == second[-1]["content"][:-1], name
+        assert first[-1]["content"][-1] == "A" and second[-1]["content"][-1] == "B", name
+
+        # The system template has no variables, so nothing per-call can leak into it
+        template = getattr(prompts, name)
+        assert template.messages[0].prompt.input_variables == [], name
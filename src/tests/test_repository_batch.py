@@ -0,0 +1,135 @@
+"""
+Test script to verify the batched chunk repository writes.
+"""
+
+import os
+import sys
+import hashlib
+from unittest.mock import patch
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.storage.chunk_repository import ChunkRepository
+
+def make_chunk(index: int) -> dict:
+    """Create a pending chunk record."""
+    return {
+        "timestamp": "2024-01-01T00:00:00",
+        "document_name": "batch.txt",
+        "source_url": "",
+        "chunk_content": f"Chunk {index} content",
+        "chunk_index": index,
+        "status": "pending",
+        "contains_facts": False,
+        "error_message": None,
+        "processing_time": None,
+        "document_hash": "abc",
+        "metadata": {"word_count": 3}
+    }
+
+def test_store_chunks_saves_once(tmp_path):
+    """Test that store_chunks writes Excel once and persists every chunk."""
+    excel_path = str(tmp_path / "chunks.xlsx")
+    repo = ChunkRepository(excel_path=excel_path)
+
+    with patch.object(repo, "_save_to_excel", wraps=repo._save_to_excel) as save:
+        repo.store_chunks([make_chunk(i) for i in range(3)])
+    assert save.call_count == 1
+
+    reloaded = ChunkRepository(excel_path=excel_path)
+    assert len(reloaded.get_chunks_for_document("batch.txt")) == 3
+    assert reloaded.get_chunk("batch.txt", 2)["all_facts_extracted"] == False
+
+def test_update_chunk_statuses_saves_once(tmp_path):
+    """Test batched status updates, skipping unknown chunks."""
+    repo = ChunkRepository(excel_path=str(tmp_path / "chunks.xlsx"))
+    repo.store_chunks([make_chunk(i) for i in range(2)])
+
+    with patch.object(repo, "_save_to_excel", wraps=repo._save_to_excel) as save:
+        repo.update_chunk_statuses([
+            {"document_name": "batch.txt", "chunk_index": 0, "status": "processed",
+             "contains_facts": True, "all_facts_extracted": True},
+            {"document_name": "batch.txt", "chunk_index": 1, "status": "error",
+             "error_message": "boom"},
+            {"document_name": "other.txt", "chunk_index": 0, "status": "processed"},
+        ])
+    assert save.call_count == 1
+
+    first = repo.get_chunk("batch.txt", 0)
+    assert first["status"] == "processed" and first["contains_facts"] and first["all_facts_extracted"]
+    second = repo.get_chunk("batch.txt", 1)
+    assert second["status"] == "error" and second["error_message"] == "boom"
+    assert second["contains_facts"] == False
+    assert repo.get_chunk("other.txt", 0) is None
+
+def test_get_processed_hashes(tmp_path):
+    """Test that only fully processed chunks are reported by content hash."""
+    repo = ChunkRepository(excel_path=str(tmp_path / "chunks.xlsx"))
+    repo.store_chunks([make_chunk(i) for i in range(3)])
+    repo.update_chunk_statuses([
+        {"document_name": "batch.txt", "chunk_index": 0, "status": "processed", "all_facts_extracted": True},
+        {"document_name": "batch.txt", "chunk_index": 1, "status": "processed"},
+    ])
+
+    processed = repo.get_processed_hashes("batch.txt")
+    assert processed == {ChunkRepository.content_hash("Chunk 0 content")}
+    assert repo.get_chunk("batch.txt", 0)["content_hash"] == ChunkRepository.content_hash("Chunk 0 content")
+    
+    # Stored hashes survive a reload from Excel
+    reloaded = ChunkRepository(excel_path=repo.excel_path)
+    assert reloaded.get_processed_hashes("batch.txt") == processed
+    assert repo.is_chunk_processed({"index": 0}, "batch.txt")
+    assert repo.get_processed_hashes("missing.txt") == set()
+
+def test_document_hash_index(tmp_path):
+    """Test document hash lookups across store, reload, replace and clear."""
+    repo = ChunkRepository(excel_path=str(tmp_path / "chunks.xlsx"))
+    repo.store_chunks([make_chunk(i) for i in range(2)])
+    assert repo.has_document_hash("abc")
+    assert not repo.has_document_hash("missing")
+    assert sorted(c["chunk_index"] for c in repo.get_chunks_by_document_hash("abc")) == [0, 1]
+
+    reloaded = ChunkRepository(excel_path=repo.excel_path)
+    assert len(reloaded.get_chunks_by_document_hash("abc")) == 2
+
+    # Replacing both chunks with a new version of the document moves them to its hash
+    repo.store_chunks([{**make_chunk(i), "document_hash": "def"} for i in range(2)])
+    assert not repo.has_document_hash("abc")
+    assert repo.has_document_hash("def")
+
+    repo.clear_document("batch.txt")
+    assert not repo.has_document_hash("def")
+    assert repo.get_chunks_by_document_hash("def") == []
+
+def test_document_hash_blocks_match_whole_text():
+    """Test that block-wise document hashing equals hashing the whole text."""
+    text = "Revenue grew 12% in 2023. Überschuss: 5 €.\n" * 50
+    expected = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    assert ChunkRepository.document_hash(text, block_size=7) == expected
+    assert ChunkRepository.document_hash(text) == expected
+
+def test_has_fact_tracks_stored_facts(tmp_path):
+    """Test that stored facts are found by document and text, across reloads and removals."""
+    from src.storage.fact_repository import FactRepository
+
+    excel_path = str(tmp_path / "facts.xlsx")
+    text = "Revenue grew 12% in 2023."
+    repo = FactRepository(excel_path=excel_path)
+    repo.store_facts([
+        {"statement": "Revenue grew 12% in 2023", "document_name": "a.txt", "original_text": text,
+         "verification_status": "verified"},
+        {"statement": "Revenue grew 12% in 2023 ", "document_name": "b.txt", "original_text": text,
+         "verification_status": "verified"},
+    ])
+    assert repo.has_fact("Revenue grew 12% in 2023", "a.txt", text)
+    assert not repo.has_fact("Revenue grew 13% in 2023", "a.txt", text)
+    # The duplicate from b.txt was not stored, and other texts don't count
+    assert not repo.has_fact("Revenue grew 12% in 2023", "b.txt", text)
+    assert not repo.has_fact("Revenue grew 12% in 2023", "a.txt", "Revenue grew 12% in 2023 and 9% in 2022.")
+    assert len(repo.get_all_facts()) == 1
+
+    assert FactRepository(excel_path=excel_path).has_fact("Revenue grew 12% in 2023", "a.txt", text)
+
+    repo.remove_fact("a.txt", "Revenue grew 12% in 2023")
+    assert not repo.has_fact("Revenue grew 12% in 2023", "a.txt", text)
@@ -0,0 +1,127 @@
+"""
+Test script to verify that streamed facts are verified before extraction finishes.
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.graph import nodes
+from src.models.state import create_initial_state
+from src.tests.mocks import FakeChatLLM
+
+def make_llm(**kwargs) -> FakeChatLLM:
+    """Create an LLM stand-in that streams two facts, and any other FakeChatLLM settings."""
+    return FakeChatLLM(
+        stream_pieces=["<fact>Revenue grew ", "12% in 2023</fact>\n", "<fact>The plant produces ",
+                       "500 units per day</fact>", "\n<fact>None</fact>"],
+        **kwargs
+    )
+
+@pytest.mark.asyncio
+async def test_streamed_facts_verified_during_extraction(monkeypatch):
+    """Test that the first fact is verified while the extraction response is still streaming."""
+    llm = make_llm()
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", False)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="stream.txt")
+    state["chunks"] = [{"content": "Revenue grew 12% in 2023. The plant produces 500 units per day.",
+                        "index": 0, "metadata": {}}]
+
+    result = await nodes.extract_and_verify_node(state)
+
+    assert llm.events.index("verify") < llm.events.index("extraction done")
+    assert [f["statement"] for f in result["extracted_facts"]] == [
+        "Revenue grew 12% in 2023",
+        "The plant produces 500 units per day"
+    ]
+    assert [f["verification_status"] for f in result["extracted_facts"]] == ["verified", "verified"]
+
+@pytest.mark.asyncio
+async def test_chunk_facts_verified_in_one_batch(monkeypatch):
+    """Test that with batch verification a chunk's facts are verified with one request after extraction."""
+    llm = make_llm(batch_verification=(
+        '<verdict id="1"><reasoning>Stated in the text</reasoning>valid</verdict>\n'
+        '<verdict id="2"><reasoning>The text gives no output figure</reasoning>invalid</verdict>'
+    ))
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", True)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="stream.txt")
+    state["chunks"] = [{"content": "Revenue grew 12% in 2023. The plant produces 500 units per day.",
+                        "index": 0, "metadata": {}}]
+
+    result = await nodes.extract_and_verify_node(state)
+
+    assert llm.events == ["extraction done", "verify"]
+    assert [(f["verification_status"], f["verification_reason"]) for f in result["extracted_facts"]] == [
+        ("verified", "Stated in the text"),
+        ("rejected", "The text gives no output figure")
+    ]
+
+@pytest.mark.asyncio
+async def test_factless_chunks_skip_extraction(monkeypatch):
+    """Test that chunks without digits or capitalized words are not sent to the LLM."""
+    llm = make_llm()
+    chunk_repo = MagicMock()
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "SKIP_FACTLESS_CHUNKS", True)
+    monkeypatch.setattr(nodes, "chunk_repo", chunk_repo)
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="stream.txt")
+    state["chunks"] = [{"content": "-- continued on next page --\n\n* * *", "index": 0, "metadata": {}}]
+
+    result = await nodes.extract_and_verify_node(state)
+
+    assert llm.events == []
+    assert result["extracted_facts"] == []
+    assert result["memory"]["performance_metrics"]["factless_chunks_skipped"] == 1
+    status = chunk_repo.update_chunk_statuses.call_args_list[0].args[0][0]
+    assert status["status"] == "processed" and not status["contains_facts"]
+
+@pytest.mark.asyncio
+async def test_failed_stream_facts_not_stored(monkeypatch):
+    """Test that facts streamed before an extraction error are not stored or counted."""
+    llm = FakeChatLLM(
+        stream_pieces=["<fact>Revenue grew 12% in 2023</fact>\n"],
+        stream_error=ConnectionError("stream interrupted")
+    )
+    chunk_repo = MagicMock()
+    fact_repo = MagicMock(**{"has_fact.return_value": False})
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    # Verify the fact as it streams, before the stream breaks off
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", False)
+    monkeypatch.setattr(nodes, "chunk_repo", chunk_repo)
+    monkeypatch.setattr(nodes, "fact_repo", fact_repo)
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="stream.txt")
+    state["chunks"] = [{"content": "Revenue grew 12% in 2023.", "index": 0, "metadata": {}}]
+
+    result = await nodes.extract_and_verify_node(state)
+
+    assert result["extracted_facts"] == []
+    assert fact_repo.store_facts.call_args.args[0] == []
+    [extraction_status], verification_statuses = (
+        call.args[0] for call in chunk_repo.update_chunk_statuses.call_args_list
+    )
+    assert extraction_status["status"] == "error"
+    assert verification_statuses == []
+    assert llm.events == ["verify"]
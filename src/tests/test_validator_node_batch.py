@@ -0,0 +1,66 @@
+"""
+Test script to verify batched fact verification in validator_node.
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.graph import nodes
+from src.models.state import create_initial_state
+from src.tests.mocks import FakeChatLLM, make_fact
+
+@pytest.mark.asyncio
+async def test_validator_batches_facts_per_chunk(monkeypatch):
+    """Test one batch request per chunk, with single-fact fallback for missing verdicts."""
+    llm = FakeChatLLM(batch_verification=(
+        '<verdict id="1"><reasoning>Chunk one states it</reasoning>valid</verdict>\n'
+        '<verdict id="2"><reasoning>Chunk one says otherwise</reasoning>invalid</verdict>'
+    ))
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", True)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="test.txt")
+    state["extracted_facts"] = [
+        make_fact("Fact A", "Chunk one"),
+        make_fact("Fact B", "Chunk one"),
+        make_fact("Fact C", "Chunk one"),
+        make_fact("Fact D", "Chunk two"),
+    ]
+
+    result = await nodes.validator_node(state)
+
+    # Batch for chunk one, fallback for fact C (no verdict), single for chunk two
+    assert len(llm.calls) == 3
+    assert [f["verification_status"] for f in result["extracted_facts"]] == [
+        "verified", "rejected", "verified", "verified"
+    ]
+    assert result["extracted_facts"][1]["verification_reason"] == "Chunk one says otherwise"
+
+@pytest.mark.asyncio
+async def test_validator_reverifies_verdicts_without_reasoning(monkeypatch):
+    """Test that batch verdicts without a reasoning go through the single-fact prompt."""
+    llm = FakeChatLLM(batch_verification='<verdict id="1">invalid</verdict>\n<verdict id="2"><reasoning>Stated</reasoning>valid</verdict>')
+    monkeypatch.setattr(nodes, "llm", llm)
+    monkeypatch.setattr(nodes, "llm_cache", None)
+    monkeypatch.setattr(nodes, "BATCH_VERIFICATION", True)
+    monkeypatch.setattr(nodes, "chunk_repo", MagicMock())
+    monkeypatch.setattr(nodes, "fact_repo", MagicMock(**{"has_fact.return_value": False}))
+    monkeypatch.setattr(nodes, "rejected_fact_repo", MagicMock())
+
+    state = create_initial_state(input_text="", document_name="test.txt")
+    state["extracted_facts"] = [make_fact("Fact A", "Chunk one"), make_fact("Fact B", "Chunk one")]
+
+    result = await nodes.validator_node(state)
+
+    # Batch request, then a single request for fact A
+    assert len(llm.calls) == 2
+    assert [f["verification_reason"] for f in result["extracted_facts"]] == ["Stated in the text", "Stated"]
@@ -0,0 +1,135 @@
+"""
+Test script for batched fact verification with a scripted LLM.
+"""
+
+import os
+import sys
+import pytest
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.agents.verification import FactVerificationAgent
+from src.tests.mocks import FakeChatLLM
+
+def make_llm(batch_verification: str = "", verification: str = "<reasoning>Matches the text</reasoning><is_valid>true</is_valid>") -> FakeChatLLM:
+    """Create an LLM stand-in with scripted batch and single-fact verification output."""
+    return FakeChatLLM(verification=verification, batch_verification=batch_verification)
+
+@pytest.mark.asyncio
+async def test_batch_verifies_facts_of_one_chunk_in_one_call():
+    """Test that facts sharing an original text are verified with one LLM call."""
+    llm = make_llm('<verdict id="1"><reasoning>10 units</reasoning>valid</verdict>\n<verdict id="2"><reasoning>Not 20</reasoning>invalid</verdict>')
+    agent = FactVerificationAgent(llm=llm)
+
+    results = await agent.verify_facts_batch([("Fact A has 10 units", "Chunk: 10, 20 and 30 units"), ("Fact B has 20 units", "Chunk: 10, 20 and 30 units")])
+
+    assert len(llm.calls) == 1
+    assert [r.verification_status for r in results] == ["verified", "rejected"]
+    assert [r.reason for r in results] == ["10 units", "Not 20"]
+
+@pytest.mark.asyncio
+async def test_missing_verdicts_fall_back_to_single_prompt():
+    """Test that facts without a verdict and single facts use the single-fact prompt."""
+    llm = make_llm('<verdict id="1"><reasoning>Not 10</reasoning>invalid</verdict>')
+    agent = FactVerificationAgent(llm=llm)
+
+    results = await agent.verify_facts_batch([
+        ("Fact A has 10 units", "Chunk one: 10, 20 and 30 units"),
+        ("Fact B has 20 units", "Chunk one: 10, 20 and 30 units"),
+        ("Fact C has 30 units", "Chunk two: 10, 20 and 30 units")
+    ])
+
+    # One batch call for chunk 1, single calls for fact B and fact C
+    assert len(llm.calls) == 3
+    assert [r.is_valid for r in results] == [False, True, True]
+    assert results[0].reason == "Not 10"
+    assert results[1].reason == "Matches the text"
+
+@pytest.mark.asyncio
+async def test_verify_fact_uses_single_prompt():
+    """Test that verify_fact goes through the single-fact path."""
+    llm = make_llm("")
+    agent = FactVerificationAgent(llm=llm)
+
+    result = await agent.verify_fact("Fact A has 10 units", "Chunk: 10, 20 and 30 units", document_name="Doc")
+
+    assert result.verification_status == "verified"
+    assert "Submitted fact: Fact A has 10 units" in llm.calls[0][-1].content
+
+@pytest.mark.asyncio
+async def test_verify_many_keeps_input_order():
+    """Test that concurrent verification returns results in input order."""
+    llm = make_llm('<verdict id="1"><reasoning>Not 10</reasoning>invalid</verdict>\n<verdict id="2"><reasoning>20 units</reasoning>valid</verdict>')
+    agent = FactVerificationAgent(llm=llm)
+
+    results = await agent.verify_many(
+        [("Fact A has 10 units", "Chunk one: 10, 20 and 30 units"), ("Fact C has 30 units", "Chunk two: 10, 20 and 30 units"), ("Fact B has 20 units", "Chunk one: 10, 20 and 30 units")],
+        concurrency=2
+    )
+
+    # One batch call for chunk 1 and one single call for chunk 2
+    assert len(llm.calls) == 2
+    assert [r.is_valid for r in results] == [False, True, True]
+
+@pytest.mark.asyncio
+async def test_repeated_pairs_hit_the_cache():
+    """Test that a (fact, original text) pair is only sent to the LLM once."""
+    llm = make_llm("")
+    agent = FactVerificationAgent(llm=llm)
+
+    first = await agent.verify_fact("Fact A has 10 units", "Chunk: 10, 20 and 30 units", document_name="Doc")
+    second = await agent.verify_fact("Fact A has 10 units", "Chunk: 10, 20 and 30 units", document_name="Doc")
+    await agent.verify_fact("Fact A has 10 units", "Other chunk: 10 units", document_name="Doc")
+
+    assert len(llm.calls) == 2
+    assert second == first
+
+def test_verification_result_is_immutable():
+    """Test that cached verification results cannot be modified."""
+    from dataclasses import FrozenInstanceError
+    from src.agents.verification import VerificationResult
+
+    result = VerificationResult(is_valid=True, reason="ok", verification_status="verified")
+    with pytest.raises(FrozenInstanceError):
+        result.is_valid = False
+
+@pytest.mark.asyncio
+async def test_prefilter_rejects_without_llm_call():
+    """Test that facts without numbers, or with numbers not in the original, skip the LLM."""
+    llm = make_llm("")
+    agent = FactVerificationAgent(llm=llm)
+
+    results = await agent.verify_facts_batch([
+        ("Cloud adoption continues to grow", "Cloud adoption continues to grow"),
+        ("Company X had 25% revenue growth", "Revenue was $100M in Q1, up from $80M in Q4"),
+        ("The chip has 1,284 points", "The chip scored 1284 points")
+    ])
+
+    assert len(llm.calls) == 1
+    assert [r.verification_status for r in results] == ["rejected", "rejected", "verified"]
+    assert "25" in results[1].reason
+
+@pytest.mark.asyncio
+async def test_streaming_stops_after_complete_verdict():
+    """Test that streaming stops once the verdict is complete."""
+    llm = make_llm(verification="<reasoning>ok</reasoning><is_valid>false</is_valid>" + " trailing" * 50)
+    agent = FactVerificationAgent(llm=llm)
+
+    result = await agent.verify_fact("Fact A has 10 units", "Chunk: 10 units", document_name="Doc")
+
+    assert result.verification_status == "rejected"
+    assert llm.streamed < 10
+
+@pytest.mark.asyncio
+async def test_duplicate_facts_are_verified_once():
+    """Test that identical pairs in one call share a single verification."""
+    llm = make_llm("")
+    agent = FactVerificationAgent(llm=llm)
+
+    item = ("Fact A has 10 units", "Chunk: 10 units")
+    results = await agent.verify_many([item, item, item])
+
+    assert len(llm.calls) == 1
+    assert len(results) == 3
+    assert results[0] is results[1] is results[2]
@@ -0,0 +1,78 @@
+"""
+Test script for parsing fact verification output.
+"""
+
+import os
+import sys
+import pytest
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.agents.verification import _parse_verification_output
+
+def test_parse_xml_output():
+    """Test parsing the documented XML response format."""
+    result = _parse_verification_output(
+        "<reasoning>All metrics preserved</reasoning>\n<is_valid>true</is_valid>"
+    )
+    assert result == {
+        "is_valid": True,
+        "reason": "All metrics preserved",
+        "verification_status": "verified"
+    }
+
+@pytest.mark.parametrize("output", [
+    '{"is_valid": false, "reason": "Missing units"}',
+    '  {"is_valid": false, "reason": "Missing units"}\n',
+    'Here you go:\n```json\n{"is_valid": false, "reason": "Missing units"}\n```',
+])
+def test_parse_json_output(output):
+    """Test parsing bare and fenced JSON responses."""
+    result = _parse_verification_output(output)
+    assert result["is_valid"] is False
+    assert result["reason"] == "Missing units"
+    assert result["verification_status"] == "rejected"
+
+def test_parse_free_form_output():
+    """Test the keyword fallback for free-form responses."""
+    result = _parse_verification_output("The fact is invalid.\nReason: no metrics")
+    assert result["is_valid"] is False
+    assert result["reason"] == "no metrics"
+
+def test_parse_json_embedded_in_prose():
+    """Test finding a nested JSON object inside free-form text."""
+    output = (
+        'Analysis {draft} done. Result: {"is_valid": true, "reason": "Uses \\"}\\" safely", '
+        '"details": {"metrics": 2}} Thanks!'
+    )
+    result = _parse_verification_output(output)
+    assert result["is_valid"] is True
+    assert result["reason"] == 'Uses "}" safely'
+
+def test_parse_json_string_booleans():
+    """Test that string booleans in JSON output are normalized."""
+    result = _parse_verification_output('{"is_valid": "false", "reason": 42}')
+    assert result == {"is_valid": False, "reason": "42", "verification_status": "rejected"}
+
+@pytest.mark.parametrize("output, expected", [
+    ("The statement is valid and correct.", True),
+    ("This looks valid at first, but it is not supported by the text.", False),
+    ("INVALID", False),
+    ("No verdict keywords here.", False),
+])
+def test_free_form_keywords(output, expected):
+    """Test that negative keywords anywhere override positive ones."""
+    assert _parse_verification_output(output)["is_valid"] is expected
+
+def test_free_form_skips_json_decode(monkeypatch):
+    """Test that output without the "is_valid" key never reaches the JSON decoder."""
+    from src.agents import verification
+
+    def fail_loads(_):
+        raise AssertionError("JSON decode attempted")
+
+    monkeypatch.setattr(verification, "_json_loads", fail_loads)
+    result = _parse_verification_output("{valid} - Reason: matches the text")
+    assert result["is_valid"] is True
+    assert result["reason"] == "matches the text"
@@ -0,0 +1,70 @@
+"""
+Test script to verify the optional vLLM backend against a stand-in engine.
+"""
+
+import os
+import sys
+import types
+import pytest
+from langchain_core.messages import HumanMessage, SystemMessage
+
+# Ensure the src directory is in the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.vllm_backend import VLLMChatBackend
+
+class FakeTokenizer:
+    """Tokenizer stand-in that renders the chat as role: content lines."""
+
+    def apply_chat_template(self, chat, tokenize, add_generation_prompt):
+        return "\n".join(f"{m['role']}: {m['content']}" for m in chat) + "\nassistant:"
+
+class FakeEngine:
+    """AsyncLLMEngine stand-in that reports cumulative text like vLLM."""
+
+    def __init__(self):
+        self.prompts = []
+
+    @classmethod
+    def from_engine_args(cls, args):
+        return cls()
+
+    async def get_tokenizer(self):
+        return FakeTokenizer()
+
+    async def generate(self, prompt, sampling_params, request_id):
+        self.prompts.append(prompt)
+        text = ""
+        for piece in ["<fact>Revenue ", "grew 12%", "</fact>"]:
+            text += piece
+            yield types.SimpleNamespace(outputs=[types.SimpleNamespace(text=text)])
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Create the backend with a stand-in vllm module."""
+    vllm = types.ModuleType("vllm")
+    vllm.AsyncEngineArgs = lambda **kwargs: kwargs
+    vllm.AsyncLLMEngine = FakeEngine
+    vllm.SamplingParams = lambda **kwargs: kwargs
+    monkeypatch.setitem(sys.modules, "vllm", vllm)
+    return VLLMChatBackend("google/gemma-3-4b-it", temperature=0.1, max_tokens=256)
+
+@pytest.mark.asyncio
+async def test_vllm_backend_streams_deltas(backend):
+    """Test that astream yields only the new text of each engine step."""
+    chunks = [chunk.content async for chunk in backend.astream([HumanMessage(content="Text")])]
+    assert chunks == ["<fact>Revenue ", "grew 12%", "</fact>"]
+
+@pytest.mark.asyncio
+async def test_vllm_backend_ainvoke_uses_chat_template(backend):
+    """Test that ainvoke renders the chat roles and returns the full response."""
+    response = await backend.ainvoke([SystemMessage(content="Extract facts"), HumanMessage(content="Text")])
+    assert response.content == "<fact>Revenue grew 12%</fact>"
+    assert backend.engine.prompts == ["system: Extract facts\nuser: Text\nassistant:"]
+    assert backend.sampling_params == {"temperature": 0.1, "max_tokens": 256}
+
+def test_vllm_backend_requires_vllm(monkeypatch):
+    """Test that a missing vllm package gives a clear ImportError."""
+    monkeypatch.setitem(sys.modules, "vllm", None)
+    with pytest.raises(ImportError, match="LLM_BACKEND=vllm"):
+        VLLMChatBackend("google/gemma-3-4b-it", temperature=0.1, max_tokens=256)
@@ -2,12 +2,12 @@
 Document loader utility for processing various document types.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from src.fact_extract.utils.document_processors import DocumentProcessorFactory
+from src.utils.document_processors import DocumentProcessorFactory
 
 logger = logging.getLogger(__name__)
 
@@ -54,34 +54,31 @@ class DocumentLoader:
     ) -> List[Dict[str, str]]:
         """Process multiple documents in parallel.
         
+        Each document is parsed in a worker thread (asyncio.to_thread), with at
+        most max_workers documents in flight, so the event loop is never
+        blocked while the parsers run.
+        
         Args:
             file_paths: List of paths to documents
             max_workers: Maximum number of parallel workers
             
         Returns:
-            List of dictionaries containing extracted content
+            List of dictionaries containing extracted content, in input order
         """
-        results = []
+        semaphore = asyncio.Semaphore(max_workers)
         
-        # Convert all paths to Path objects
-        paths = [Path(p) for p in file_paths]
-        
-        # Process files in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_path = {
-                executor.submit(self.process_document, path): path
-                for path in paths
-            }
-            
-            # Process results as they complete
-            for future in as_completed(future_to_path):
-                path = future_to_path[future]
+        async def load_one(path: Path) -> List[Dict[str, str]]:
+            async with semaphore:
                 try:
-                    result = future.result()
-                    if result:
-                        results.extend(result)
+                    return await asyncio.to_thread(self.process_document, path)
                 except Exception as e:
                     logger.error(f"Error processing {path}: {str(e)}")
-                    
-        return results 
\ No newline at end of file
+                    return []
+        
+        # Convert all paths to Path objects and load them concurrently
+        tasks = [asyncio.create_task(load_one(Path(p))) for p in file_paths]
+        
+        results = []
+        for result in await asyncio.gather(*tasks):
+            results.extend(result)
+        return results
@@ -0,0 +1,109 @@
+"""
+Optional in-process vLLM backend for self-hosted deployments.
+
+Selected with LLM_BACKEND=vllm. Instead of sending one HTTP request per
+prompt to an OpenAI-compatible server, prompts are submitted straight to a
+vLLM AsyncLLMEngine, which continuously batches every request in flight, so
+the concurrent extraction and verification calls fanned out by the graph
+nodes share GPU batches.
+
+The backend exposes the ainvoke()/astream() subset of the LangChain chat
+model interface that the nodes use, so it is a drop-in replacement for the
+ChatOpenAI instance from src/llm_config.py. vllm itself is an optional
+dependency and is only imported when this backend is created.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Union
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+
+logger = logging.getLogger(__name__)
+
+# LangChain message types mapped to chat template roles
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+class VLLMChatBackend:
+    """Chat model backed by an in-process vLLM AsyncLLMEngine."""
+
+    def __init__(self, model: str, temperature: float, max_tokens: int, **engine_kwargs: Any):
+        """
+        Start the vLLM engine for a model.
+
+        Args:
+            model: Hugging Face model name or local path
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens generated per request
+            **engine_kwargs: Extra AsyncEngineArgs settings, e.g. gpu_memory_utilization
+        """
+        try:
+            from vllm import AsyncEngineArgs, AsyncLLMEngine, SamplingParams
+        except ImportError as e:
+            raise ImportError(
+                "LLM_BACKEND=vllm requires the optional vllm package (pip install vllm)"
+            ) from e
+
+        self.model_name = model
+        self.sampling_params = SamplingParams(temperature=temperature, max_tokens=max_tokens)
+        self.engine = AsyncLLMEngine.from_engine_args(AsyncEngineArgs(model=model, **engine_kwargs))
+        self._tokenizer = None
+        logger.info(f"Started vLLM engine with model: {model}")
+
+    async def _render(self, messages: Union[str, List[BaseMessage]]) -> str:
+        """
+        Render chat messages into a prompt with the model's chat template.
+
+        Args:
+            messages: Chat messages, or a plain prompt string
+
+        Returns:
+            Prompt text
+        """
+        if isinstance(messages, str):
+            messages = [("human", messages)]
+        if self._tokenizer is None:
+            self._tokenizer = await self.engine.get_tokenizer()
+        chat: List[Dict[str, str]] = [
+            {"role": _ROLES.get(message[0], "user"), "content": message[1]}
+            if isinstance(message, tuple)
+            else {"role": _ROLES.get(message.type, "user"), "content": message.content}
+            for message in messages
+        ]
+        return self._tokenizer.apply_chat_template(chat, tokenize=False, add_generation_prompt=True)
+
+    async def astream(self, messages: Union[str, List[BaseMessage]]) -> AsyncIterator[AIMessageChunk]:
+        """
+        Stream the response to chat messages.
+
+        The engine reports the cumulative text after each step; only the new
+        part is yielded, like a streaming chat model.
+
+        Args:
+            messages: Chat messages, or a plain prompt string
+
+        Yields:
+            Response chunks
+        """
+        prompt = await self._render(messages)
+        sent = 0
+        async for output in self.engine.generate(prompt, self.sampling_params, str(uuid4())):
+            text = output.outputs[0].text
+            if len(text) > sent:
+                yield AIMessageChunk(content=text[sent:])
+                sent = len(text)
+
+    async def ainvoke(self, messages: Union[str, List[BaseMessage]]) -> AIMessage:
+        """
+        Get the complete response to chat messages.
+
+        Args:
+            messages: Chat messages, or a plain prompt string
+
+        Returns:
+            Response message
+        """
+        parts = [chunk.content async for chunk in self.astream(messages)]
+        return AIMessage(content="".join(parts))
+